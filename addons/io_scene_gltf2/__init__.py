@@ -240,6 +240,15 @@ class ExportGLTF2_Base:
         default=False
     )
 
+    export_float_precision = IntProperty(
+        name='Float Precision',
+        description='Significant digits of the floats written in the JSON (0 = shortest exact form). '
+                    'Fewer digits give smaller files, with less precise values',
+        default=0,
+        min=0,
+        max=17
+    )
+
     export_animations = BoolProperty(
         name='Animations',
         description='Exports active actions and NLA tracks as glTF animations',
@@ -284,6 +293,19 @@ class ExportGLTF2_Base:
         default=False
     )
 
+    export_dedup_content = BoolProperty(
+        name='Merge Equal Data',
+        description='Export equal accessors, meshes, materials, textures, samplers and cameras only once',
+        default=False
+    )
+
+    export_cache_statistics = BoolProperty(
+        name='Cache Statistics',
+        description='Print the hits, time and memory of the export caches to the console (slower)',
+        default=False,
+        options={'HIDDEN'}
+    )
+
     export_skins = BoolProperty(
         name='Skinning',
         description='Export skinning (armature) data',
@@ -426,6 +448,12 @@ class ExportGLTF2_Base:
         export_settings['gltf_yup'] = self.export_yup
         export_settings['gltf_apply'] = self.export_apply
         export_settings['gltf_current_frame'] = self.export_current_frame
+        export_settings['gltf_dedup_content'] = self.export_dedup_content
+        export_settings['gltf_cache_statistics'] = self.export_cache_statistics
+        if self.export_float_precision > 0:
+            export_settings['gltf_float_precision'] = self.export_float_precision
+        else:
+            export_settings['gltf_float_precision'] = None
         export_settings['gltf_animations'] = self.export_animations
         if self.export_animations:
             export_settings['gltf_frame_range'] = self.export_frame_range
@@ -504,6 +532,7 @@ class ExportGLTF2_Base:
             col.prop(self, 'export_apply')
             col.prop(self, 'export_yup')
             col.prop(self, 'export_extras')
+            col.prop(self, 'export_float_precision')
             col.prop(self, 'will_save_settings')
             col.prop(self, 'export_copyright')
 
@@ -517,6 +546,7 @@ class ExportGLTF2_Base:
             col.prop(self, 'export_materials')
             if self.export_materials:
                 col.prop(self, 'export_image_format')
+            col.prop(self, 'export_dedup_content')
 
             # Add Draco compression option only if the DLL could be found.
             if self.is_draco_available:
@@ -584,6 +614,7 @@ class GLTF_PT_export_main(bpy.types.Panel):
         if operator.export_format == 'GLTF_SEPARATE':
             layout.prop(operator, 'export_texture_dir', icon='FILE_FOLDER')
         layout.prop(operator, 'export_copyright')
+        layout.prop(operator, 'export_float_precision')
         layout.prop(operator, 'will_save_settings')
 
 
@@ -673,6 +704,7 @@ class GLTF_PT_export_geometry(bpy.types.Panel):
         col = layout.column()
         col.active = operator.export_materials
         col.prop(operator, 'export_image_format')
+        layout.prop(operator, 'export_dedup_content')
 
 
 class GLTF_PT_export_geometry_compression(bpy.types.Panel):
@@ -909,11 +941,49 @@ class ImportGLTF2(Operator, ImportHelper):
         description="How normals are computed during import",
         default="NORMALS")
 
+    import_accessor_cache_size = IntProperty(
+        name='Accessor cache size',
+        description='Memory budget (in MiB) for decoded accessor data reused across meshes and animations',
+        default=512,
+        min=0
+    )
+
+    import_mmap = BoolProperty(
+        name='Memory-map files',
+        description='Map .glb and .bin files in memory instead of reading them whole (lowers memory usage on big files)',
+        default=False
+    )
+
+    import_strict_parsing = BoolProperty(
+        name='Strict parsing',
+        description='Check the type of every glTF property while reading the file (slower, for debugging broken files)',
+        default=False
+    )
+
+    import_prefetch_threads = IntProperty(
+        name='Prefetch threads',
+        description='Number of threads reading buffer and image files ahead of their use (0 to disable)',
+        default=4,
+        min=0
+    )
+
+    import_lazy_document = BoolProperty(
+        name='Lazy document',
+        description='Read glTF properties only when they are used (faster start on huge files, '
+                    'when only part of them is imported). Nodes, skins and animations are always read',
+        default=False
+    )
+
     def draw(self, context):
         layout = self.layout
 
         layout.prop(self, 'import_pack_images')
         layout.prop(self, 'import_shading')
+        layout.prop(self, 'import_mmap')
+        layout.prop(self, 'import_lazy_document')
+        layout.prop(self, 'import_strict_parsing')
+        layout.prop(self, 'import_prefetch_threads')
+        layout.prop(self, 'import_accessor_cache_size')
 
     def execute(self, context):
         return self.import_gltf2(context)
@@ -943,20 +1013,25 @@ class ImportGLTF2(Operator, ImportHelper):
         from .blender.imp.gltf2_blender_gltf import BlenderGlTF
 
         self.gltf_importer = glTFImporter(filename, import_settings)
-        success, txt = self.gltf_importer.read()
-        if not success:
-            self.report({'ERROR'}, txt)
-            return {'CANCELLED'}
-        success, txt = self.gltf_importer.checks()
-        if not success:
-            self.report({'ERROR'}, txt)
-            return {'CANCELLED'}
-        self.gltf_importer.log.critical("Data are loaded, start creating Blender stuff")
-        start_time = time.time()
-        BlenderGlTF.create(self.gltf_importer)
-        elapsed_s = "{:.2f}s".format(time.time() - start_time)
-        self.gltf_importer.log.critical("glTF import finished in " + elapsed_s)
-        self.gltf_importer.log.removeHandler(self.gltf_importer.log_handler)
+        try:
+            success, txt = self.gltf_importer.read()
+            if not success:
+                self.report({'ERROR'}, txt)
+                return {'CANCELLED'}
+            success, txt = self.gltf_importer.checks()
+            if not success:
+                self.report({'ERROR'}, txt)
+                return {'CANCELLED'}
+            self.gltf_importer.prefetch()
+            self.gltf_importer.log.critical("Data are loaded, start creating Blender stuff")
+            start_time = time.time()
+            BlenderGlTF.create(self.gltf_importer)
+            elapsed_s = "{:.2f}s".format(time.time() - start_time)
+            self.gltf_importer.log.critical("glTF import finished in " + elapsed_s)
+        finally:
+            # Release the file mappings and the log handler, even if the import failed
+            self.gltf_importer.log.removeHandler(self.gltf_importer.log_handler)
+            self.gltf_importer.close()
 
         return {'FINISHED'}
 
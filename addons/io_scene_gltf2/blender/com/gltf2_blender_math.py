@@ -15,6 +15,7 @@
 import bpy
 import typing
 import math
+import numpy as np
 from mathutils import Matrix, Vector, Quaternion, Euler
 
 from io_scene_gltf2.blender.com.gltf2_blender_data_path import get_target_property_name
@@ -173,3 +174,159 @@ def transform_value(value: Vector, _: Matrix = Matrix.Identity(4)) -> Vector:
 def round_if_near(value: float, target: float) -> float:
     """If value is very close to target, round to target."""
     return value if abs(value - target) > 2.0e-6 else target
+
+
+# Batched versions of the conversions above, for (keyframes, components) arrays of values of an animated property.
+
+ROTATION_PROPERTIES = ["delta_rotation_euler", "rotation_axis_angle", "rotation_euler", "rotation_quaternion"]
+
+
+def is_rotation(data_path: str) -> bool:
+    return get_target_property_name(data_path) in ROTATION_PROPERTIES
+
+
+def transform_array(values: np.ndarray, data_path: str, transform: Matrix = Matrix.Identity(4)) -> np.ndarray:
+    """
+    Transform rows of values of a blender property, like list_to_mathutils followed by transform.
+
+    Rotations are returned as w first quaternions.
+    """
+    target = get_target_property_name(data_path)
+    # Rows are read from a copy, as they can not be accessed on frozen matrices
+    matrix = np.array([tuple(row) for row in transform.copy()], dtype=np.float64)
+
+    if target in ["delta_location", "location"]:
+        return values @ matrix[:3, :3].T + matrix[:3, 3]
+    elif target in ROTATION_PROPERTIES:
+        quaternions = normalize_quaternions(to_quaternions(values, target))
+        return matrices_to_quaternions(matrix[:3, :3] @ quaternions_to_matrices(quaternions))
+    elif target == "scale":
+        # Like Matrix.to_scale, the scales are the lengths of the axes, all negated for negative determinants
+        scales = np.abs(values) * np.linalg.norm(matrix[:3, :3], axis=0)
+        negative = np.linalg.det(matrix[:3, :3]) * np.prod(values, axis=1) < 0.0
+        scales[negative] *= -1.0
+        return scales
+    elif target == "value":
+        return values
+
+    raise RuntimeError("Cannot transform values at {}".format(data_path))
+
+
+def swizzle_yup_array(values: np.ndarray, data_path: str) -> np.ndarray:
+    """Manage Yup, for rows of values returned by transform_array."""
+    target = get_target_property_name(data_path)
+    if target in ["delta_location", "location"]:
+        return np.stack((values[:, 0], values[:, 2], -values[:, 1]), axis=1)
+    elif target in ROTATION_PROPERTIES:
+        return np.stack((values[:, 0], values[:, 1], values[:, 3], -values[:, 2]), axis=1)
+    elif target == "scale":
+        return values[:, [0, 2, 1]]
+    elif target == "value":
+        return values
+
+    raise RuntimeError("Cannot transform values at {}".format(data_path))
+
+
+def array_to_gltf(values: np.ndarray, data_path: str) -> np.ndarray:
+    """Transform rows of values returned by transform_array to glTF order."""
+    if is_rotation(data_path):
+        # Blender has w-first quaternion notation
+        return values[:, [1, 2, 3, 0]]
+    return values
+
+
+def to_quaternions(values: np.ndarray, target: str) -> np.ndarray:
+    """Convert rows of rotations to w first quaternions."""
+    if target in ["delta_rotation_euler", "rotation_euler"]:
+        # Like Euler.to_quaternion, with the default XYZ order
+        half = values * 0.5
+        ci, cj, ch = np.cos(half).T
+        si, sj, sh = np.sin(half).T
+        cc, cs, sc, ss = ci * ch, ci * sh, si * ch, si * sh
+        return np.stack((cj * cc + sj * ss, cj * sc - sj * cs, cj * ss + sj * cc, cj * cs - sj * sc), axis=1)
+    elif target == "rotation_axis_angle":
+        # Like Quaternion(axis, math.radians(angle))
+        half_angles = np.radians(values[:, 0]) * 0.5
+        lengths = np.linalg.norm(values[:, 1:], axis=1)
+        valid = lengths != 0.0
+        axes = values[:, 1:] / np.where(valid, lengths, 1.0)[:, np.newaxis]
+        quaternions = np.concatenate((np.cos(half_angles)[:, np.newaxis],
+                                      axes * np.sin(half_angles)[:, np.newaxis]), axis=1)
+        quaternions[~valid] = (1.0, 0.0, 0.0, 0.0)
+        return quaternions
+    return values
+
+
+def normalize_quaternions(quaternions: np.ndarray) -> np.ndarray:
+    """Normalize rows of quaternions, null quaternions becoming (0, 1, 0, 0) like with Quaternion.normalize."""
+    lengths = np.linalg.norm(quaternions, axis=1)
+    valid = lengths != 0.0
+    quaternions = quaternions / np.where(valid, lengths, 1.0)[:, np.newaxis]
+    quaternions[~valid] = (0.0, 1.0, 0.0, 0.0)
+    return quaternions
+
+
+def quaternions_to_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """Convert rows of normalized w first quaternions to (keyframes, 3, 3) rotation matrices."""
+    w, x, y, z = quaternions.T
+    return np.stack((
+        np.stack((1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y)), axis=1),
+        np.stack((2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x)), axis=1),
+        np.stack((2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y)), axis=1),
+    ), axis=1)
+
+
+def matrices_to_quaternions(matrices: np.ndarray) -> np.ndarray:
+    """Convert (keyframes, 3, 3) matrices to rows of w first quaternions, ignoring their scale like Matrix.to_quaternion."""
+    lengths = np.linalg.norm(matrices, axis=1)
+    m = matrices / np.where(lengths != 0.0, lengths, 1.0)[:, np.newaxis, :]
+    m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+    quaternions = np.empty((len(m), 4), dtype=np.float64)
+
+    # Use the largest of the diagonal terms, for numerical stability
+    trace = 0.25 * (1.0 + m00 + m11 + m22)
+    use_w = trace > 1e-4
+    use_x = ~use_w & (m00 > m11) & (m00 > m22)
+    use_y = ~use_w & ~use_x & (m11 > m22)
+    use_z = ~use_w & ~use_x & ~use_y
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.sqrt(trace)
+        quaternions[use_w] = np.stack((
+            s,
+            (m[:, 2, 1] - m[:, 1, 2]) / (4.0 * s),
+            (m[:, 0, 2] - m[:, 2, 0]) / (4.0 * s),
+            (m[:, 1, 0] - m[:, 0, 1]) / (4.0 * s)), axis=1)[use_w]
+        s = 2.0 * np.sqrt(1.0 + m00 - m11 - m22)
+        quaternions[use_x] = np.stack((
+            (m[:, 2, 1] - m[:, 1, 2]) / s,
+            0.25 * s,
+            (m[:, 0, 1] + m[:, 1, 0]) / s,
+            (m[:, 0, 2] + m[:, 2, 0]) / s), axis=1)[use_x]
+        s = 2.0 * np.sqrt(1.0 + m11 - m00 - m22)
+        quaternions[use_y] = np.stack((
+            (m[:, 0, 2] - m[:, 2, 0]) / s,
+            (m[:, 0, 1] + m[:, 1, 0]) / s,
+            0.25 * s,
+            (m[:, 1, 2] + m[:, 2, 1]) / s), axis=1)[use_y]
+        s = 2.0 * np.sqrt(1.0 + m22 - m00 - m11)
+        quaternions[use_z] = np.stack((
+            (m[:, 1, 0] - m[:, 0, 1]) / s,
+            (m[:, 0, 2] + m[:, 2, 0]) / s,
+            (m[:, 1, 2] + m[:, 2, 1]) / s,
+            0.25 * s), axis=1)[use_z]
+
+    return normalize_quaternions(quaternions)
+
+
+def make_quaternions_continuous(quaternions: np.ndarray) -> np.ndarray:
+    """Negate quaternions so that each one is in the same hemisphere as the previous one, for interpolation."""
+    flips = np.sum(quaternions[1:] * quaternions[:-1], axis=1) < 0.0
+    signs = np.where(np.cumsum(flips) % 2 == 1, -1.0, 1.0)
+    return quaternions * np.concatenate(([1.0], signs))[:, np.newaxis]
+
+
+def align_quaternions(quaternions: np.ndarray, references: np.ndarray) -> np.ndarray:
+    """Negate quaternions which are not in the same hemisphere as the reference quaternion of their row."""
+    signs = np.where(np.sum(quaternions * references, axis=1) < 0.0, -1.0, 1.0)
+    return quaternions * signs[:, np.newaxis]
@@ -0,0 +1,211 @@
+# Copyright 2018-2019 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bpy
+import typing
+
+from io_scene_gltf2.io.com.gltf2_io_debug import print_console
+from io_scene_gltf2.blender.exp import gltf2_blender_export_keys
+from io_scene_gltf2.blender.exp import gltf2_blender_gather_animations
+from io_scene_gltf2.blender.exp import gltf2_blender_gather_animation_channels
+from io_scene_gltf2.blender.exp import gltf2_blender_gather_animation_sampler_keyframes
+from io_scene_gltf2.blender.exp.gltf2_blender_gather_drivers import get_sk_drivers
+
+
+class BakeJob:
+    """An armature action to bake, and the frames to sample."""
+
+    def __init__(self, blender_object: bpy.types.Object, blender_action: bpy.types.Action, frames: typing.List[float]):
+        self.blender_object = blender_object
+        self.blender_action = blender_action
+        self.frames = frames
+        self.data = {}
+
+
+def bake_armatures(blender_objects: typing.List[bpy.types.Object], export_settings):
+    """
+    Bake the sampled animations of all armatures, before gathering the animations.
+
+    Evaluating the scene at a frame evaluates all its objects, so instead of sweeping the timeline for each armature
+    action, the i-th actions of all armatures are assigned together and sampled in a single sweep. Armatures whose
+    pose depends, directly or through other objects, on another baked armature are swept on their own, with the
+    other armatures in their current state, as when baking them one by one.
+    The results are stored in the caches of get_bone_matrix and get_sk_driver_values, and the channels of the baked
+    actions are gathered right after each sweep, which releases their bone matrices: the matrices of a single sweep
+    are held at a time.
+    Object and shape key channels are sampled from their fcurves, and need no scene evaluation.
+
+    :param blender_objects: the exported objects of the scene
+    :param export_settings:
+    """
+    # Bones are only baked for all actions when sampling is forced, otherwise on demand for channels needing it
+    if not export_settings[gltf2_blender_export_keys.FORCE_SAMPLING]:
+        return
+
+    step = export_settings['gltf_frame_step']
+    jobs = {}
+    for blender_object in blender_objects:
+        if blender_object.type != "ARMATURE" or blender_object.animation_data is None:
+            continue
+        if blender_object.animation_data.is_property_readonly('action'):
+            # NLA stuff: actions are baked on demand, and the gathering reports the error
+            continue
+        jobs[blender_object] = __gather_jobs(blender_object, step, export_settings)
+
+    independent_jobs = []
+    for blender_object, object_jobs in jobs.items():
+        if __get_dependencies(blender_object).isdisjoint(jobs.keys()):
+            independent_jobs.append(object_jobs)
+        else:
+            for job in object_jobs:
+                __gather_channels(__bake([job]), export_settings)
+
+    sweep = 0
+    while True:
+        round_jobs = [object_jobs[sweep] for object_jobs in independent_jobs if sweep < len(object_jobs)]
+        if not round_jobs:
+            break
+        __gather_channels(__bake(round_jobs), export_settings)
+        sweep += 1
+
+
+def __gather_jobs(blender_object: bpy.types.Object, step: int, export_settings) -> typing.List[BakeJob]:
+    jobs = []
+    for blender_action, _track_name in gltf2_blender_gather_animations.get_blender_actions(blender_object,
+                                                                                           export_settings):
+        if blender_action.id_root != "OBJECT":
+            continue
+        if not gltf2_blender_gather_animations.filter_animation(blender_action, blender_object, export_settings):
+            continue
+        bake_range_start, bake_range_end = gltf2_blender_gather_animation_channels.get_bake_range(
+            blender_action, blender_object, export_settings)
+        if bake_range_start is None:
+            continue
+        frames = gltf2_blender_gather_animation_sampler_keyframes.get_bake_frames(bake_range_start,
+                                                                                  bake_range_end,
+                                                                                  step)
+        jobs.append(BakeJob(blender_object, blender_action, frames))
+    return jobs
+
+
+def __get_dependencies(blender_object: bpy.types.Object) -> typing.Set[bpy.types.Object]:
+    """
+    Objects the pose of the armature may depend on, directly or through other objects.
+
+    These are the parents, constraint targets and driver targets of the armature, of its bones and of the objects
+    it depends on, and the targets of the drivers of the shape keys driven by the armature.
+    """
+    dependencies = set()
+    stack = __get_direct_dependencies(blender_object)
+    for _child, fcurves in get_sk_drivers(blender_object):
+        stack.extend(__get_driver_targets([fcurve for fcurve in fcurves if fcurve is not None]))
+
+    while stack:
+        dependency = stack.pop()
+        if dependency == blender_object or dependency in dependencies:
+            continue
+        dependencies.add(dependency)
+        stack.extend(__get_direct_dependencies(dependency))
+    return dependencies
+
+
+def __get_direct_dependencies(blender_object: bpy.types.Object) -> typing.List[bpy.types.Object]:
+    """Parent, constraint targets and driver targets of an object, and of its bones."""
+    dependencies = []
+    if blender_object.parent is not None:
+        dependencies.append(blender_object.parent)
+
+    constraints = list(blender_object.constraints)
+    if blender_object.type == "ARMATURE" and blender_object.pose is not None:
+        for pbone in blender_object.pose.bones:
+            constraints.extend(pbone.constraints)
+    for constraint in constraints:
+        for attribute in ["target", "pole_target"]:
+            target = getattr(constraint, attribute, None)
+            if target is not None:
+                dependencies.append(target)
+        # Armature constraints have a list of targets
+        for constraint_target in getattr(constraint, "targets", []):
+            if constraint_target.target is not None:
+                dependencies.append(constraint_target.target)
+
+    if blender_object.animation_data is not None:
+        dependencies.extend(__get_driver_targets(blender_object.animation_data.drivers))
+    return dependencies
+
+
+def __get_driver_targets(fcurves) -> typing.List[bpy.types.Object]:
+    targets = []
+    for fcurve in fcurves:
+        for variable in fcurve.driver.variables:
+            for target in variable.targets:
+                if isinstance(target.id, bpy.types.Object):
+                    targets.append(target.id)
+    return targets
+
+
+def __bake(jobs: typing.List[BakeJob]) -> typing.List[BakeJob]:
+    """
+    Sample the actions of the jobs, which are all assigned together, in one sweep of the timeline.
+
+    :return: the baked jobs, whose action could be assigned
+    """
+    current_actions = []
+    assigned_jobs = []
+    for job in jobs:
+        animation_data = job.blender_object.animation_data
+        current_actions.append((animation_data, animation_data.action))
+        try:
+            animation_data.action = job.blender_action
+        except:
+            print_console("WARNING", "Animation '{}' could not be baked in advance".format(job.blender_action.name))
+            continue
+        assigned_jobs.append(job)
+
+    frames = {}
+    for job in assigned_jobs:
+        for frame in job.frames:
+            frames.setdefault(frame, []).append(job)
+
+    for frame in sorted(frames.keys()):
+        # we need to bake in the constraints
+        bpy.context.scene.frame_set(frame)
+        for job in frames[frame]:
+            # Sampling is forced, so all bones are baked with their constraints
+            job.data[frame] = gltf2_blender_gather_animation_sampler_keyframes.bake_frame(
+                job.blender_object, True, job.blender_action.name, frame)
+
+    for job in assigned_jobs:
+        gltf2_blender_gather_animation_sampler_keyframes.get_bone_matrix.set_result(
+            job.blender_object, job.blender_action.name, job.data)
+        # The cache now holds the matrices, until the channels of the action are gathered
+        job.data = {}
+
+    for animation_data, action in current_actions:
+        if animation_data.action != action:
+            animation_data.action = action
+
+    return assigned_jobs
+
+
+def __gather_channels(jobs: typing.List[BakeJob], export_settings):
+    """Gather the channels of the baked actions, which releases their bone matrices."""
+    for job in jobs:
+        try:
+            gltf2_blender_gather_animation_channels.gather_animation_channels(
+                job.blender_action, job.blender_object, export_settings)
+        except RuntimeError:
+            # Reported when the animation is gathered again, and baked on demand then
+            gltf2_blender_gather_animation_sampler_keyframes.get_bone_matrix.release(
+                job.blender_object, job.blender_action.name)
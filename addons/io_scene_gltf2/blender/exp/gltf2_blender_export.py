@@ -20,6 +20,7 @@ import traceback
 from io_scene_gltf2.blender.com import gltf2_blender_json
 from io_scene_gltf2.blender.exp import gltf2_blender_export_keys
 from io_scene_gltf2.blender.exp import gltf2_blender_gather
+from io_scene_gltf2.blender.exp import gltf2_blender_gather_cache
 from io_scene_gltf2.blender.exp.gltf2_blender_gltf2_exporter import GlTF2Exporter
 from io_scene_gltf2.io.com.gltf2_io_debug import print_console, print_newline
 from io_scene_gltf2.io.exp import gltf2_io_export
@@ -37,8 +38,13 @@ def save(context, export_settings):
 
     __notify_start(context)
     start_time = time.time()
-    json, buffer = __export(export_settings)
-    __write_file(json, buffer, export_settings)
+    gltf2_blender_gather_cache.open_session(export_settings)
+    try:
+        json, buffer = __export(export_settings)
+        __write_file(json, buffer, export_settings)
+    finally:
+        # Release the gathered data, also when the export failed
+        gltf2_blender_gather_cache.close_session(export_settings)
 
     end_time = time.time()
     __notify_end(context, end_time - start_time)
@@ -53,7 +59,7 @@ def __export(export_settings):
     __gather_gltf(exporter, export_settings)
     buffer = __create_buffer(exporter, export_settings)
     exporter.finalize_images()
-    json = __fix_json(exporter.glTF.to_dict())
+    json = exporter.glTF
 
     return json, buffer
 
@@ -70,6 +76,9 @@ def __gather_gltf(exporter, export_settings):
     for animation in animations:
         exporter.add_animation(animation)
 
+    for type_name, count in sorted(exporter.dedup_counts.items()):
+        print_console('INFO', 'Shared {} {} references'.format(count, type_name))
+
 
 def __create_buffer(exporter, export_settings):
     buffer = bytes()
@@ -85,40 +94,6 @@ def __create_buffer(exporter, export_settings):
     return buffer
 
 
-def __fix_json(obj):
-    # TODO: move to custom JSON encoder
-    fixed = obj
-    if isinstance(obj, dict):
-        fixed = {}
-        for key, value in obj.items():
-            if not __should_include_json_value(key, value):
-                continue
-            fixed[key] = __fix_json(value)
-    elif isinstance(obj, list):
-        fixed = []
-        for value in obj:
-            fixed.append(__fix_json(value))
-    elif isinstance(obj, float):
-        # force floats to int, if they are integers (prevent INTEGER_WRITTEN_AS_FLOAT validator warnings)
-        if int(obj) == obj:
-            return int(obj)
-    return fixed
-
-
-def __should_include_json_value(key, value):
-    allowed_empty_collections = ["KHR_materials_unlit"]
-
-    if value is None:
-        return False
-    elif __is_empty_collection(value) and key not in allowed_empty_collections:
-        return False
-    return True
-
-
-def __is_empty_collection(value):
-    return (isinstance(value, dict) or isinstance(value, list)) and len(value) == 0
-
-
 def __write_file(json, buffer, export_settings):
     try:
         gltf2_io_export.save_gltf(
@@ -19,10 +19,11 @@
 from mathutils import Vector, Quaternion, Matrix
 from mathutils.geometry import tessellate_polygon
 from operator import attrgetter
+import numpy as np
 
 from . import gltf2_blender_export_keys
 from ...io.com.gltf2_io_debug import print_console
-from ...io.com.gltf2_io_color_management import color_srgb_to_scene_linear
+from ...io.com.gltf2_io_color_management import color_srgb_to_scene_linear, colors_srgb_to_scene_linear
 from io_scene_gltf2.blender.exp import gltf2_blender_gather_skins
 import bpy
 
@@ -54,8 +55,9 @@ GLTF_MAX_COLORS = 2
 #
 
 class ShapeKey:
-    def __init__(self, shape_key, vertex_normals, polygon_normals):
+    def __init__(self, shape_key, locations, vertex_normals, polygon_normals):
         self.shape_key = shape_key
+        self.locations = locations
         self.vertex_normals = vertex_normals
         self.polygon_normals = polygon_normals
 
@@ -132,6 +134,74 @@ def convert_swizzle_tangent(tan, armature, blender_object, export_settings):
         else:
             return Vector((new_tan[0], new_tan[1], new_tan[2], 1.0))
 
+def get_conversion_matrices(armature, blender_object):
+    """
+    Get the matrices applied to the locations, and to the normals and tangents, of a mesh before exporting them.
+
+    These are the transforms of convert_swizzle_location and convert_swizzle_normal_and_tangent, computed once per
+    mesh, as numpy arrays. Both are None if the mesh is not skinned.
+    """
+    if not armature:
+        return None, None
+
+    if bpy.app.version < (2, 80, 0):
+        apply_matrix = armature.matrix_world.inverted() * blender_object.matrix_world
+        location_matrix = armature.matrix_world * apply_matrix
+        # Normals and tangents get the full transform too, see convert_swizzle_normal_and_tangent
+        direction_matrix = location_matrix
+    else:
+        apply_matrix = armature.matrix_world.inverted() @ blender_object.matrix_world
+        location_matrix = armature.matrix_world @ apply_matrix
+        direction_matrix = apply_matrix.to_quaternion().to_matrix().to_4x4()
+
+    return np.array(location_matrix, dtype=np.float32), np.array(direction_matrix, dtype=np.float32)
+
+
+def convert_swizzle_locations(locations, matrix, export_settings):
+    """
+    Convert an (N, 3) array of locations from Blender coordinate system to glTF coordinate system.
+
+    matrix is the location matrix from get_conversion_matrices.
+    """
+    locations = np.asarray(locations, dtype=np.float32).reshape(-1, 3)
+    if matrix is not None:
+        locations = locations @ matrix[:3, :3].T + matrix[:3, 3]
+    return __swizzle_array(locations, export_settings)
+
+
+def convert_swizzle_normals_and_tangents(directions, matrix, export_settings):
+    """
+    Convert an (N, 3) array of normals or tangents from Blender coordinate system to glTF coordinate system.
+
+    matrix is the direction matrix from get_conversion_matrices.
+    """
+    directions = np.asarray(directions, dtype=np.float32).reshape(-1, 3)
+    if matrix is not None:
+        directions = directions @ matrix[:3, :3].T + matrix[:3, 3]
+    return __swizzle_array(directions, export_settings)
+
+
+def convert_swizzle_tangents(tangents, matrix, export_settings):
+    """
+    Convert an (N, 3) array of tangents from Blender coordinate system to glTF coordinate system.
+
+    Returns an (N, 4) array, with w set to 1.0.
+    """
+    if not np.all(np.any(np.asarray(tangents).reshape(-1, 3) != 0.0, axis=1)):
+        print_console('WARNING', 'Tangent has zero length.')
+
+    tangents = convert_swizzle_normals_and_tangents(tangents, matrix, export_settings)
+    return np.column_stack((tangents, np.ones(len(tangents), dtype=np.float32)))
+
+
+def __swizzle_array(vectors, export_settings):
+    if export_settings[gltf2_blender_export_keys.YUP]:
+        vectors = vectors[:, (0, 2, 1)]
+        vectors[:, 2] *= -1.0
+        return vectors
+    return vectors.copy()
+
+
 def convert_swizzle_rotation(rot, export_settings):
     """
     Convert a quaternion rotation from Blender coordinate system to glTF coordinate system.
@@ -454,6 +524,19 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
         except Exception:
             print_console('WARNING', 'Could not calculate tangents. Please try to triangulate the mesh first.')
 
+    armature = None
+    if modifiers is not None:
+        modifiers_dict = {m.type: m for m in modifiers}
+        if "ARMATURE" in modifiers_dict:
+            modifier = modifiers_dict["ARMATURE"]
+            armature = modifier.object
+
+    if bpy.app.version >= (2, 80, 0):
+        result_primitives = __extract_primitives_vectorized(
+            blender_mesh, blender_object, blender_vertex_groups, armature, use_tangents, export_settings)
+        print_console('INFO', 'Primitives created: ' + str(len(result_primitives)))
+        return result_primitives
+
     #
 
     material_map = {}
@@ -481,10 +564,9 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
     material_idx_to_primitives = {0: no_material_primitives}
 
     #
-
-    vertex_index_to_new_indices = {}
-
-    material_map[0] = vertex_index_to_new_indices
+    # For each material, the new index of each distinct vertex (keyed by its attributes).
+    #
+    material_map[0] = {}
 
     #
     # Create primitive for each material.
@@ -505,12 +587,7 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
         }
 
         material_idx_to_primitives[mat_idx] = primitive
-
-        #
-
-        vertex_index_to_new_indices = {}
-
-        material_map[mat_idx] = vertex_index_to_new_indices
+        material_map[mat_idx] = {}
 
     tex_coord_max = 0
     if blender_mesh.uv_layers.active:
@@ -544,6 +621,34 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
 
     #
 
+    #
+    # Convert locations, normals and tangents of the whole mesh to glTF coordinates at once.
+    #
+
+    location_matrix, direction_matrix = get_conversion_matrices(armature, blender_object)
+
+    vertex_locations = convert_swizzle_locations(
+        __foreach_get(blender_mesh.vertices, 'co', 3), location_matrix, export_settings)
+    vertex_normals = convert_swizzle_normals_and_tangents(
+        __foreach_get(blender_mesh.vertices, 'normal', 3), direction_matrix, export_settings)
+    polygon_normals = convert_swizzle_normals_and_tangents(
+        __foreach_get(blender_mesh.polygons, 'normal', 3), direction_matrix, export_settings)
+    if blender_mesh.has_custom_normals:
+        loop_normals = convert_swizzle_normals_and_tangents(
+            __foreach_get(blender_mesh.loops, 'normal', 3), direction_matrix, export_settings)
+
+    if use_tangents:
+        loop_tangents = __foreach_get(blender_mesh.loops, 'tangent', 3)
+        loop_bitangents = __foreach_get(blender_mesh.loops, 'bitangent', 3)
+        face_tangents, face_bitangents = __sum_polygon_loops(blender_mesh, loop_tangents, loop_bitangents)
+
+        loop_tangents = convert_swizzle_tangents(loop_tangents, direction_matrix, export_settings)
+        loop_bitangents = convert_swizzle_locations(loop_bitangents, location_matrix, export_settings)
+        face_tangents = convert_swizzle_tangents(face_tangents, direction_matrix, export_settings)
+        face_bitangents = convert_swizzle_locations(face_bitangents, location_matrix, export_settings)
+
+    #
+
     morph_max = 0
 
     blender_shape_keys = []
@@ -555,16 +660,14 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
                     morph_max += 1
                     blender_shape_keys.append(ShapeKey(
                         blender_shape_key,
-                        blender_shape_key.normals_vertex_get(),  # calculate vertex normals for this shape key
-                        blender_shape_key.normals_polygon_get()))  # calculate polygon normals for this shape key
-
-
-    armature = None
-    if modifiers is not None:
-        modifiers_dict = {m.type: m for m in modifiers}
-        if "ARMATURE" in modifiers_dict:
-            modifier = modifiers_dict["ARMATURE"]
-            armature = modifier.object
+                        convert_swizzle_locations(
+                            __foreach_get(blender_shape_key.data, 'co', 3), location_matrix, export_settings),
+                        # calculate vertex normals for this shape key
+                        convert_swizzle_normals_and_tangents(
+                            blender_shape_key.normals_vertex_get(), direction_matrix, export_settings),
+                        # calculate polygon normals for this shape key
+                        convert_swizzle_normals_and_tangents(
+                            blender_shape_key.normals_polygon_get(), direction_matrix, export_settings)))
 
 
     #
@@ -577,29 +680,17 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
 
         if export_settings['gltf_materials'] is False:
             primitive = material_idx_to_primitives[0]
-            vertex_index_to_new_indices = material_map[0]
+            vertex_key_to_new_index = material_map[0]
         elif not blender_polygon.material_index in material_idx_to_primitives:
             primitive = material_idx_to_primitives[0]
-            vertex_index_to_new_indices = material_map[0]
+            vertex_key_to_new_index = material_map[0]
         else:
             primitive = material_idx_to_primitives[blender_polygon.material_index]
-            vertex_index_to_new_indices = material_map[blender_polygon.material_index]
+            vertex_key_to_new_index = material_map[blender_polygon.material_index]
         #
 
         attributes = primitive[ATTRIBUTES_ID]
 
-        face_normal = blender_polygon.normal
-        face_tangent = Vector((0.0, 0.0, 0.0))
-        face_bitangent = Vector((0.0, 0.0, 0.0))
-        if use_tangents:
-            for loop_index in blender_polygon.loop_indices:
-                temp_vertex = blender_mesh.loops[loop_index]
-                face_tangent += temp_vertex.tangent
-                face_bitangent += temp_vertex.bitangent
-
-            face_tangent.normalize()
-            face_bitangent.normalize()
-
         #
 
         indices = primitive[INDICES_ID]
@@ -633,9 +724,6 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
         for loop_index in loop_index_list:
             vertex_index = blender_mesh.loops[loop_index].vertex_index
 
-            if vertex_index_to_new_indices.get(vertex_index) is None:
-                vertex_index_to_new_indices[vertex_index] = []
-
             #
 
             v = None
@@ -653,20 +741,20 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
 
             vertex = blender_mesh.vertices[vertex_index]
 
-            v = convert_swizzle_location(vertex.co, armature, blender_object, export_settings)
+            v = Vector(vertex_locations[vertex_index])
             if blender_polygon.use_smooth or blender_mesh.use_auto_smooth:
                 if blender_mesh.has_custom_normals:
-                    n = convert_swizzle_normal_and_tangent(blender_mesh.loops[loop_index].normal, armature, blender_object, export_settings)
+                    n = Vector(loop_normals[loop_index])
                 else:
-                    n = convert_swizzle_normal_and_tangent(vertex.normal, armature, blender_object, export_settings)
+                    n = Vector(vertex_normals[vertex_index])
                 if use_tangents:
-                    t = convert_swizzle_tangent(blender_mesh.loops[loop_index].tangent, armature, blender_object, export_settings)
-                    b = convert_swizzle_location(blender_mesh.loops[loop_index].bitangent, armature, blender_object, export_settings)
+                    t = Vector(loop_tangents[loop_index])
+                    b = Vector(loop_bitangents[loop_index])
             else:
-                n = convert_swizzle_normal_and_tangent(face_normal, armature, blender_object, export_settings)
+                n = Vector(polygon_normals[blender_polygon.index])
                 if use_tangents:
-                    t = convert_swizzle_tangent(face_tangent, armature, blender_object, export_settings)
-                    b = convert_swizzle_location(face_bitangent, armature, blender_object, export_settings)
+                    t = Vector(face_tangents[blender_polygon.index])
+                    b = Vector(face_bitangents[blender_polygon.index])
 
             if use_tangents:
                 tv = Vector((t[0], t[1], t[2]))
@@ -767,9 +855,7 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
                 for morph_index in range(0, morph_max):
                     blender_shape_key = blender_shape_keys[morph_index]
 
-                    v_morph = convert_swizzle_location(blender_shape_key.shape_key.data[vertex_index].co,
-                                                       armature, blender_object,
-                                                       export_settings)
+                    v_morph = Vector(blender_shape_key.locations[vertex_index])
 
                     # Store delta.
                     v_morph -= v
@@ -778,19 +864,10 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
 
                     #
 
-                    n_morph = None
-
                     if blender_polygon.use_smooth:
-                        temp_normals = blender_shape_key.vertex_normals
-                        n_morph = (temp_normals[vertex_index * 3 + 0], temp_normals[vertex_index * 3 + 1],
-                                   temp_normals[vertex_index * 3 + 2])
+                        n_morph = Vector(blender_shape_key.vertex_normals[vertex_index])
                     else:
-                        temp_normals = blender_shape_key.polygon_normals
-                        n_morph = (
-                            temp_normals[blender_polygon.index * 3 + 0], temp_normals[blender_polygon.index * 3 + 1],
-                            temp_normals[blender_polygon.index * 3 + 2])
-
-                    n_morph = convert_swizzle_normal_and_tangent(Vector(n_morph), armature, blender_object, export_settings)
+                        n_morph = Vector(blender_shape_key.polygon_normals[blender_polygon.index])
 
                     # Store delta.
                     n_morph -= n
@@ -811,94 +888,25 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
             #
             #
 
-            create = True
-
-            for current_new_index in vertex_index_to_new_indices[vertex_index]:
-                found = True
-
-                for i in range(0, 3):
-                    if attributes[POSITION_ATTRIBUTE][current_new_index * 3 + i] != v[i]:
-                        found = False
-                        break
-
-                    if attributes[NORMAL_ATTRIBUTE][current_new_index * 3 + i] != n[i]:
-                        found = False
-                        break
-
-                if use_tangents:
-                    for i in range(0, 4):
-                        if attributes[TANGENT_ATTRIBUTE][current_new_index * 4 + i] != t[i]:
-                            found = False
-                            break
-
-                if not found:
-                    continue
-
-                for tex_coord_index in range(0, tex_coord_max):
-                    uv = uvs[tex_coord_index]
-
-                    tex_coord_id = TEXCOORD_PREFIX + str(tex_coord_index)
-                    for i in range(0, 2):
-                        if attributes[tex_coord_id][current_new_index * 2 + i] != uv[i]:
-                            found = False
-                            break
-
-                if export_color:
-                    for color_index in range(0, color_max):
-                        color = colors[color_index]
-
-                        color_id = COLOR_PREFIX + str(color_index)
-                        for i in range(0, 3):
-                            # Alpha is always 1.0 - see above.
-                            current_color = attributes[color_id][current_new_index * 4 + i]
-                            if color_srgb_to_scene_linear(current_color) != color[i]:
-                                found = False
-                                break
-
-                if export_settings[gltf2_blender_export_keys.SKINS]:
-                    for bone_index in range(0, bone_max):
-                        joint = joints[bone_index]
-                        weight = weights[bone_index]
-
-                        joint_id = JOINTS_PREFIX + str(bone_index)
-                        weight_id = WEIGHTS_PREFIX + str(bone_index)
-                        for i in range(0, 4):
-                            if attributes[joint_id][current_new_index * 4 + i] != joint[i]:
-                                found = False
-                                break
-                            if attributes[weight_id][current_new_index * 4 + i] != weight[i]:
-                                found = False
-                                break
-
-                if export_settings[gltf2_blender_export_keys.MORPH]:
-                    for morph_index in range(0, morph_max):
-                        target_position = target_positions[morph_index]
-                        target_normal = target_normals[morph_index]
-                        if use_tangents:
-                            target_tangent = target_tangents[morph_index]
-
-                        target_position_id = MORPH_POSITION_PREFIX + str(morph_index)
-                        target_normal_id = MORPH_NORMAL_PREFIX + str(morph_index)
-                        target_tangent_id = MORPH_TANGENT_PREFIX + str(morph_index)
-                        for i in range(0, 3):
-                            if attributes[target_position_id][current_new_index * 3 + i] != target_position[i]:
-                                found = False
-                                break
-                            if attributes[target_normal_id][current_new_index * 3 + i] != target_normal[i]:
-                                found = False
-                                break
-                            if use_tangents:
-                                if attributes[target_tangent_id][current_new_index * 3 + i] != target_tangent[i]:
-                                    found = False
-                                    break
-
-                if found:
-                    indices.append(current_new_index)
-
-                    create = False
-                    break
+            # Vertices are welded when all their attributes are equal: look
+            # them up by a key made of all the attribute values.
+            vertex_key = (vertex_index, tuple(v), tuple(n))
+            if use_tangents:
+                vertex_key += (tuple(t),)
+            vertex_key += tuple(tuple(uv) for uv in uvs)
+            if export_color:
+                vertex_key += tuple(tuple(color) for color in colors)
+            if export_settings[gltf2_blender_export_keys.SKINS]:
+                vertex_key += tuple(tuple(joint) for joint in joints)
+                vertex_key += tuple(tuple(weight) for weight in weights)
+            if export_settings[gltf2_blender_export_keys.MORPH]:
+                vertex_key += tuple(tuple(target_position) for target_position in target_positions)
+                vertex_key += tuple(tuple(target_normal) for target_normal in target_normals)
+                vertex_key += tuple(tuple(target_tangent) for target_tangent in target_tangents)
 
-            if not create:
+            current_new_index = vertex_key_to_new_index.get(vertex_key)
+            if current_new_index is not None:
+                indices.append(current_new_index)
                 continue
 
             new_index = 0
@@ -908,7 +916,7 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
 
             primitive['max_index'] = new_index
 
-            vertex_index_to_new_indices[vertex_index].append(new_index)
+            vertex_key_to_new_index[vertex_key] = new_index
 
             #
             #
@@ -993,3 +1001,295 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
     print_console('INFO', 'Primitives created: ' + str(len(result_primitives)))
 
     return result_primitives
+
+
+def __extract_primitives_vectorized(blender_mesh, blender_object, blender_vertex_groups, armature, use_tangents,
+                                    export_settings):
+    """
+    Extract primitives reading the mesh data in bulk with foreach_get, and processing it with numpy.
+
+    All triangle corners are gathered in flat arrays, then split by material and welded: a vertex is emitted once
+    for all corners sharing the same attributes.
+    Attributes and indices of the resulting primitives are numpy arrays.
+    """
+    blender_mesh.calc_loop_triangles()
+    if len(blender_mesh.loop_triangles) == 0:
+        return []
+
+    corner_loops = __foreach_get(blender_mesh.loop_triangles, 'loops', 3, np.int32).reshape(-1)
+    corner_polygons = np.repeat(__foreach_get(blender_mesh.loop_triangles, 'polygon_index', 1, np.int32), 3)
+    corner_vertices = __foreach_get(blender_mesh.loops, 'vertex_index', 1, np.int32)[corner_loops]
+
+    location_matrix, direction_matrix = get_conversion_matrices(armature, blender_object)
+
+    #
+    # Position and normal.
+    #
+
+    vertex_locations = __foreach_get(blender_mesh.vertices, 'co', 3)
+    positions = convert_swizzle_locations(vertex_locations, location_matrix, export_settings)[corner_vertices]
+
+    polygon_smooth = __foreach_get(blender_mesh.polygons, 'use_smooth', 1, np.bool_)
+    corner_smooth = polygon_smooth[corner_polygons] | blender_mesh.use_auto_smooth
+
+    if blender_mesh.has_custom_normals:
+        smooth_normals = __foreach_get(blender_mesh.loops, 'normal', 3)[corner_loops]
+    else:
+        smooth_normals = __foreach_get(blender_mesh.vertices, 'normal', 3)[corner_vertices]
+    face_normals = __foreach_get(blender_mesh.polygons, 'normal', 3)[corner_polygons]
+    normals = np.where(corner_smooth[:, np.newaxis], smooth_normals, face_normals)
+    normals = convert_swizzle_normals_and_tangents(normals, direction_matrix, export_settings)
+
+    attributes = {
+        POSITION_ATTRIBUTE: positions,
+        NORMAL_ATTRIBUTE: normals
+    }
+
+    #
+    # Tangent, with the bitangent sign in w.
+    #
+
+    if use_tangents:
+        loop_tangents = __foreach_get(blender_mesh.loops, 'tangent', 3)
+        loop_bitangents = __foreach_get(blender_mesh.loops, 'bitangent', 3)
+
+        # Flat faces use the sum of their loop tangents and bitangents.
+        face_tangents, face_bitangents = __sum_polygon_loops(blender_mesh, loop_tangents, loop_bitangents)
+
+        tangents = np.where(corner_smooth[:, np.newaxis], loop_tangents[corner_loops], face_tangents[corner_polygons])
+        bitangents = np.where(corner_smooth[:, np.newaxis], loop_bitangents[corner_loops],
+                              face_bitangents[corner_polygons])
+
+        tangents = convert_swizzle_tangents(tangents, direction_matrix, export_settings)
+        # Bitangents get the location conversion, including the armature translation, as in the loop based path
+        bitangents = convert_swizzle_locations(bitangents, location_matrix, export_settings)
+        tangents[:, 3] = np.where(
+            np.einsum('ij,ij->i', np.cross(normals, tangents[:, :3]), bitangents) < 0.0, -1.0, 1.0)
+
+        attributes[TANGENT_ATTRIBUTE] = tangents
+
+    #
+    # Texture coordinates and colors.
+    #
+
+    if blender_mesh.uv_layers.active:
+        for tex_coord_index, uv_layer in enumerate(blender_mesh.uv_layers):
+            uvs = __foreach_get(uv_layer.data, 'uv', 2)[corner_loops]
+            uvs[:, 1] = 1.0 - uvs[:, 1]
+            attributes[TEXCOORD_PREFIX + str(tex_coord_index)] = uvs
+
+    for color_index, vertex_color in enumerate(blender_mesh.vertex_colors[:GLTF_MAX_COLORS]):
+        colors = __foreach_get(vertex_color.data, 'color', 4)[corner_loops]
+        colors[:, :3] = colors_srgb_to_scene_linear(colors[:, :3])
+        attributes[COLOR_PREFIX + str(color_index)] = colors
+
+    #
+    # Joints and weights.
+    #
+
+    if export_settings[gltf2_blender_export_keys.SKINS]:
+        vertex_joints, vertex_weights = __get_vertex_influences(
+            blender_mesh, blender_vertex_groups, armature, export_settings)
+        if vertex_joints is not None:
+            joints = vertex_joints[corner_vertices]
+            weights = vertex_weights[corner_vertices]
+            for bone_index in range(0, joints.shape[1] // 4):
+                attributes[JOINTS_PREFIX + str(bone_index)] = joints[:, bone_index * 4:bone_index * 4 + 4]
+                attributes[WEIGHTS_PREFIX + str(bone_index)] = weights[:, bone_index * 4:bone_index * 4 + 4]
+
+    #
+    # Morph targets, as deltas from the base mesh.
+    #
+
+    if export_settings[gltf2_blender_export_keys.MORPH] and blender_mesh.shape_keys is not None:
+        morph_index = 0
+        for blender_shape_key in blender_mesh.shape_keys.key_blocks:
+            if blender_shape_key == blender_shape_key.relative_key or blender_shape_key.mute:
+                continue
+
+            morph_locations = __foreach_get(blender_shape_key.data, 'co', 3)
+            morph_positions = convert_swizzle_locations(morph_locations, location_matrix, export_settings)[corner_vertices]
+            attributes[MORPH_POSITION_PREFIX + str(morph_index)] = morph_positions - positions
+
+            vertex_normals = np.array(blender_shape_key.normals_vertex_get(), dtype=np.float32).reshape(-1, 3)
+            polygon_normals = np.array(blender_shape_key.normals_polygon_get(), dtype=np.float32).reshape(-1, 3)
+            morph_normals = np.where(polygon_smooth[corner_polygons][:, np.newaxis],
+                                     vertex_normals[corner_vertices], polygon_normals[corner_polygons])
+            morph_normals = convert_swizzle_normals_and_tangents(morph_normals, direction_matrix, export_settings) - normals
+            attributes[MORPH_NORMAL_PREFIX + str(morph_index)] = morph_normals
+
+            if use_tangents:
+                attributes[MORPH_TANGENT_PREFIX + str(morph_index)] = __rotate_by_rotation_difference(
+                    attributes[TANGENT_ATTRIBUTE][:, :3], morph_normals, normals)
+
+            morph_index += 1
+
+    #
+    # Weld corners into vertices, and split by material.
+    #
+
+    corner_keys = __get_corner_keys(corner_vertices, attributes)
+
+    corner_materials = __foreach_get(blender_mesh.polygons, 'material_index', 1, np.int32)[corner_polygons]
+    if export_settings['gltf_materials'] is False:
+        corner_materials[:] = 0
+    else:
+        corner_materials[corner_materials >= max(len(blender_mesh.materials), 1)] = 0
+
+    result_primitives = []
+    for material_idx in np.unique(corner_materials):
+        corners = np.flatnonzero(corner_materials == material_idx)
+
+        # Vertices are numbered in order of first use, like the corners referencing them.
+        _, first_corners, corner_to_vertex = np.unique(corner_keys[corners], return_index=True, return_inverse=True)
+        vertex_order = np.argsort(first_corners)
+        vertex_to_new_index = np.empty_like(vertex_order)
+        vertex_to_new_index[vertex_order] = np.arange(len(vertex_order))
+        vertex_corners = corners[first_corners[vertex_order]]
+
+        result_primitives.append({
+            MATERIAL_ID: int(material_idx),
+            INDICES_ID: vertex_to_new_index[corner_to_vertex.reshape(-1)].astype(np.uint32),
+            ATTRIBUTES_ID: {
+                attribute_id: data[vertex_corners].reshape(-1)
+                for attribute_id, data in attributes.items()
+            }
+        })
+
+    return result_primitives
+
+
+def __foreach_get(collection, attribute, components, dtype=np.float32):
+    """Read an attribute of all collection items into a numpy array, with one row per item."""
+    data = np.empty(len(collection) * components, dtype=dtype)
+    collection.foreach_get(attribute, data)
+    if components == 1:
+        return data
+    return data.reshape(-1, components)
+
+
+def __sum_polygon_loops(blender_mesh, *loop_arrays):
+    """Sum per loop vectors over each polygon, and normalize the sums."""
+    loop_starts = __foreach_get(blender_mesh.polygons, 'loop_start', 1, np.int32)
+    loop_totals = __foreach_get(blender_mesh.polygons, 'loop_total', 1, np.int32)
+
+    loop_polygons = np.repeat(np.arange(len(loop_starts)), loop_totals)
+    loop_offsets = np.arange(len(loop_polygons)) - np.repeat(np.cumsum(loop_totals) - loop_totals, loop_totals)
+    loop_indices = np.repeat(loop_starts, loop_totals) + loop_offsets
+
+    sums = []
+    for loop_array in loop_arrays:
+        polygon_sum = np.zeros((len(loop_starts), 3), dtype=np.float32)
+        np.add.at(polygon_sum, loop_polygons, loop_array[loop_indices])
+        lengths = np.linalg.norm(polygon_sum, axis=1)
+        nonzero = lengths > 0.0
+        polygon_sum[nonzero] /= lengths[nonzero, np.newaxis]
+        sums.append(polygon_sum)
+    return sums
+
+
+def __get_vertex_influences(blender_mesh, blender_vertex_groups, armature, export_settings):
+    """
+    Get joints and weights of all vertices, in sets of 4, as two (vertex count, 4 * set count) arrays.
+
+    Vertex groups without joint, and null weights, are skipped. Returns None, None if no vertex has any group.
+    """
+    vertices = blender_mesh.vertices
+    group_counts = np.fromiter((len(vertex.groups) for vertex in vertices), dtype=np.int64, count=len(vertices))
+    max_count = int(group_counts.max()) if len(group_counts) > 0 else 0
+    if max_count == 0:
+        return None, None
+    bone_max = (max_count + 3) // 4
+
+    vertex_joints = np.zeros((len(vertices), bone_max * 4), dtype=np.uint16)
+    vertex_weights = np.zeros((len(vertices), bone_max * 4), dtype=np.float32)
+    if blender_vertex_groups is None or not armature:
+        return vertex_joints, vertex_weights
+
+    # Vertex group index -> joint index (-1 for none), resolved once by name.
+    skin = gltf2_blender_gather_skins.gather_skin(armature, export_settings)
+    joint_indices = {}
+    for index, j in enumerate(skin.joints):
+        joint_indices.setdefault(j.name, index)
+    group_to_joint = np.array([joint_indices.get(group.name, -1) for group in blender_vertex_groups], dtype=np.int64)
+
+    # Flat (vertex, group, weight) arrays of the group elements of all vertices, in vertex order.
+    ends = np.cumsum(group_counts)
+    element_vertices = np.repeat(np.arange(len(vertices)), group_counts)
+    element_groups = np.empty(ends[-1], dtype=np.int32)
+    element_weights = np.empty(ends[-1], dtype=np.float32)
+    for vertex, start, end in zip(vertices, (ends - group_counts).tolist(), ends.tolist()):
+        if start < end:
+            vertex.groups.foreach_get('group', element_groups[start:end])
+            vertex.groups.foreach_get('weight', element_weights[start:end])
+    element_joints = group_to_joint[element_groups]
+
+    if not export_settings['gltf_all_vertex_influences']:
+        # sort groups of each vertex by weight descending (stable, like sorted)
+        order = np.lexsort((-element_weights, element_vertices))
+        element_vertices = element_vertices[order]
+        element_joints = element_joints[order]
+        element_weights = element_weights[order]
+
+    kept = (element_weights > 0.0) & (element_joints >= 0)
+    element_vertices = element_vertices[kept]
+    element_joints = element_joints[kept]
+    element_weights = element_weights[kept]
+
+    # Slot of each kept element among the kept elements of its vertex
+    kept_counts = np.bincount(element_vertices, minlength=len(vertices))
+    firsts = np.cumsum(kept_counts) - kept_counts
+    slots = np.arange(len(element_vertices)) - firsts[element_vertices]
+
+    vertex_joints[element_vertices, slots] = element_joints
+    vertex_weights[element_vertices, slots] = element_weights
+    return vertex_joints, vertex_weights
+
+
+def __rotate_by_rotation_difference(vectors, from_vectors, to_vectors):
+    """
+    Rotate each vector by the rotation from the matching from_vector to the matching to_vector.
+
+    Vectorized version of vector.rotate(from_vector.rotation_difference(to_vector)), including its handling of
+    parallel, opposite and null vectors.
+    """
+    def normalized(v):
+        lengths = np.linalg.norm(v, axis=1, keepdims=True)
+        return np.divide(v, lengths, out=np.zeros_like(v), where=lengths > 0.0)
+
+    a = normalized(np.asarray(from_vectors, dtype=np.float32))
+    b = normalized(np.asarray(to_vectors, dtype=np.float32))
+    axes = np.cross(a, b)
+    sines = np.linalg.norm(axes, axis=1)
+    cosines = np.einsum('ij,ij->i', a, b)
+    angles = np.arctan2(sines, cosines)
+
+    # Parallel vectors and null vectors need no rotation, opposite vectors are turned around an orthogonal axis.
+    degenerate = sines <= np.finfo(np.float32).eps
+    opposite = degenerate & (cosines <= 0.0) & np.any(a != 0.0, axis=1)
+    angles[degenerate] = 0.0
+    angles[opposite] = np.pi
+    axes[degenerate] = 0.0
+    for i in np.flatnonzero(opposite):
+        x, y, z = a[i]
+        dominant = int(np.argmax(np.abs(a[i])))
+        axes[i] = ((-y - z, x, x), (y, -x - z, y), (z, z, -x - y))[dominant]
+    axes = normalized(axes)
+
+    # Rodrigues' rotation formula
+    vectors = np.asarray(vectors, dtype=np.float32)
+    cosines = np.cos(angles)[:, np.newaxis]
+    sines = np.sin(angles)[:, np.newaxis]
+    dots = np.einsum('ij,ij->i', axes, vectors)[:, np.newaxis]
+    return (vectors * cosines + np.cross(axes, vectors) * sines + axes * dots * (1.0 - cosines)).astype(np.float32)
+
+
+def __get_corner_keys(corner_vertices, attributes):
+    """Get one opaque key per corner, equal for corners with the same vertex and attribute values."""
+    columns = [corner_vertices.astype(np.int32).view(np.float32).reshape(-1, 1)]
+    for data in attributes.values():
+        data = np.asarray(data, dtype=np.float32).reshape(len(corner_vertices), -1)
+        # Adding 0.0 turns -0.0 into 0.0, so that both compare equal.
+        columns.append(data + np.float32(0.0))
+    keys = np.ascontiguousarray(np.concatenate(columns, axis=1))
+    return keys.view(np.dtype((np.void, keys.shape[1] * keys.itemsize))).reshape(-1)
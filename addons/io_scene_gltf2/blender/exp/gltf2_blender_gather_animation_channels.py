@@ -20,6 +20,7 @@ from io_scene_gltf2.io.com import gltf2_io
 from io_scene_gltf2.io.com import gltf2_io_debug
 from io_scene_gltf2.blender.exp.gltf2_blender_gather_cache import cached
 from io_scene_gltf2.blender.exp import gltf2_blender_gather_animation_samplers
+from io_scene_gltf2.blender.exp import gltf2_blender_gather_animation_sampler_keyframes
 from io_scene_gltf2.blender.exp import gltf2_blender_gather_animation_channel_target
 from io_scene_gltf2.blender.exp import gltf2_blender_get
 from io_scene_gltf2.blender.exp import gltf2_blender_gather_skins
@@ -34,24 +35,9 @@ def gather_animation_channels(blender_action: bpy.types.Action,
                               ) -> typing.List[gltf2_io.AnimationChannel]:
     channels = []
 
-
     # First calculate range of animation for baking
     # This is need if user set 'Force sampling' and in case we need to bake
-    bake_range_start = None
-    bake_range_end = None
-    groups = __get_channel_groups(blender_action, blender_object, export_settings)
-    # Note: channels has some None items only for SK if some SK are not animated
-    for chans in groups:
-        ranges = [channel.range() for channel in chans  if channel is not None]
-        if bake_range_start is None:
-            bake_range_start = min([channel.range()[0] for channel in chans  if channel is not None])
-        else:
-            bake_range_start = min(bake_range_start, min([channel.range()[0] for channel in chans  if channel is not None]))
-        if bake_range_end is None:
-            bake_range_end = max([channel.range()[1] for channel in chans  if channel is not None])
-        else:
-            bake_range_end = max(bake_range_end, max([channel.range()[1] for channel in chans  if channel is not None]))
-
+    bake_range_start, bake_range_end = get_bake_range(blender_action, blender_object, export_settings)
 
     if blender_object.type == "ARMATURE" and export_settings['gltf_force_sampling'] is True:
         # We have to store sampled animation data for every deformation bones
@@ -110,11 +96,31 @@ def gather_animation_channels(blender_action: bpy.types.Action,
 
 
     # resetting driver caches
-    gltf2_blender_gather_drivers.get_sk_driver_values.reset_cache()
+    # Driver values are kept, as they are cached by action, and may have been baked for all actions in advance
     gltf2_blender_gather_drivers.get_sk_drivers.reset_cache()
+    # The channels of the action are gathered: its baked bone matrices are not needed anymore
+    gltf2_blender_gather_animation_sampler_keyframes.get_bone_matrix.release(blender_object, blender_action.name)
 
     return channels
 
+
+def get_bake_range(blender_action: bpy.types.Action, blender_object: bpy.types.Object, export_settings):
+    """Return the first and last frames of the channels of the action, or (None, None) if it has no channel."""
+    bake_range_start = None
+    bake_range_end = None
+    groups = __get_channel_groups(blender_action, blender_object, export_settings)
+    # Note: channels has some None items only for SK if some SK are not animated
+    for chans in groups:
+        if bake_range_start is None:
+            bake_range_start = min([channel.range()[0] for channel in chans  if channel is not None])
+        else:
+            bake_range_start = min(bake_range_start, min([channel.range()[0] for channel in chans  if channel is not None]))
+        if bake_range_end is None:
+            bake_range_end = max([channel.range()[1] for channel in chans  if channel is not None])
+        else:
+            bake_range_end = max(bake_range_end, max([channel.range()[1] for channel in chans  if channel is not None]))
+    return bake_range_start, bake_range_end
+
 def __get_channel_group_sorted(channels: typing.Tuple[bpy.types.FCurve], blender_object: bpy.types.Object):
     # if this is shapekey animation, we need to sort in same order than shapekeys
     # else, no need to sort
@@ -14,6 +14,7 @@
 
 import bpy
 import mathutils
+import numpy as np
 import typing
 
 from io_scene_gltf2.blender.exp.gltf2_blender_gather_cache import cached, bonecache
@@ -25,11 +26,19 @@ from . import gltf2_blender_export_keys
 from io_scene_gltf2.io.com import gltf2_io_debug
 
 
-class Keyframe:
-    def __init__(self, channels: typing.Tuple[bpy.types.FCurve], frame: float, bake_channel: typing.Union[str, None]):
-        self.seconds = frame / bpy.context.scene.render.fps
-        self.frame = frame
+class Keyframes:
+    """
+    Keyframes of a channel group, stored by columns.
+
+    The values and tangents are (frames, components) arrays, with the components of the Blender property: for example
+    w first quaternions, or euler angles. in_tangents and out_tangents are None if the keyframes have no tangents.
+    """
+
+    def __init__(self, channels: typing.Tuple[bpy.types.FCurve], frames: typing.List[float],
+                 bake_channel: typing.Union[str, None]):
         self.fps = bpy.context.scene.render.fps
+        self.frames = np.array(frames, dtype=np.float64)
+        self.times = self.frames / self.fps
         self.__length_morph = 0
         # Note: channels has some None items only for SK if some SK are not animated
         if bake_channel is None:
@@ -45,11 +54,12 @@ class Keyframe:
             for i in range(self.get_target_len()):
                 self.__indices.append(i)
 
+        self.values = np.zeros((len(frames), self.get_target_len()), dtype=np.float64)
+        self.in_tangents = None
+        self.out_tangents = None
 
-        # Data holders for virtual properties
-        self.__value = None
-        self.__in_tangent = None
-        self.__out_tangent = None
+    def __len__(self):
+        return len(self.frames)
 
     def get_target_len(self):
         length = {
@@ -68,68 +78,50 @@ class Keyframe:
 
         return length
 
-    def __set_indexed(self, value):
-        # Sometimes blender animations only reference a subset of components of a data target. Keyframe should always
+    def get_indices(self):
+        return self.__indices
+
+    def set_value(self, index, value):
+        # Sometimes blender animations only reference a subset of components of a data target. Keyframes should always
         # contain a complete Vector/ Quaternion --> use the array_index value of the keyframe to set components in such
         # structures
         # For SK, must contains all SK values
-        result = [0.0] * self.get_target_len()
         for i, v in zip(self.__indices, value):
-            result[i] = v
-        return result
-
-    def get_indices(self):
-        return self.__indices
-
-    def set_value_index(self, idx, val):
-        self.__value[idx] = val
-
-    def set_value_index_in(self, idx, val):
-        self.__in_tangent[idx] = val
-
-    def set_value_index_out(self, idx, val):
-        self.__out_tangent[idx] = val
-
-    def set_first_tangent(self):
-        self.__in_tangent = self.__value
-
-    def set_last_tangent(self):
-        self.__out_tangent = self.__value
-
-    @property
-    def value(self) -> typing.Union[mathutils.Vector, mathutils.Euler, mathutils.Quaternion, typing.List[float]]:
-        if self.target == "value":
-            return self.__value
-        return gltf2_blender_math.list_to_mathutils(self.__value, self.target)
-
-    @value.setter
-    def value(self, value: typing.List[float]):
-        self.__value = self.__set_indexed(value)
-
-    @property
-    def in_tangent(self) -> typing.Union[mathutils.Vector, mathutils.Euler, mathutils.Quaternion, typing.List[float]]:
-        if self.__in_tangent is None:
+            self.values[index, i] = v
+
+    def set_channel_values(self, columns: typing.List[typing.List[float]]):
+        """Set the values of the keyed components, from one column of values for each not None channel."""
+        for i, column in zip(self.__indices, columns):
+            self.values[:, i] = column
+
+    def set_channel_tangents(self, in_columns: typing.List[typing.List[float]],
+                             out_columns: typing.List[typing.List[float]]):
+        """Set the tangents of the keyed components, the tangents of the first and last keyframes being their value."""
+        self.in_tangents = np.zeros(self.values.shape, dtype=np.float64)
+        self.out_tangents = np.zeros(self.values.shape, dtype=np.float64)
+        for i, in_column, out_column in zip(self.__indices, in_columns, out_columns):
+            self.in_tangents[:, i] = in_column
+            self.out_tangents[:, i] = out_column
+        self.in_tangents[0] = self.values[0]
+        self.out_tangents[-1] = self.values[-1]
+
+    def get_value(self, index) -> typing.Union[mathutils.Vector, mathutils.Euler, mathutils.Quaternion, typing.List[float]]:
+        return self.__to_mathutils(self.values[index])
+
+    def get_in_tangent(self, index) -> typing.Union[mathutils.Vector, mathutils.Euler, mathutils.Quaternion, typing.List[float]]:
+        if self.in_tangents is None:
             return None
-        if self.target == "value":
-            return self.__in_tangent
-        return gltf2_blender_math.list_to_mathutils(self.__in_tangent, self.target)
+        return self.__to_mathutils(self.in_tangents[index])
 
-    @in_tangent.setter
-    def in_tangent(self, value: typing.List[float]):
-        self.__in_tangent = self.__set_indexed(value)
-
-    @property
-    def out_tangent(self) -> typing.Union[mathutils.Vector, mathutils.Euler, mathutils.Quaternion, typing.List[float]]:
-        if self.__out_tangent is None:
+    def get_out_tangent(self, index) -> typing.Union[mathutils.Vector, mathutils.Euler, mathutils.Quaternion, typing.List[float]]:
+        if self.out_tangents is None:
             return None
-        if self.target == "value":
-            return self.__out_tangent
-        return gltf2_blender_math.list_to_mathutils(self.__out_tangent, self.target)
-
-    @out_tangent.setter
-    def out_tangent(self, value: typing.List[float]):
-        self.__out_tangent = self.__set_indexed(value)
+        return self.__to_mathutils(self.out_tangents[index])
 
+    def __to_mathutils(self, row):
+        if self.target == "value":
+            return row.tolist()
+        return gltf2_blender_math.list_to_mathutils(row.tolist(), self.target)
 
 
 @bonecache
@@ -148,36 +140,53 @@ def get_bone_matrix(blender_object_if_armature: typing.Optional[bpy.types.Object
 
     # Always using bake_range, because some bones may need to be baked,
     # even if user didn't request it
-
-    start_frame = bake_range_start
-    end_frame = bake_range_end
-
-
-    frame = start_frame
-    while frame <= end_frame:
-        data[frame] = {}
+    for frame in get_bake_frames(bake_range_start, bake_range_end, step):
         # we need to bake in the constraints
         bpy.context.scene.frame_set(frame)
-        for pbone in blender_object_if_armature.pose.bones:
-            if bake_bone is None:
-                matrix = pbone.matrix_basis
-            else:
-                matrix = pbone.matrix
-                if bpy.app.version < (2, 80, 0):
-                    matrix = blender_object_if_armature.convert_space(pbone, matrix, 'POSE', 'LOCAL')
-                else:
-                    matrix = blender_object_if_armature.convert_space(pose_bone=pbone, matrix=matrix, from_space='POSE', to_space='LOCAL')
-            data[frame][pbone.name] = matrix
+        data[frame] = bake_frame(blender_object_if_armature, bake_bone is not None, action_name, frame)
 
+    return data
 
-        # If some drivers must be evaluated, do it here, to avoid to have to change frame by frame later
-        drivers_to_manage = get_sk_drivers(blender_object_if_armature)
-        for dr_obj, dr_fcurves in drivers_to_manage:
-            vals = get_sk_driver_values(dr_obj, frame, dr_fcurves)
 
+def get_bake_frames(bake_range_start, bake_range_end, step: int) -> typing.List[float]:
+    """Frames sampled when baking the given range."""
+    frames = []
+    frame = bake_range_start
+    while frame <= bake_range_end:
+        frames.append(frame)
         frame += step
+    return frames
 
-    return data
+
+def bake_frame(blender_object_if_armature: bpy.types.Object,
+               bake_constraints: bool,
+               action_name: str,
+               frame: float
+               ) -> typing.Dict[str, mathutils.Matrix]:
+    """
+    Record the matrices of all pose bones of an armature, once the scene is evaluated at the given frame.
+
+    The values of the shape keys driven by the armature are also evaluated, and cached for gather_keyframes.
+    :param bake_constraints: record the matrices including constraints, instead of the basis matrices
+    """
+    matrices = {}
+    for pbone in blender_object_if_armature.pose.bones:
+        if not bake_constraints:
+            matrix = pbone.matrix_basis
+        else:
+            matrix = pbone.matrix
+            if bpy.app.version < (2, 80, 0):
+                matrix = blender_object_if_armature.convert_space(pbone, matrix, 'POSE', 'LOCAL')
+            else:
+                matrix = blender_object_if_armature.convert_space(pose_bone=pbone, matrix=matrix, from_space='POSE', to_space='LOCAL')
+        matrices[pbone.name] = matrix
+
+    # If some drivers must be evaluated, do it here, to avoid to have to change frame by frame later
+    drivers_to_manage = get_sk_drivers(blender_object_if_armature)
+    for dr_obj, dr_fcurves in drivers_to_manage:
+        get_sk_driver_values(dr_obj, action_name, frame, dr_fcurves)
+
+    return matrices
 
 # cache for performance reasons
 @cached
@@ -191,20 +200,18 @@ def gather_keyframes(blender_object_if_armature: typing.Optional[bpy.types.Objec
                      action_name: str,
                      driver_obj,
                      export_settings
-                     ) -> typing.List[Keyframe]:
+                     ) -> Keyframes:
     """Convert the blender action groups' fcurves to keyframes for use in glTF."""
     if bake_bone is None and driver_obj is None:
         # Find the start and end of the whole action group
         # Note: channels has some None items only for SK if some SK are not animated
-        ranges = [channel.range() for channel in channels if channel is not None]
-
         start_frame = min([channel.range()[0] for channel in channels  if channel is not None])
         end_frame = max([channel.range()[1] for channel in channels  if channel is not None])
     else:
         start_frame = bake_range_start
         end_frame = bake_range_end
 
-    keyframes = []
+    keyed_channels = [c for c in channels if c is not None]
     if needs_baking(blender_object_if_armature, channels, export_settings):
         # Bake the animation, by evaluating the animation for all frames
         # TODO: maybe baking can also be done with FCurve.convert_to_samples
@@ -219,12 +226,16 @@ def gather_keyframes(blender_object_if_armature: typing.Optional[bpy.types.Objec
             pose_bone_if_armature = None
 
         # sample all frames
-        frame = start_frame
         step = export_settings['gltf_frame_step']
-        while frame <= end_frame:
-            key = Keyframe(channels, frame, bake_channel)
-            if isinstance(pose_bone_if_armature, bpy.types.PoseBone):
+        frames = get_bake_frames(start_frame, end_frame, step)
+        keyframes = Keyframes(channels, frames, bake_channel)
+        if isinstance(pose_bone_if_armature, bpy.types.PoseBone):
+            if bake_channel is None:
+                target_property = channels[0].data_path.split('.')[-1]
+            else:
+                target_property = bake_channel
 
+            for index, frame in enumerate(frames):
                 mat = get_bone_matrix(
                     blender_object_if_armature,
                     channels,
@@ -238,97 +249,89 @@ def gather_keyframes(blender_object_if_armature: typing.Optional[bpy.types.Objec
                 )
                 trans, rot, scale = mat.decompose()
 
-                if bake_channel is None:
-                    target_property = channels[0].data_path.split('.')[-1]
-                else:
-                    target_property = bake_channel
-                key.value = {
+                keyframes.set_value(index, {
                     "location": trans,
                     "rotation_axis_angle": rot,
                     "rotation_euler": rot,
                     "rotation_quaternion": rot,
                     "scale": scale
-                }[target_property]
+                }[target_property])
+        else:
+            if driver_obj is None:
+                # Note: channels has some None items only for SK if some SK are not animated
+                keyframes.set_channel_values([[c.evaluate(frame) for frame in frames] for c in keyed_channels])
             else:
-                if driver_obj is None:
-                    # Note: channels has some None items only for SK if some SK are not animated
-                    key.value = [c.evaluate(frame) for c in channels if c is not None]
-                    complete_key(key, non_keyed_values)
-                else:
-                    key.value = get_sk_driver_values(driver_obj, frame, channels)
-                    complete_key(key, non_keyed_values)
-            keyframes.append(key)
-            frame += step
+                for index, frame in enumerate(frames):
+                    keyframes.set_value(index, get_sk_driver_values(driver_obj, action_name, frame, channels))
+            complete_key(keyframes, non_keyed_values)
     else:
         # Just use the keyframes as they are specified in blender
         # Note: channels has some None items only for SK if some SK are not animated
-        frames = [keyframe.co[0] for keyframe in [c for c in channels if c is not None][0].keyframe_points]
+        frames = __get_keyframe_points(keyed_channels[0].keyframe_points, 'co')[:, 0].tolist()
         # some weird files have duplicate frame at same time, removed them
         frames = sorted(set(frames))
-        for i, frame in enumerate(frames):
-            key = Keyframe(channels, frame, bake_channel)
-            # key.value = [c.keyframe_points[i].co[0] for c in action_group.channels]
-            key.value = [c.evaluate(frame) for c in channels if c is not None]
-            # Complete key with non keyed values, if needed
-            if len([c for c in channels if c is not None]) != key.get_target_len():
-                complete_key(key, non_keyed_values)
-
-            # compute tangents for cubic spline interpolation
-            if [c for c in channels if c is not None][0].keyframe_points[0].interpolation == "BEZIER":
-                # Construct the in tangent
-                if frame == frames[0]:
-                    # start in-tangent should become all zero
-                    key.set_first_tangent()
-                else:
-                    # otherwise construct an in tangent coordinate from the keyframes control points. We intermediately
-                    # use a point at t-1 to define the tangent. This allows the tangent control point to be transformed
-                    # normally
-                    key.in_tangent = [
-                        c.keyframe_points[i].co[1] + ((c.keyframe_points[i].co[1] - c.keyframe_points[i].handle_left[1]
-                                                       ) / (frame - frames[i - 1]))
-                        for c in channels if c is not None
-                    ]
-                # Construct the out tangent
-                if frame == frames[-1]:
-                    # end out-tangent should become all zero
-                    key.set_last_tangent()
-                else:
-                    # otherwise construct an in tangent coordinate from the keyframes control points. We intermediately
-                    # use a point at t+1 to define the tangent. This allows the tangent control point to be transformed
-                    # normally
-                    key.out_tangent = [
-                        c.keyframe_points[i].co[1] + ((c.keyframe_points[i].handle_right[1] - c.keyframe_points[i].co[1]
-                                                       ) / (frames[i + 1] - frame))
-                        for c in channels if c is not None
-                    ]
-
-                complete_key_tangents(key, non_keyed_values)
-
-            keyframes.append(key)
+        keyframes = Keyframes(channels, frames, bake_channel)
+        # key.value = [c.keyframe_points[i].co[1] for c in action_group.channels]
+        keyframes.set_channel_values([[c.evaluate(frame) for frame in frames] for c in keyed_channels])
+        # Complete key with non keyed values, if needed
+        if len(keyed_channels) != keyframes.get_target_len():
+            complete_key(keyframes, non_keyed_values)
+
+        # compute tangents for cubic spline interpolation
+        if keyed_channels[0].keyframe_points[0].interpolation == "BEZIER":
+            # Construct the in tangents, except the first one which becomes all zero.
+            # We intermediately use a point at t-1 to define the tangent. This allows the tangent control point to be
+            # transformed normally
+            # Construct the out tangents, except the last one which becomes all zero.
+            # We intermediately use a point at t+1 to define the tangent.
+            count = len(frames)
+            frame_deltas = np.diff(keyframes.frames)
+            in_tangents = []
+            out_tangents = []
+            for c in keyed_channels:
+                values = __get_keyframe_points(c.keyframe_points, 'co')[:count, 1]
+                handles_left = __get_keyframe_points(c.keyframe_points, 'handle_left')[:count, 1]
+                handles_right = __get_keyframe_points(c.keyframe_points, 'handle_right')[:count, 1]
+                in_tangent = np.zeros(count, dtype=np.float64)
+                out_tangent = np.zeros(count, dtype=np.float64)
+                in_tangent[1:] = values[1:] + (values[1:] - handles_left[1:]) / frame_deltas
+                out_tangent[:-1] = values[:-1] + (handles_right[:-1] - values[:-1]) / frame_deltas
+                in_tangents.append(in_tangent)
+                out_tangents.append(out_tangent)
+            keyframes.set_channel_tangents(in_tangents, out_tangents)
+
+            complete_key_tangents(keyframes, non_keyed_values)
 
     return keyframes
 
 
-def complete_key(key: Keyframe, non_keyed_values: typing.Tuple[typing.Optional[float]]):
+def __get_keyframe_points(keyframe_points, attribute) -> np.ndarray:
+    """Get a 2D vector attribute (like co) of all keyframe points, as a (points, 2) array."""
+    data = np.empty(len(keyframe_points) * 2, dtype=np.float32)
+    keyframe_points.foreach_get(attribute, data)
+    return data.reshape(-1, 2).astype(np.float64)
+
+
+def complete_key(keyframes: Keyframes, non_keyed_values: typing.Tuple[typing.Optional[float]]):
     """
-    Complete keyframe with non keyed values
+    Complete keyframes with non keyed values
     """
-    for i in range(0, key.get_target_len()):
-        if i in key.get_indices():
+    for i in range(0, keyframes.get_target_len()):
+        if i in keyframes.get_indices():
             continue # this is a keyed array_index or a SK animated
-        key.set_value_index(i, non_keyed_values[i])
+        keyframes.values[:, i] = non_keyed_values[i]
 
-def complete_key_tangents(key: Keyframe, non_keyed_values: typing.Tuple[typing.Optional[float]]):
+def complete_key_tangents(keyframes: Keyframes, non_keyed_values: typing.Tuple[typing.Optional[float]]):
     """
-    Complete keyframe with non keyed values for tangents
+    Complete keyframes with non keyed values for tangents
     """
-    for i in range(0, key.get_target_len()):
-        if i in key.get_indices():
+    for i in range(0, keyframes.get_target_len()):
+        if i in keyframes.get_indices():
             continue # this is a keyed array_index or a SK animated
-        if key.in_tangent is not None:
-            key.set_value_index_in(i, non_keyed_values[i])
-        if key.out_tangent is not None:
-            key.set_value_index_out(i, non_keyed_values[i])
+        if keyframes.in_tangents is not None:
+            keyframes.in_tangents[:, i] = non_keyed_values[i]
+        if keyframes.out_tangents is not None:
+            keyframes.out_tangents[:, i] = non_keyed_values[i]
 
 def needs_baking(blender_object_if_armature: typing.Optional[bpy.types.Object],
                  channels: typing.Tuple[bpy.types.FCurve],
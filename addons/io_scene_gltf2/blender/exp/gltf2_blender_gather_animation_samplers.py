@@ -17,6 +17,7 @@ import typing
 
 import bpy
 import mathutils
+import numpy as np
 from io_scene_gltf2.blender.com import gltf2_blender_math
 from io_scene_gltf2.blender.com.gltf2_blender_data_path import get_target_property_name, get_target_object_path
 from io_scene_gltf2.blender.exp import gltf2_blender_gather_animation_sampler_keyframes
@@ -238,14 +239,14 @@ def __gather_input(channels: typing.Tuple[bpy.types.FCurve],
                                                                                   action_name,
                                                                                   driver_obj,
                                                                                   export_settings)
-    times = [k.seconds for k in keyframes]
+    times = keyframes.times
 
     return gltf2_blender_gather_accessors.gather_accessor(
         gltf2_io_binary_data.BinaryData.from_list(times, gltf2_io_constants.ComponentType.Float),
         gltf2_io_constants.ComponentType.Float,
         len(times),
-        tuple([max(times)]),
-        tuple([min(times)]),
+        tuple([float(times.max())]),
+        tuple([float(times.min())]),
         gltf2_io_constants.DataType.Scalar,
         export_settings
     )
@@ -354,47 +355,47 @@ def __gather_output(channels: typing.Tuple[bpy.types.FCurve],
     else:
         transform = parent_inverse
 
-    values = []
-    for keyframe in keyframes:
-        # Transform the data and build gltf control points
-        value = gltf2_blender_math.transform(keyframe.value, target_datapath, transform)
-        if is_yup and not is_armature_animation:
-            value = gltf2_blender_math.swizzle_yup(value, target_datapath)
-        keyframe_value = gltf2_blender_math.mathutils_to_gltf(value)
-
-        if keyframe.in_tangent is not None:
-            # we can directly transform the tangent as it currently is represented by a control point
-            in_tangent = gltf2_blender_math.transform(keyframe.in_tangent, target_datapath, transform)
-            if is_yup and blender_object_if_armature is None:
-                in_tangent = gltf2_blender_math.swizzle_yup(in_tangent, target_datapath)
-            # the tangent in glTF is relative to the keyframe value
-            if not isinstance(value, list):
-                in_tangent = value - in_tangent
-            else:
-                in_tangent = [value[i] - in_tangent[i] for i in range(len(value))]
-            keyframe_value = gltf2_blender_math.mathutils_to_gltf(in_tangent) + keyframe_value  # append
-
-        if keyframe.out_tangent is not None:
-            # we can directly transform the tangent as it currently is represented by a control point
-            out_tangent = gltf2_blender_math.transform(keyframe.out_tangent, target_datapath, transform)
-            if is_yup and blender_object_if_armature is None:
-                out_tangent = gltf2_blender_math.swizzle_yup(out_tangent, target_datapath)
-            # the tangent in glTF is relative to the keyframe value
-            if not isinstance(value, list):
-                out_tangent = value - out_tangent
-            else:
-                out_tangent = [value[i] - out_tangent[i] for i in range(len(value))]
-            keyframe_value = keyframe_value + gltf2_blender_math.mathutils_to_gltf(out_tangent)  # append
-
-        values += keyframe_value
-
-    # store the keyframe data in a binary buffer
+    # Transform the data of all keyframes at once, and build gltf control points
+    values = gltf2_blender_math.transform_array(keyframes.values, target_datapath, transform)
+    if is_yup and not is_armature_animation:
+        values = gltf2_blender_math.swizzle_yup_array(values, target_datapath)
+    is_rotation = gltf2_blender_math.is_rotation(target_datapath)
+    if is_rotation:
+        # q and -q are the same rotation, but interpolating between them is not
+        values = gltf2_blender_math.make_quaternions_continuous(values)
+    control_points = [gltf2_blender_math.array_to_gltf(values, target_datapath)]
+
+    if keyframes.in_tangents is not None:
+        # we can directly transform the tangents as they currently are represented by control points
+        in_tangents = gltf2_blender_math.transform_array(keyframes.in_tangents, target_datapath, transform)
+        if is_yup and blender_object_if_armature is None:
+            in_tangents = gltf2_blender_math.swizzle_yup_array(in_tangents, target_datapath)
+        if is_rotation:
+            in_tangents = gltf2_blender_math.align_quaternions(in_tangents, values)
+        # the tangents in glTF are relative to the keyframe values
+        in_tangents = values - in_tangents
+        control_points.insert(0, gltf2_blender_math.array_to_gltf(in_tangents, target_datapath))
+
+    if keyframes.out_tangents is not None:
+        # we can directly transform the tangents as they currently are represented by control points
+        out_tangents = gltf2_blender_math.transform_array(keyframes.out_tangents, target_datapath, transform)
+        if is_yup and blender_object_if_armature is None:
+            out_tangents = gltf2_blender_math.swizzle_yup_array(out_tangents, target_datapath)
+        if is_rotation:
+            out_tangents = gltf2_blender_math.align_quaternions(out_tangents, values)
+        # the tangents in glTF are relative to the keyframe values
+        out_tangents = values - out_tangents
+        control_points.append(gltf2_blender_math.array_to_gltf(out_tangents, target_datapath))
+
+    # store the keyframe data in a binary buffer, with the in tangent, value and out tangent of each keyframe in a row
+    data_type_length = values.shape[1]
+    values = np.concatenate(control_points, axis=1).reshape(-1)
     component_type = gltf2_io_constants.ComponentType.Float
     if get_target_property_name(target_datapath) == "value":
         # channels with 'weight' targets must have scalar accessors
         data_type = gltf2_io_constants.DataType.Scalar
     else:
-        data_type = gltf2_io_constants.DataType.vec_type_from_num(len(keyframes[0].value))
+        data_type = gltf2_io_constants.DataType.vec_type_from_num(data_type_length)
 
     return gltf2_io.Accessor(
         buffer_view=gltf2_io_binary_data.BinaryData.from_list(values, component_type),
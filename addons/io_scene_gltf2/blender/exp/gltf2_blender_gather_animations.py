@@ -36,7 +36,7 @@ def gather_animations(blender_object: bpy.types.Object,
     animations = []
 
     # Collect all 'actions' affecting this object. There is a direct mapping between blender actions and glTF animations
-    blender_actions = __get_blender_actions(blender_object, export_settings)
+    blender_actions = get_blender_actions(blender_object, export_settings)
 
     # save the current active action of the object, if any
     # We will restore it after export
@@ -94,7 +94,7 @@ def __gather_animation(blender_action: bpy.types.Action,
                        blender_object: bpy.types.Object,
                        export_settings
                        ) -> typing.Optional[gltf2_io.Animation]:
-    if not __filter_animation(blender_action, blender_object, export_settings):
+    if not filter_animation(blender_action, blender_object, export_settings):
         return None
 
     name = __gather_name(blender_action, blender_object, export_settings)
@@ -121,10 +121,10 @@ def __gather_animation(blender_action: bpy.types.Action,
     return animation
 
 
-def __filter_animation(blender_action: bpy.types.Action,
-                       blender_object: bpy.types.Object,
-                       export_settings
-                       ) -> bool:
+def filter_animation(blender_action: bpy.types.Action,
+                     blender_object: bpy.types.Object,
+                     export_settings
+                     ) -> bool:
     if blender_action.users == 0:
         return False
 
@@ -197,9 +197,9 @@ def __link_samplers(animation: gltf2_io.Animation, export_settings):
         animation.channels[i].sampler = __append_unique_and_get_index(animation.samplers, channel.sampler)
 
 
-def __get_blender_actions(blender_object: bpy.types.Object,
-                            export_settings
-                          ) -> typing.List[typing.Tuple[bpy.types.Action, str]]:
+def get_blender_actions(blender_object: bpy.types.Object,
+                        export_settings
+                        ) -> typing.List[typing.Tuple[bpy.types.Action, str]]:
     blender_actions = []
     blender_tracks = {}
 
@@ -13,61 +13,246 @@
 # limitations under the License.
 
 import functools
+import gc
+import itertools
+import sys
+import time
+
 import bpy
 from io_scene_gltf2.blender.exp import gltf2_blender_get
+from io_scene_gltf2.io.com.gltf2_io_debug import print_console
+
+# Key of the export session token in the export settings
+SESSION = 'gltf_cache_session'
+
+__sessions = itertools.count(1)
+
+# Caches of all decorated functions, in decoration order
+__function_caches = []
+
+
+class FunctionCache:
+    """Results of a cached function for the current export session, and its statistics."""
+
+    def __init__(self, name):
+        self.name = name
+        self.session = None
+        self.entries = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.seconds = 0.0  # spent computing missing results, including nested cached calls
+
+    def reset(self, session):
+        self.session = session
+        self.entries = {}
+
+    def check_session(self, export_settings):
+        """Drop the results of previous export sessions."""
+        session = get_session(export_settings)
+        if session != self.session:
+            self.reset(session)
+
+
+def register_cache(name):
+    """Create the cache of a decorated function, which is then managed by the export sessions."""
+    cache = FunctionCache(name)
+    __function_caches.append(cache)
+    return cache
+
+
+def start_session(export_settings):
+    """
+    Start a new export session: results cached for previous sessions are not used anymore.
+
+    :param export_settings: the export settings, which will hold the session token
+    :return: the session token
+    """
+    session = next(__sessions)
+    export_settings[SESSION] = session
+    return session
+
+
+def get_session(export_settings):
+    session = export_settings.get(SESSION)
+    if session is None:
+        # Gathering not started by an export
+        session = start_session(export_settings)
+    return session
+
+
+def open_session(export_settings):
+    """Start the export session of an export, with fresh statistics."""
+    reset_statistics()
+    return start_session(export_settings)
+
+
+def close_session(export_settings):
+    """
+    End the export session of an export, and release its caches.
+
+    When cache statistics are requested in the export settings, print them with the memory held by each cache first.
+    :param export_settings: the export settings holding the session token
+    :return: dict of the bytes held by each cache, by cache name, or None if no statistics were requested
+    """
+    memory = None
+    if export_settings.get('gltf_cache_statistics'):
+        memory = get_memory_usage()
+        print_statistics(memory)
+
+    for cache in __function_caches:
+        cache.reset(None)
+    export_settings.pop(SESSION, None)
+
+    if memory is not None:
+        # Cached gltf2_io properties and their extras may form reference cycles: collect them now, so that the
+        # memory released by the caches can be checked
+        gc.collect()
+    return memory
+
+
+def get_function_caches():
+    return list(__function_caches)
+
+
+def get_memory_usage():
+    """
+    Estimate the bytes held by the results of each cache.
+
+    Objects reachable from several caches are counted once, for the first cache registered. Blender data is owned
+    by Blender, so only its Python wrappers are counted.
+    :return: dict of bytes, by cache name
+    """
+    seen = set()
+    return {cache.name: __get_size(cache.entries, seen) for cache in __function_caches}
+
+
+def print_statistics(memory=None):
+    """Print the hits, misses, time and optionally memory of the cached functions called during the export."""
+    for cache in sorted(__function_caches, key=lambda cache: -cache.seconds):
+        if cache.hits + cache.misses == 0:
+            continue
+        output = 'Cache {}: {} hits, {} misses, {:.3f} s'.format(cache.name, cache.hits, cache.misses, cache.seconds)
+        if memory is not None:
+            output += ', {} bytes'.format(memory[cache.name])
+        print_console('PROFILE', output)
+
+
+def reset_statistics():
+    for cache in __function_caches:
+        cache.hits = 0
+        cache.misses = 0
+        cache.seconds = 0.0
+
+
+def __get_size(root, seen):
+    size = 0
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+
+        if isinstance(value, (str, bytes, bytearray, int, float, bpy.types.bpy_struct)) or isinstance(value, type):
+            continue
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+        else:
+            # gltf2_io properties store their fields in slots
+            stack.extend(__get_slot_values(value))
+            if hasattr(value, '__dict__'):
+                stack.append(value.__dict__)
+    return size
+
+
+def __get_slot_values(value):
+    values = []
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot in ('__dict__', '__weakref__'):
+                continue
+            try:
+                values.append(getattr(value, slot))
+            except AttributeError:
+                # Unset slot
+                pass
+    return values
+
+
+def __key(value):
+    # Blender IDs are keyed by pointer, and name: temporary IDs (like meshes with modifiers applied) can be freed
+    # during the export, and their memory reused by other IDs
+    if isinstance(value, bpy.types.ID):
+        return value.as_pointer(), value.name
+    return value
+
+
+def __get_name(func):
+    return func.__module__.split('.')[-1] + '.' + func.__name__
 
 
 def cached(func):
     """
     Decorate the cache gather functions results.
 
-    The gather function is only executed if its result isn't in the cache yet
-    :param func: the function to be decorated. It will have a static __cache member afterwards
+    The gather function is only executed if its result isn't in the cache of the current export session yet.
+    :param func: the function to be decorated. Its cache and statistics are in the cache attribute of the result
     :return:
     """
+    cache = register_cache(__get_name(func))
+
     @functools.wraps(func)
     def wrapper_cached(*args, **kwargs):
         assert len(args) >= 2 and 0 <= len(kwargs) <= 1, "Wrong signature for cached function"
-        cache_key_args = args
-        # make a shallow copy of the keyword arguments so that 'export_settings' can be removed
-        cache_key_kwargs = dict(kwargs)
-        if kwargs.get("export_settings"):
+        # 'export_settings' should not be cached
+        if "export_settings" in kwargs:
             export_settings = kwargs["export_settings"]
-            # 'export_settings' should not be cached
-            del cache_key_kwargs["export_settings"]
+            cache_key = tuple(__key(i) for i in args)
         else:
             export_settings = args[-1]
-            cache_key_args = args[:-1]
-
-        __by_name = [bpy.types.Object, bpy.types.Scene, bpy.types.Material, bpy.types.Action, bpy.types.Mesh]
-
-        # we make a tuple from the function arguments so that they can be used as a key to the cache
-        cache_key = ()
-        for i in cache_key_args:
-            if type(i) in __by_name:
-                cache_key += (i.name,)
-            else:
-                cache_key += (i,)
-        for i in cache_key_kwargs.values():
-            if type(i) in __by_name:
-                cache_key += (i.name,)
-            else:
-                cache_key += (i,)
-
-        # invalidate cache if export settings have changed
-        if not hasattr(func, "__export_settings") or export_settings != func.__export_settings:
-            func.__cache = {}
-            func.__export_settings = export_settings
+            cache_key = tuple(__key(i) for i in args[:-1])
+        if kwargs:
+            cache_key += tuple(__key(v) for k, v in kwargs.items() if k != "export_settings")
+
+        # invalidate cache if the export session has changed
+        cache.check_session(export_settings)
+
         # use or fill cache
-        if cache_key in func.__cache:
-            return func.__cache[cache_key]
+        try:
+            result = cache.entries[cache_key]
+        except KeyError:
+            pass
         else:
-            result = func(*args)
-            func.__cache[cache_key] = result
+            cache.hits += 1
             return result
+
+        cache.misses += 1
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        cache.seconds += time.perf_counter() - start
+        cache.entries[cache_key] = result
+        return result
+
+    wrapper_cached.cache = cache
     return wrapper_cached
 
 def bonecache(func):
+    """
+    Decorate the baking of the bone matrices of an armature action.
+
+    The matrices of all bones and frames are baked at once, for each armature and action. Armature actions baked in
+    advance are stored with the set_result attribute of the decorated function, and the matrices of an armature action
+    are dropped with its release attribute, once its channels are gathered.
+    """
+    cache = register_cache(__get_name(func))
 
     @functools.wraps(func)
     def wrapper_bonecache(*args, **kwargs):
@@ -77,18 +262,28 @@ def bonecache(func):
         else:
             pose_bone_if_armature = args[0].pose.bones[args[2]]
 
-        if not hasattr(func, "__current_action_name"):
-            func.__current_action_name = None
-            func.__current_armature_name = None
-            func.__bonecache = {}
-        if args[6] != func.__current_action_name or args[0] != func.__current_armature_name:
+        cache_key = (__key(args[0]), args[6])
+        try:
+            result = cache.entries[cache_key]
+        except KeyError:
+            cache.misses += 1
+            start = time.perf_counter()
             result = func(*args)
-            func.__bonecache = result
-            func.__current_action_name = args[6]
-            func.__current_armature_name = args[0]
-            return result[args[7]][pose_bone_if_armature.name]
+            cache.seconds += time.perf_counter() - start
+            cache.entries[cache_key] = result
         else:
-            return func.__bonecache[args[7]][pose_bone_if_armature.name]
+            cache.hits += 1
+        return result[args[7]][pose_bone_if_armature.name]
+
+    def set_result_bonecache(blender_object_if_armature, action_name, result):
+        cache.entries[(__key(blender_object_if_armature), action_name)] = result
+
+    def release_bonecache(blender_object_if_armature, action_name):
+        cache.entries.pop((__key(blender_object_if_armature), action_name), None)
+
+    wrapper_bonecache.set_result = set_result_bonecache
+    wrapper_bonecache.release = release_bonecache
+    wrapper_bonecache.cache = cache
     return wrapper_bonecache
 
 # TODO: replace "cached" with "unique" in all cases where the caching is functional and not only for performance reasons
@@ -96,46 +291,48 @@ call_or_fetch = cached
 unique = cached
 
 def skdriverdiscovercache(func):
+    cache = register_cache(__get_name(func))
 
     def reset_cache_skdriverdiscovercache():
-        func.__current_armature_name = None
-        func.__skdriverdiscover = {}
-
-    func.reset_cache = reset_cache_skdriverdiscovercache
+        cache.entries = {}
 
     @functools.wraps(func)
     def wrapper_skdriverdiscover(*args, **kwargs):
-        if not hasattr(func, "__current_armature_name") or func.__current_armature_name is None:
-            func.__current_armature_name = None
-            func.reset_cache()
-
-        if args[0] != func.__current_armature_name:
+        cache_key = __key(args[0])
+        try:
+            result = cache.entries[cache_key]
+        except KeyError:
+            cache.misses += 1
             result = func(*args)
-            func.__skdriverdiscover[args[0]] = result
-            func.__current_armature_name = args[0]
-            return result
+            cache.entries[cache_key] = result
         else:
-            return func.__skdriverdiscover[args[0]]
+            cache.hits += 1
+        return result
+
+    wrapper_skdriverdiscover.reset_cache = reset_cache_skdriverdiscovercache
+    wrapper_skdriverdiscover.cache = cache
     return wrapper_skdriverdiscover
 
 def skdrivervalues(func):
+    cache = register_cache(__get_name(func))
 
     def reset_cache_skdrivervalues():
-        func.__skdrivervalues = {}
-
-    func.reset_cache = reset_cache_skdrivervalues
+        cache.entries = {}
 
     @functools.wraps(func)
     def wrapper_skdrivervalues(*args, **kwargs):
-        if not hasattr(func, "__skdrivervalues") or func.__skdrivervalues is None:
-            func.reset_cache()
-
-        if args[0].name not in func.__skdrivervalues.keys():
-            func.__skdrivervalues[args[0].name] = {}
-        if args[1] not in func.__skdrivervalues[args[0].name]:
+        # Values depend on the action of the driving armature
+        cache_key = (__key(args[0]), args[1], args[2])
+        try:
+            vals = cache.entries[cache_key]
+        except KeyError:
+            cache.misses += 1
             vals = func(*args)
-            func.__skdrivervalues[args[0].name][args[1]] = vals
-            return vals
+            cache.entries[cache_key] = vals
         else:
-            return func.__skdrivervalues[args[0].name][args[1]]
+            cache.hits += 1
+        return vals
+
+    wrapper_skdrivervalues.reset_cache = reset_cache_skdrivervalues
+    wrapper_skdrivervalues.cache = cache
     return wrapper_skdrivervalues
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 from . import gltf2_blender_export_keys
 from io_scene_gltf2.io.com import gltf2_io
 from io_scene_gltf2.io.com import gltf2_io_constants
@@ -164,7 +166,8 @@ def __gather_skins(blender_primitive, export_settings):
         bone_set_index = 0
         joint_id = 'JOINTS_' + str(bone_set_index)
         weight_id = 'WEIGHTS_' + str(bone_set_index)
-        while blender_primitive["attributes"].get(joint_id) and blender_primitive["attributes"].get(weight_id):
+        while blender_primitive["attributes"].get(joint_id) is not None \
+                and blender_primitive["attributes"].get(weight_id) is not None:
             if bone_set_index >= 1:
                 if not export_settings['gltf_all_vertex_influences']:
                     gltf2_io_debug.print_console("WARNING", "There are more than 4 joint vertex influences."
@@ -193,7 +196,12 @@ def __gather_skins(blender_primitive, export_settings):
             # weights
             internal_weight = blender_primitive["attributes"][weight_id]
             # normalize first 4 weights, when not exporting all influences
-            if not export_settings['gltf_all_vertex_influences']:
+            if not export_settings['gltf_all_vertex_influences'] and hasattr(internal_weight, 'dtype'):
+                weight_sets = internal_weight.reshape(-1, 4)
+                totals = weight_sets.sum(axis=1, keepdims=True)
+                internal_weight = np.divide(
+                    weight_sets, totals, out=weight_sets.copy(), where=totals > 0).reshape(-1)
+            elif not export_settings['gltf_all_vertex_influences']:
                 for idx in range(0, len(internal_weight), 4):
                     weight_slice = internal_weight[idx:idx + 4]
                     total = sum(weight_slice)
@@ -87,6 +87,27 @@ class GlTF2Exporter:
             gltf2_io.Texture: self.__gltf.textures
         }
 
+        # child of root property types which are merged when their content is equal, if enabled
+        # (nodes, scenes, skins and animations stay distinct even when equal)
+        self.__contentIndexedTypes = {
+            gltf2_io.Accessor,
+            gltf2_io.BufferView,
+            gltf2_io.Camera,
+            gltf2_io.Image,
+            gltf2_io.Material,
+            gltf2_io.Mesh,
+            gltf2_io.Sampler,
+            gltf2_io.Texture
+        }
+        self.__dedup_content = export_settings.get('gltf_dedup_content', False)
+
+        # index of each list holding unique objects: id(list) -> {object or content key: index in list}
+        self.__unique_indices = {}
+        # number of child of root properties found already present, per type name
+        self.__dedup_counts = {}
+        # buffer view of each binary data added to the buffer, when deduplicating: bytes -> BufferView
+        self.__buffer_views_by_data = {}
+
         self.__propertyTypeLookup = [
             gltf2_io.AccessorSparseIndices,
             gltf2_io.AccessorSparse,
@@ -111,7 +132,11 @@ class GlTF2Exporter:
         return self.__gltf
 
     def finalize_buffer(self, output_path=None, buffer_name=None, is_glb=False):
-        """Finalize the glTF and write buffers."""
+        """
+        Finalize the glTF and write buffers.
+
+        For GLB, the buffer is not written, but returned for the GLB writer.
+        """
         if self.__finalized:
             raise RuntimeError("Tried to finalize buffers for finalized glTF file")
 
@@ -120,7 +145,8 @@ class GlTF2Exporter:
                 uri = None
             elif output_path and buffer_name:
                 with open(output_path + buffer_name, 'wb') as f:
-                    f.write(self.__buffer.to_bytes())
+                    for chunk in self.__buffer.chunks():
+                        f.write(chunk)
                 uri = buffer_name
             else:
                 uri = self.__buffer.to_embed_string()
@@ -137,7 +163,8 @@ class GlTF2Exporter:
         self.__finalized = True
 
         if is_glb:
-            return self.__buffer.to_bytes()
+            # Returned unjoined: the GLB writer streams its chunks to the file
+            return self.__buffer
 
     def add_draco_extension(self):
         """
@@ -207,15 +234,68 @@ class GlTF2Exporter:
 
         return self.__append_unique_and_get_index(gltf_list, property)
 
-    @staticmethod
-    def __append_unique_and_get_index(target: list, obj):
-        if obj in target:
-            return target.index(obj)
-        else:
-            index = len(target)
+    @property
+    def dedup_counts(self):
+        """Number of objects which were already present when added, per type name."""
+        return dict(self.__dedup_counts)
+
+    def __append_unique_and_get_index(self, target: list, obj):
+        key = self.__get_unique_key(obj)
+        if key is None:
+            # Not hashable: fall back to a linear search
+            if obj in target:
+                self.__count_dedup(obj)
+                return target.index(obj)
             target.append(obj)
+            return len(target) - 1
+
+        index_by_key = self.__unique_indices.setdefault(id(target), {})
+        index = index_by_key.get(key)
+        if index is not None:
+            self.__count_dedup(obj)
             return index
 
+        index = len(target)
+        target.append(obj)
+        index_by_key[key] = index
+        return index
+
+    def __get_unique_key(self, obj):
+        """
+        Get the key identifying obj in a list of unique objects, or None if obj is not hashable.
+
+        glTF properties have no __eq__, so they are their own key and are compared by identity, unless content
+        deduplication is enabled for their type.
+        """
+        if self.__dedup_content and type(obj) in self.__contentIndexedTypes:
+            try:
+                return type(obj), self.__get_content_key(obj)
+            except TypeError:
+                pass
+        try:
+            hash(obj)
+        except TypeError:
+            return None
+        return obj
+
+    @classmethod
+    def __get_content_key(cls, value):
+        """Get a hashable key equal for equal values. Raises TypeError for values which can not be hashed."""
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.__get_content_key(v) for v in value)
+        if isinstance(value, dict):
+            return tuple(sorted((k, cls.__get_content_key(v)) for k, v in value.items()))
+        if hasattr(value, '_fields'):
+            return type(value), tuple(cls.__get_content_key(getattr(value, field[0])) for field in value._fields)
+        hash(value)
+        return value
+
+    def __count_dedup(self, obj):
+        if type(obj) not in self.__childOfRootPropertyTypeLookup:
+            return
+        type_name = type(obj).__name__
+        self.__dedup_counts[type_name] = self.__dedup_counts.get(type_name, 0) + 1
+
     def __add_image(self, image: gltf2_io_image_data.ImageData):
         name = image.adjusted_name()
         count = 1
@@ -262,7 +342,7 @@ class GlTF2Exporter:
         is stored in the according list in the glTF and replaced with a index reference in the upper level.
         """
         def __traverse_property(node):
-            for member_name in [a for a in dir(node) if not a.startswith('__') and not callable(getattr(node, a))]:
+            for member_name, _key, _to_json, _from_json in node._fields:
                 new_value = self.__traverse(getattr(node, member_name))
                 setattr(node, member_name, new_value)  # usually this is the same as before
 
@@ -297,7 +377,14 @@ class GlTF2Exporter:
 
         # binary data needs to be moved to a buffer and referenced with a buffer view
         if isinstance(node, gltf2_io_binary_data.BinaryData):
-            buffer_view = self.__buffer.add_and_get_view(node)
+            if self.__dedup_content:
+                # Equal data is written once, and shares its buffer view, so that equal accessors can be merged too
+                buffer_view = self.__buffer_views_by_data.get(node.data)
+                if buffer_view is None:
+                    buffer_view = self.__buffer.add_and_get_view(node)
+                    self.__buffer_views_by_data[node.data] = buffer_view
+            else:
+                buffer_view = self.__buffer.add_and_get_view(node)
             return self.__to_reference(buffer_view)
 
         # image data needs to be saved to file
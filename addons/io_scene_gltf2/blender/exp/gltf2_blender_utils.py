@@ -42,6 +42,9 @@ def max_components(l: list, data_type: gltf2_io_constants.DataType) -> list:
     :param data_type: the data type of the list (determines the length of the result)
     :return: a list with length num_elements(data_type) containing the maximum per component along the list
     """
+    if hasattr(l, 'dtype'):
+        num_elements = gltf2_io_constants.DataType.num_elements(data_type)
+        return [float(c) for c in l.reshape(-1, num_elements).max(axis=0)]
     components_lists = split_list_by_data_type(l, data_type)
     result = [-math.inf] * gltf2_io_constants.DataType.num_elements(data_type)
     for components in components_lists:
@@ -59,6 +62,9 @@ def min_components(l: list, data_type: gltf2_io_constants.DataType) -> list:
     :param data_type: the data type of the list (determines the length of the result)
     :return: a list with length num_elements(data_type) containing the minimum per component along the list
     """
+    if hasattr(l, 'dtype'):
+        num_elements = gltf2_io_constants.DataType.num_elements(data_type)
+        return [float(c) for c in l.reshape(-1, num_elements).min(axis=0)]
     components_lists = split_list_by_data_type(l, data_type)
     result = [math.inf] * gltf2_io_constants.DataType.num_elements(data_type)
     for components in components_lists:
@@ -45,9 +45,9 @@ class BlenderAnimation():
         node = gltf.data.nodes[node_idx]
 
         if node.is_joint:
-            obj = bpy.data.objects[gltf.data.skins[node.skin_id].blender_armature_name]
+            obj = gltf.blender_objects[gltf.data.skins[node.skin_id].blender_armature_name]
         else:
-            obj = bpy.data.objects[node.blender_object]
+            obj = gltf.blender_objects[node.blender_object]
 
         restore_animation_on_object(obj, animation_name)
         if obj.data and hasattr(obj.data, 'shape_keys'):
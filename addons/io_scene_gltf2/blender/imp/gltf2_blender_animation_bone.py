@@ -32,8 +32,8 @@ class BlenderBoneAnim():
         blender_path = "pose.bones[" + json.dumps(bone.name) + "].location"
         group_name = bone.name
 
-        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input, cache=True)
+        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output, cache=True)
         if bpy.app.version < (2, 80, 0):
             inv_bind_matrix = node.blender_bone_matrix.to_quaternion().to_matrix().to_4x4().inverted() \
                 * Matrix.Translation(node.blender_bone_matrix.to_translation()).inverted()
@@ -86,8 +86,8 @@ class BlenderBoneAnim():
         blender_path = "pose.bones[" + json.dumps(bone.name) + "].rotation_quaternion"
         group_name = bone.name
 
-        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input, cache=True)
+        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output, cache=True)
         bind_rotation = node.blender_bone_matrix.to_quaternion()
 
         if animation.samplers[channel.sampler].interpolation == "CUBICSPLINE":
@@ -158,8 +158,8 @@ class BlenderBoneAnim():
         blender_path = "pose.bones[" + json.dumps(bone.name) + "].scale"
         group_name = bone.name
 
-        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input, cache=True)
+        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output, cache=True)
         bind_scale = scale_to_matrix(node.blender_bone_matrix.to_scale())
 
         if animation.samplers[channel.sampler].interpolation == "CUBICSPLINE":
@@ -231,7 +231,7 @@ class BlenderBoneAnim():
         """Manage animation."""
         node = gltf.data.nodes[node_idx]
         blender_armature_name = gltf.data.skins[node.skin_id].blender_armature_name
-        obj = bpy.data.objects[blender_armature_name]
+        obj = gltf.blender_objects[blender_armature_name]
         bone = obj.pose.bones[node.blender_bone_name]
 
         if anim_idx not in node.animations.keys():
@@ -30,7 +30,7 @@ class BlenderNodeAnim():
     def anim(gltf, anim_idx, node_idx):
         """Manage animation."""
         node = gltf.data.nodes[node_idx]
-        obj = bpy.data.objects[node.blender_object]
+        obj = gltf.blender_objects[node.blender_object]
         fps = bpy.context.scene.render.fps
 
         animation = gltf.data.animations[anim_idx]
@@ -56,8 +56,8 @@ class BlenderNodeAnim():
         for channel_idx in node.animations[anim_idx]:
             channel = animation.channels[channel_idx]
 
-            keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-            values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+            keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input, cache=True)
+            values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output, cache=True)
 
             if channel.target.path not in ['translation', 'rotation', 'scale']:
                 continue
@@ -28,7 +28,7 @@ class BlenderWeightAnim():
     def anim(gltf, anim_idx, node_idx):
         """Manage animation."""
         node = gltf.data.nodes[node_idx]
-        obj = bpy.data.objects[node.blender_object]
+        obj = gltf.blender_objects[node.blender_object]
         fps = bpy.context.scene.render.fps
 
         animation = gltf.data.animations[anim_idx]
@@ -52,8 +52,8 @@ class BlenderWeightAnim():
             obj.data.shape_keys.animation_data_create()
         obj.data.shape_keys.animation_data.action = action
 
-        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input, cache=True)
+        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output, cache=True)
 
         # retrieve number of targets
         pymesh = gltf.data.meshes[gltf.data.nodes[node_idx].mesh]
@@ -14,6 +14,7 @@
 
 import bpy
 from .gltf2_blender_scene import BlenderScene
+from ...io.com.gltf2_io import LazyPropertyList
 from ...io.com.gltf2_io_trs import TRS
 
 
@@ -126,94 +127,34 @@ class BlenderGlTF():
         # default scene used
         gltf.blender_scene = None
 
+        # Blender objects created by the import, by name
+        gltf.blender_objects = {}
+
+        # (object, parent joint node index) of the objects to parent to bones, once the bones are created
+        gltf.bone_parented_objects = []
+
         # Check if there is animation on object
         # Init is to False, and will be set to True during creation
         gltf.animation_object = False
 
         # Blender material
         if gltf.data.materials:
-            for material in gltf.data.materials:
-                material.blender_material = {}
-
-                if material.pbr_metallic_roughness:
-                    # Init
-                    material.pbr_metallic_roughness.color_type = gltf.SIMPLE
-                    material.pbr_metallic_roughness.vertex_color = False
-                    material.pbr_metallic_roughness.metallic_type = gltf.SIMPLE
-
-                    if material.pbr_metallic_roughness.base_color_texture:
-                        material.pbr_metallic_roughness.color_type = gltf.TEXTURE
-
-                    if material.pbr_metallic_roughness.metallic_roughness_texture:
-                        material.pbr_metallic_roughness.metallic_type = gltf.TEXTURE
-
-                    if material.pbr_metallic_roughness.base_color_factor:
-                        if material.pbr_metallic_roughness.color_type == gltf.TEXTURE and \
-                                material.pbr_metallic_roughness.base_color_factor != [1.0, 1.0, 1.0, 1.0]:
-                            material.pbr_metallic_roughness.color_type = gltf.TEXTURE_FACTOR
-                    else:
-                        material.pbr_metallic_roughness.base_color_factor = [1.0, 1.0, 1.0, 1.0]
-
-                    if material.pbr_metallic_roughness.metallic_factor is not None:
-                        if material.pbr_metallic_roughness.metallic_type == gltf.TEXTURE \
-                                and material.pbr_metallic_roughness.metallic_factor != 1.0:
-                            material.pbr_metallic_roughness.metallic_type = gltf.TEXTURE_FACTOR
-                    else:
-                        material.pbr_metallic_roughness.metallic_factor = 1.0
-
-                    if material.pbr_metallic_roughness.roughness_factor is not None:
-                        if material.pbr_metallic_roughness.metallic_type == gltf.TEXTURE \
-                                and material.pbr_metallic_roughness.roughness_factor != 1.0:
-                            material.pbr_metallic_roughness.metallic_type = gltf.TEXTURE_FACTOR
-                    else:
-                        material.pbr_metallic_roughness.roughness_factor = 1.0
-
-                # pre compute material for KHR_materials_pbrSpecularGlossiness
-                if material.extensions is not None \
-                        and 'KHR_materials_pbrSpecularGlossiness' in material.extensions.keys():
-                    # Init
-                    material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuse_type'] = gltf.SIMPLE
-                    material.extensions['KHR_materials_pbrSpecularGlossiness']['vertex_color'] = False
-                    material.extensions['KHR_materials_pbrSpecularGlossiness']['specgloss_type'] = gltf.SIMPLE
-
-                    if 'diffuseTexture' in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
-                        material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuse_type'] = gltf.TEXTURE
-
-                    if 'diffuseFactor' in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
-                        if material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuse_type'] == gltf.TEXTURE \
-                                and material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuseFactor'] != \
-                                [1.0, 1.0, 1.0, 1.0]:
-                            material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuse_type'] = \
-                                gltf.TEXTURE_FACTOR
-                    else:
-                        material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuseFactor'] = \
-                            [1.0, 1.0, 1.0, 1.0]
-
-                    if 'specularGlossinessTexture' in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
-                        material.extensions['KHR_materials_pbrSpecularGlossiness']['specgloss_type'] = gltf.TEXTURE
-
-                    if 'specularFactor' in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
-                        if material.extensions['KHR_materials_pbrSpecularGlossiness']['specgloss_type'] == \
-                                gltf.TEXTURE \
-                                and material.extensions['KHR_materials_pbrSpecularGlossiness']['specularFactor'] != \
-                                [1.0, 1.0, 1.0]:
-                            material.extensions['KHR_materials_pbrSpecularGlossiness']['specgloss_type'] = \
-                                gltf.TEXTURE_FACTOR
-                    else:
-                        material.extensions['KHR_materials_pbrSpecularGlossiness']['specularFactor'] = [1.0, 1.0, 1.0]
-
-                    if 'glossinessFactor' not in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
-                        material.extensions['KHR_materials_pbrSpecularGlossiness']['glossinessFactor'] = 1.0
+            BlenderGlTF.for_each_property(
+                gltf.data.materials,
+                lambda material: BlenderGlTF.pre_compute_material(gltf, material)
+            )
 
         # images
+        gltf.image_paths = None  # resolved path -> name of Blender image loaded from this file, built when needed
         if gltf.data.images is not None:
-            for img in gltf.data.images:
-                img.blender_image_name = None
+            BlenderGlTF.for_each_property(gltf.data.images, BlenderGlTF.pre_compute_image)
 
         if gltf.data.nodes is None:
             # Something is wrong in file, there is no nodes
             return
 
+        # Nodes, skins and animations are read here even with a lazy glTF: skins need the list of their skinned
+        # nodes, and nodes the list of their animation channels. Only the other root arrays stay lazy.
         for node_idx, node in enumerate(gltf.data.nodes):
 
             # Weight animation management
@@ -252,11 +193,11 @@ class BlenderGlTF():
 
 
         # joint management
+        gltf.compute_joint_index()
         for node_idx, node in enumerate(gltf.data.nodes):
-            is_joint, skin_idx = gltf.is_node_joint(node_idx)
-            if is_joint:
+            if node_idx in gltf.joint_index:
                 node.is_joint = True
-                node.skin_id = skin_idx
+                node.skin_id = gltf.joint_index[node_idx][0]
             else:
                 node.is_joint = False
 
@@ -264,6 +205,7 @@ class BlenderGlTF():
             for skin_id, skin in enumerate(gltf.data.skins):
                 # init blender values
                 skin.blender_armature_name = None
+                skin.pending_bones = []  # (node index, parent node index) of bones to create
                 # if skin.skeleton and skin.skeleton not in skin.joints:
                 #     gltf.data.nodes[skin.skeleton].is_joint = True
                 #     gltf.data.nodes[skin.skeleton].skin_id  = skin_id
@@ -294,38 +236,134 @@ class BlenderGlTF():
 
         # Meshes
         if gltf.data.meshes:
-            for mesh in gltf.data.meshes:
-                mesh.blender_name = None
-                mesh.is_weight_animated = False
-
-        # Calculate names for each mesh's shapekeys
-        for mesh in gltf.data.meshes or []:
-            mesh.shapekey_names = []
-            used_names = set()
-
-            # Some invalid glTF files has empty primitive tab
-            if len(mesh.primitives) > 0:
-                for sk, target in enumerate(mesh.primitives[0].targets or []):
-                    if 'POSITION' not in target:
-                        mesh.shapekey_names.append(None)
-                        continue
+            BlenderGlTF.for_each_property(gltf.data.meshes, lambda mesh: BlenderGlTF.pre_compute_mesh(gltf, mesh))
+
+    @staticmethod
+    def for_each_property(properties, func):
+        """
+        Call func on each property of a root array.
+
+        With a lazy glTF, func is called on each property only when it is created.
+        """
+        if isinstance(properties, LazyPropertyList):
+            properties.add_initializer(func)
+        else:
+            for property_ in properties:
+                func(property_)
+
+    @staticmethod
+    def pre_compute_material(gltf, material):
+        """Pre compute a material."""
+        material.blender_material = {}
+
+        if material.pbr_metallic_roughness:
+            # Init
+            material.pbr_metallic_roughness.color_type = gltf.SIMPLE
+            material.pbr_metallic_roughness.vertex_color = False
+            material.pbr_metallic_roughness.metallic_type = gltf.SIMPLE
+
+            if material.pbr_metallic_roughness.base_color_texture:
+                material.pbr_metallic_roughness.color_type = gltf.TEXTURE
+
+            if material.pbr_metallic_roughness.metallic_roughness_texture:
+                material.pbr_metallic_roughness.metallic_type = gltf.TEXTURE
+
+            if material.pbr_metallic_roughness.base_color_factor:
+                if material.pbr_metallic_roughness.color_type == gltf.TEXTURE and \
+                        material.pbr_metallic_roughness.base_color_factor != [1.0, 1.0, 1.0, 1.0]:
+                    material.pbr_metallic_roughness.color_type = gltf.TEXTURE_FACTOR
+            else:
+                material.pbr_metallic_roughness.base_color_factor = [1.0, 1.0, 1.0, 1.0]
+
+            if material.pbr_metallic_roughness.metallic_factor is not None:
+                if material.pbr_metallic_roughness.metallic_type == gltf.TEXTURE \
+                        and material.pbr_metallic_roughness.metallic_factor != 1.0:
+                    material.pbr_metallic_roughness.metallic_type = gltf.TEXTURE_FACTOR
+            else:
+                material.pbr_metallic_roughness.metallic_factor = 1.0
+
+            if material.pbr_metallic_roughness.roughness_factor is not None:
+                if material.pbr_metallic_roughness.metallic_type == gltf.TEXTURE \
+                        and material.pbr_metallic_roughness.roughness_factor != 1.0:
+                    material.pbr_metallic_roughness.metallic_type = gltf.TEXTURE_FACTOR
+            else:
+                material.pbr_metallic_roughness.roughness_factor = 1.0
+
+        # pre compute material for KHR_materials_pbrSpecularGlossiness
+        if material.extensions is not None \
+                and 'KHR_materials_pbrSpecularGlossiness' in material.extensions.keys():
+            # Init
+            material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuse_type'] = gltf.SIMPLE
+            material.extensions['KHR_materials_pbrSpecularGlossiness']['vertex_color'] = False
+            material.extensions['KHR_materials_pbrSpecularGlossiness']['specgloss_type'] = gltf.SIMPLE
+
+            if 'diffuseTexture' in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
+                material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuse_type'] = gltf.TEXTURE
+
+            if 'diffuseFactor' in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
+                if material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuse_type'] == gltf.TEXTURE \
+                        and material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuseFactor'] != \
+                        [1.0, 1.0, 1.0, 1.0]:
+                    material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuse_type'] = \
+                        gltf.TEXTURE_FACTOR
+            else:
+                material.extensions['KHR_materials_pbrSpecularGlossiness']['diffuseFactor'] = \
+                    [1.0, 1.0, 1.0, 1.0]
+
+            if 'specularGlossinessTexture' in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
+                material.extensions['KHR_materials_pbrSpecularGlossiness']['specgloss_type'] = gltf.TEXTURE
+
+            if 'specularFactor' in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
+                if material.extensions['KHR_materials_pbrSpecularGlossiness']['specgloss_type'] == \
+                        gltf.TEXTURE \
+                        and material.extensions['KHR_materials_pbrSpecularGlossiness']['specularFactor'] != \
+                        [1.0, 1.0, 1.0]:
+                    material.extensions['KHR_materials_pbrSpecularGlossiness']['specgloss_type'] = \
+                        gltf.TEXTURE_FACTOR
+            else:
+                material.extensions['KHR_materials_pbrSpecularGlossiness']['specularFactor'] = [1.0, 1.0, 1.0]
+
+            if 'glossinessFactor' not in material.extensions['KHR_materials_pbrSpecularGlossiness'].keys():
+                material.extensions['KHR_materials_pbrSpecularGlossiness']['glossinessFactor'] = 1.0
+
+    @staticmethod
+    def pre_compute_image(img):
+        """Pre compute an image."""
+        img.blender_image_name = None
+
+    @staticmethod
+    def pre_compute_mesh(gltf, mesh):
+        """Pre compute a mesh."""
+        mesh.blender_name = None
+        mesh.is_weight_animated = False
+
+        # Calculate names for shapekeys
+        mesh.shapekey_names = []
+        used_names = set()
+
+        # Some invalid glTF files has empty primitive tab
+        if len(mesh.primitives) > 0:
+            for sk, target in enumerate(mesh.primitives[0].targets or []):
+                if 'POSITION' not in target:
+                    mesh.shapekey_names.append(None)
+                    continue
 
-                    # Check if glTF file has some extras with targetNames. Otherwise
-                    # use the name of the POSITION accessor on the first primitive.
-                    shapekey_name = None
-                    if mesh.extras is not None:
-                        if 'targetNames' in mesh.extras and sk < len(mesh.extras['targetNames']):
-                            shapekey_name = mesh.extras['targetNames'][sk]
-                    if shapekey_name is None:
-                        if gltf.data.accessors[target['POSITION']].name is not None:
-                            shapekey_name = gltf.data.accessors[target['POSITION']].name
-                    if shapekey_name is None:
-                        shapekey_name = "target_" + str(sk)
-
-                    shapekey_name = BlenderGlTF.find_unused_name(used_names, shapekey_name)
-                    used_names.add(shapekey_name)
-
-                    mesh.shapekey_names.append(shapekey_name)
+                # Check if glTF file has some extras with targetNames. Otherwise
+                # use the name of the POSITION accessor on the first primitive.
+                shapekey_name = None
+                if mesh.extras is not None:
+                    if 'targetNames' in mesh.extras and sk < len(mesh.extras['targetNames']):
+                        shapekey_name = mesh.extras['targetNames'][sk]
+                if shapekey_name is None:
+                    if gltf.data.accessors[target['POSITION']].name is not None:
+                        shapekey_name = gltf.data.accessors[target['POSITION']].name
+                if shapekey_name is None:
+                    shapekey_name = "target_" + str(sk)
+
+                shapekey_name = BlenderGlTF.find_unused_name(used_names, shapekey_name)
+                used_names.add(shapekey_name)
+
+                mesh.shapekey_names.append(shapekey_name)
 
     @staticmethod
     def find_unused_name(haystack, desired_name):
@@ -69,36 +69,59 @@ class BlenderImage():
             if real is True:
 
                 # Check if image is already loaded
-                for img_ in bpy.data.images:
-                    if img_.filepath == path:
-                        # Already loaded, not needed to reload it
-                        img.blender_image_name = img_.name
-                        return
+                loaded_name = BlenderImage.get_loaded_image_name(gltf, path)
+                if loaded_name is not None:
+                    # Already loaded, not needed to reload it
+                    img.blender_image_name = loaded_name
+                    return
 
                 blender_image = bpy.data.images.load(path)
                 blender_image.name = img_name
                 img.blender_image_name = blender_image.name
+                gltf.image_paths[BlenderImage.resolve_path(path)] = blender_image.name
                 return
 
-        # Check if the file is already loaded (packed file)
-        file_creation_needed = True
-        for img_ in bpy.data.images:
-            if hasattr(img_, "gltf_index") and img_['gltf_index'] == img_idx:
-                file_creation_needed = False
-                img.blender_image_name = img_.name
-                break
+        img_data, img_name = BinaryData.get_image_data(gltf, img_idx)
+        if img_name is not None:
+            blender_image = BlenderImage.create_packed(img_data, img_name)
+            img.blender_image_name = blender_image.name
+            blender_image['gltf_index'] = img_idx
 
-        if file_creation_needed is True:
-            # Create a temp image, pack, and delete image
+    @staticmethod
+    def create_packed(img_data, img_name):
+        """Create a packed image from the bytes of an image file, without writing them to a file."""
+        if bpy.app.version < (2, 80, 0):
+            # Image.pack can't take the data yet: load the image from a temp file, pack, and delete the file
             tmp_image = tempfile.NamedTemporaryFile(delete=False)
-            img_data, img_name = BinaryData.get_image_data(gltf, img_idx)
-            if img_name is not None:
-                tmp_image.write(img_data)
-                tmp_image.close()
+            tmp_image.write(img_data)
+            tmp_image.close()
+
+            blender_image = bpy.data.images.load(tmp_image.name)
+            blender_image.pack()
+            blender_image.name = img_name
+            os.remove(tmp_image.name)
+            return blender_image
+
+        img_data = bytes(img_data)
+        blender_image = bpy.data.images.new(img_name, 1, 1)
+        blender_image.pack(data=img_data, data_len=len(img_data))
+        # Read the image from the packed data instead of generating it
+        blender_image.source = 'FILE'
+        return blender_image
 
-                blender_image = bpy.data.images.load(tmp_image.name)
-                blender_image.pack()
-                blender_image.name = img_name
-                img.blender_image_name = blender_image.name
-                blender_image['gltf_index'] = img_idx
-                os.remove(tmp_image.name)
+    @staticmethod
+    def get_loaded_image_name(gltf, path):
+        """Return the name of the Blender image loaded from path, or None."""
+        if gltf.image_paths is None:
+            # Index the images of the .blend file once per import
+            gltf.image_paths = {}
+            for img_ in bpy.data.images:
+                if img_.filepath:
+                    gltf.image_paths.setdefault(BlenderImage.resolve_path(img_.filepath), img_.name)
+
+        return gltf.image_paths.get(BlenderImage.resolve_path(path))
+
+    @staticmethod
+    def resolve_path(path):
+        """Absolute and normalized path, to compare paths of image files."""
+        return os.path.normcase(os.path.normpath(bpy.path.abspath(path)))
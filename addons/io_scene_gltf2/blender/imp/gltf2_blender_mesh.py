@@ -14,12 +14,14 @@
 
 import bpy
 import bmesh
+import numpy as np
 from mathutils import Vector
 
 from ..com.gltf2_blender_extras import set_extras
 from .gltf2_blender_material import BlenderMaterial
 from .gltf2_blender_primitive import BlenderPrimitive
 from ...io.imp.gltf2_io_binary import BinaryData
+from ...io.com.gltf2_io_color_management import colors_linear_to_srgb
 from ..com.gltf2_blender_conversion import loc_gltf_to_blender
 
 
@@ -33,15 +35,12 @@ class BlenderMesh():
         """Mesh creation."""
         pymesh = gltf.data.meshes[mesh_idx]
 
-        # Create one bmesh, add all primitives to it, and then convert it to a
-        # mesh.
-        bme = bmesh.new()
-
         # List of all the materials this mesh will use. The material each
         # primitive uses is set by giving an index into this list.
         materials = []
+        # Index into materials for each primitive
+        material_idxs = []
 
-        # Process all primitives
         for prim in pymesh.primitives:
             if prim.material is None:
                 material_idx = None
@@ -64,12 +63,31 @@ class BlenderMesh():
                     materials.append(material.name)
                     material_idx = len(materials) - 1
 
-            BlenderPrimitive.add_primitive_to_bmesh(gltf, bme, pymesh, prim, material_idx)
+            material_idxs.append(material_idx)
 
         name = pymesh.name or 'Mesh_' + str(mesh_idx)
         mesh = bpy.data.meshes.new(name)
-        BlenderMesh.bmesh_to_mesh(gltf, pymesh, bme, mesh)
-        bme.free()
+
+        # Decode all primitives, and build the mesh in bulk from the arrays. Some
+        # topology (lines, degenerate or duplicate faces) needs BMesh though: in
+        # that case, add all primitives to one bmesh and convert it to a mesh.
+        prims_data = []
+        for prim in pymesh.primitives:
+            data = BlenderPrimitive.read_primitive(gltf, pymesh, prim)
+            if data is None:
+                prims_data = None
+                break
+            prims_data.append(data)
+
+        if prims_data is not None:
+            BlenderMesh.arrays_to_mesh(gltf, pymesh, prims_data, material_idxs, mesh)
+        else:
+            bme = bmesh.new()
+            for prim, material_idx in zip(pymesh.primitives, material_idxs):
+                BlenderPrimitive.add_primitive_to_bmesh(gltf, bme, pymesh, prim, material_idx)
+            BlenderMesh.bmesh_to_mesh(gltf, pymesh, bme, mesh)
+            bme.free()
+
         for name_material in materials:
             mesh.materials.append(bpy.data.materials[name_material])
         mesh.update()
@@ -78,9 +96,6 @@ class BlenderMesh():
 
         pymesh.blender_name = mesh.name
 
-        # Clear accessor cache after all primitives are done
-        gltf.accessor_cache = {}
-
         return mesh
 
     @staticmethod
@@ -161,3 +176,188 @@ class BlenderMesh():
             custom_normals = [v.normal for v in bme.verts]
             mesh.normals_split_custom_set_from_vertices(custom_normals)
             mesh.use_auto_smooth = True
+
+    @staticmethod
+    def arrays_to_mesh(gltf, pymesh, prims_data, material_idxs, mesh):
+        """Build the mesh from decoded primitives, in bulk with foreach_set."""
+        # Vertices of each primitive are added after those of the previous
+        # primitives; vertices are not shared between primitives.
+        num_verts = sum(len(data['pidxs']) for data in prims_data)
+        num_faces = sum(len(data['tris']) for data in prims_data)
+        num_loops = 3 * num_faces
+
+        vert_cos = np.empty((num_verts, 3), dtype=np.float32)
+        vert_normals = np.zeros((num_verts, 3), dtype=np.float32)
+        loop_vidxs = np.empty(num_loops, dtype=np.int32)
+        face_materials = np.zeros(num_faces, dtype=np.int32)
+        has_normals = np.zeros(num_faces, dtype=bool)
+
+        num_uv_sets = max([len(data.get('uvs', [])) for data in prims_data] + [0])
+        num_color_sets = max([len(data.get('colors', [])) for data in prims_data] + [0])
+        loop_uvs = [np.zeros((num_loops, 2), dtype=np.float32) for _ in range(num_uv_sets)]
+        loop_colors = [np.ones((num_loops, 4), dtype=np.float32) for _ in range(num_color_sets)]
+
+        num_joints = 0
+        # For each set of influences: (vertex indices, joints, weights)
+        skin_weights = []
+
+        # For each shapekey: (first vertex, end vertex, morphed positions) of
+        # each primitive with that morph target. Other vertices keep the basis position.
+        shapekey_ranges = {name: [] for name in pymesh.shapekey_names if name is not None}
+
+        vert_offset = 0
+        face_offset = 0
+        for prim, data, material_idx in zip(pymesh.primitives, prims_data, material_idxs):
+            pidxs = data['pidxs']
+            tris = data['tris']
+            vert_end = vert_offset + len(pidxs)
+            face_end = face_offset + len(tris)
+            loop_start, loop_end = 3 * face_offset, 3 * face_end
+            prim.num_faces = len(tris)
+
+            if len(pidxs) == 0:
+                continue
+
+            # pidxs are sorted: the bidx of a pidx is its rank in pidxs
+            loop_pidxs = tris.reshape(-1)
+            loop_vidxs[loop_start:loop_end] = np.searchsorted(pidxs, loop_pidxs) + vert_offset
+
+            if material_idx is not None:
+                face_materials[face_offset:face_end] = material_idx
+
+            vert_cos[vert_offset:vert_end] = data['positions'][pidxs]
+
+            if data['normals'] is not None:
+                vert_normals[vert_offset:vert_end] = data['normals'][pidxs]
+                has_normals[face_offset:face_end] = True
+
+            for set_num, uvs in enumerate(data['uvs']):
+                # UV transform
+                loop_uvs[set_num][loop_start:loop_end, 0] = uvs[loop_pidxs, 0]
+                loop_uvs[set_num][loop_start:loop_end, 1] = 1 - uvs[loop_pidxs, 1]
+
+            for set_num, colors in enumerate(data['colors']):
+                colors = colors[loop_pidxs]
+                loop_colors[set_num][loop_start:loop_end, :3] = colors_linear_to_srgb(colors[:, :3])
+                if colors.shape[1] == 4:
+                    loop_colors[set_num][loop_start:loop_end, 3] = colors[:, 3]
+
+            for joints, weights in zip(data['joints'], data['weights']):
+                joints = joints[pidxs]
+                num_joints = max(num_joints, int(joints.max()) + 1)
+                skin_weights.append((np.arange(vert_offset, vert_end), joints, weights[pidxs]))
+
+            for sk, morphs in enumerate(data['morphs']):
+                if morphs is None:
+                    continue
+                shapekey_ranges[pymesh.shapekey_names[sk]].append(
+                    (vert_offset, vert_end, data['positions'][pidxs] + morphs[pidxs])
+                )
+
+            vert_offset = vert_end
+            face_offset = face_end
+
+        mesh.vertices.add(num_verts)
+        mesh.vertices.foreach_set('co', vert_cos.reshape(-1))
+
+        mesh.loops.add(num_loops)
+        mesh.loops.foreach_set('vertex_index', loop_vidxs)
+
+        mesh.polygons.add(num_faces)
+        mesh.polygons.foreach_set('loop_start', np.arange(0, num_loops, 3, dtype=np.int32))
+        mesh.polygons.foreach_set('loop_total', np.full(num_faces, 3, dtype=np.int32))
+        mesh.polygons.foreach_set('material_index', face_materials)
+
+        mesh.update(calc_edges=True)
+
+        for set_num, uvs in enumerate(loop_uvs):
+            layer_name = 'UVMap' if set_num == 0 else 'UVMap.%03d' % set_num
+            if bpy.app.version < (2, 80, 0):
+                mesh.uv_textures.new(layer_name)
+            else:
+                mesh.uv_layers.new(name=layer_name)
+            mesh.uv_layers[layer_name].data.foreach_set('uv', uvs.reshape(-1))
+
+        for set_num, colors in enumerate(loop_colors):
+            layer_name = 'Col' if set_num == 0 else 'Col.%03d' % set_num
+            layer = mesh.vertex_colors.new(name=layer_name)
+            # Check whether Blender takes RGB or RGBA colors (old versions only take RGB)
+            if bpy.app.version < (2, 80, 0):
+                colors = colors[:, :3]
+            layer.data.foreach_set('color', np.ascontiguousarray(colors).reshape(-1))
+
+        # Shapekeys and skin weights can only be set through an object, so
+        # temporarily parent the mesh to one.
+        has_shapekeys = any(shapekey_ranges.values())
+        if has_shapekeys or skin_weights:
+            tmp_ob = None
+            try:
+                tmp_ob = bpy.data.objects.new('##gltf-import:tmp-object##', mesh)
+
+                if has_shapekeys:
+                    tmp_ob.shape_key_add(name='Basis')
+                    mesh.shape_keys.name = mesh.name
+                    for name, ranges in shapekey_ranges.items():
+                        if not ranges:
+                            continue
+                        tmp_ob.shape_key_add(name=name)
+                        cos = vert_cos.copy()
+                        for start, end, morphed_cos in ranges:
+                            cos[start:end] = morphed_cos
+                        mesh.shape_keys.key_blocks[name].data.foreach_set('co', cos.reshape(-1))
+
+                if skin_weights:
+                    # Vertex group i is joint i; groups are created (and named) on
+                    # the real object later, and the weights stay on the mesh.
+                    vertex_groups = [tmp_ob.vertex_groups.new() for _ in range(num_joints)]
+                    for vidxs, joints, weights in skin_weights:
+                        for j in range(joints.shape[1]):
+                            used = weights[:, j] != 0.0
+                            BlenderMesh.add_weights(vertex_groups, vidxs[used], joints[used, j], weights[used, j])
+            finally:
+                if tmp_ob:
+                    bpy.data.objects.remove(tmp_ob)
+
+        # Normals
+        mesh.update()
+
+        if gltf.import_settings['import_shading'] == "NORMALS":
+            mesh.create_normals_split()
+
+        # use_smooth for faces
+        use_smooth = np.zeros(num_faces, dtype=bool)
+        if gltf.import_settings['import_shading'] == "FLAT":
+            pass
+        elif gltf.import_settings['import_shading'] == "SMOOTH":
+            use_smooth[has_normals] = True
+        elif gltf.import_settings['import_shading'] == "NORMALS":
+            # "Flat normals" are when all the vertices in poly have the poly's
+            # normal. Otherwise, smooth the poly.
+            poly_normals = np.empty(num_faces * 3, dtype=np.float32)
+            mesh.polygons.foreach_get('normal', poly_normals)
+            poly_normals = poly_normals.reshape(num_faces, 1, 3)
+            loop_normals = vert_normals[loop_vidxs].reshape(num_faces, 3, 3)
+            dots = np.sum(loop_normals * poly_normals, axis=2)
+            use_smooth = has_normals & np.any(dots <= 0.9999999, axis=1)
+        mesh.polygons.foreach_set('use_smooth', use_smooth)
+
+        # Custom normals, now that every update is done
+        if gltf.import_settings['import_shading'] == "NORMALS":
+            mesh.normals_split_custom_set_from_vertices(vert_normals)
+            mesh.use_auto_smooth = True
+
+    @staticmethod
+    def add_weights(vertex_groups, vidxs, joints, weights):
+        """Add skin weights, with one call per (joint, weight) value."""
+        if len(vidxs) == 0:
+            return
+
+        # Sort by joint then weight, and split in runs of equal values
+        order = np.lexsort((weights, joints))
+        vidxs, joints, weights = vidxs[order], joints[order], weights[order]
+        run_starts = np.flatnonzero(
+            np.concatenate(([True], (joints[1:] != joints[:-1]) | (weights[1:] != weights[:-1])))
+        )
+        run_ends = np.append(run_starts[1:], len(vidxs))
+        for start, end in zip(run_starts, run_ends):
+            vertex_groups[joints[start]].add(vidxs[start:end].tolist(), float(weights[start]), 'REPLACE')
@@ -19,6 +19,7 @@ from .gltf2_blender_camera import BlenderCamera
 from .gltf2_blender_skin import BlenderSkin
 from .gltf2_blender_light import BlenderLight
 from ..com.gltf2_blender_conversion import scale_to_matrix, matrix_gltf_to_blender, correction_rotation
+from ..com.gltf2_blender_math import multiply
 
 
 class BlenderNode():
@@ -92,6 +93,7 @@ class BlenderNode():
             if not (pynode.mesh is not None and pynode.skin is not None):
                 BlenderNode.set_transforms(gltf, node_idx, pynode, obj, parent)
             pynode.blender_object = obj.name
+            gltf.blender_objects[obj.name] = obj
             BlenderNode.set_parent(gltf, obj, parent)
 
             if instance == False:
@@ -112,6 +114,7 @@ class BlenderNode():
             set_extras(obj, pynode.extras)
             BlenderNode.set_transforms(gltf, node_idx, pynode, obj, parent)  # TODO default rotation of cameras ?
             pynode.blender_object = obj.name
+            gltf.blender_objects[obj.name] = obj
             BlenderNode.set_parent(gltf, obj, parent)
 
             if pynode.children:
@@ -144,6 +147,7 @@ class BlenderNode():
                 obj.rotation_mode = 'QUATERNION'
                 BlenderNode.set_transforms(gltf, node_idx, pynode, obj, parent, correction=True)
                 pynode.blender_object = obj.name
+                gltf.blender_objects[obj.name] = obj
                 pynode.correction_needed = True
                 BlenderNode.set_parent(gltf, obj, parent)
 
@@ -173,6 +177,7 @@ class BlenderNode():
 
         BlenderNode.set_transforms(gltf, node_idx, pynode, obj, parent)
         pynode.blender_object = obj.name
+        gltf.blender_objects[obj.name] = obj
         BlenderNode.set_parent(gltf, obj, parent)
 
         if pynode.children:
@@ -185,65 +190,82 @@ class BlenderNode():
         if parent is None:
             return
 
-        for node_idx, node in enumerate(gltf.data.nodes):
-            if node_idx == parent:
-                if node.is_joint is True:
-                    bpy.ops.object.select_all(action='DESELECT')
-                    if bpy.app.version < (2, 80, 0):
-                        bpy.data.objects[node.blender_armature_name].select = True
-                        bpy.context.scene.objects.active = bpy.data.objects[node.blender_armature_name]
-                    else:
-                        bpy.data.objects[node.blender_armature_name].select_set(True)
-                        bpy.context.view_layer.objects.active = bpy.data.objects[node.blender_armature_name]
-
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    bpy.data.objects[node.blender_armature_name].data.edit_bones.active = \
-                        bpy.data.objects[node.blender_armature_name].data.edit_bones[node.blender_bone_name]
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    bpy.ops.object.select_all(action='DESELECT')
-                    if bpy.app.version < (2, 80, 0):
-                        obj.select = True
-                        bpy.data.objects[node.blender_armature_name].select = True
-                        bpy.context.scene.objects.active = bpy.data.objects[node.blender_armature_name]
-                        bpy.context.scene.update()
-                    else:
-                        obj.select_set(True)
-                        bpy.data.objects[node.blender_armature_name].select_set(True)
-                        bpy.context.view_layer.objects.active = bpy.data.objects[node.blender_armature_name]
-                        bpy.context.view_layer.update()
-                    bpy.ops.object.parent_set(type='BONE_RELATIVE', keep_transform=True)
-                    # From world transform to local (-armature transform -bone transform)
-                    bone_trans = bpy.data.objects[node.blender_armature_name] \
-                        .pose.bones[node.blender_bone_name].matrix.to_translation().copy()
-                    bone_rot = bpy.data.objects[node.blender_armature_name] \
-                        .pose.bones[node.blender_bone_name].matrix.to_quaternion().copy()
-                    bone_scale_mat = scale_to_matrix(node.blender_bone_matrix.to_scale())
-                    if bpy.app.version < (2, 80, 0):
-                        obj.location = bone_scale_mat * obj.location
-                        obj.location = bone_rot * obj.location
-                        obj.location += bone_trans
-                        obj.location = bpy.data.objects[node.blender_armature_name].matrix_world.to_quaternion() \
-                            * obj.location
-                        obj.rotation_quaternion = obj.rotation_quaternion \
-                            * bpy.data.objects[node.blender_armature_name].matrix_world.to_quaternion()
-                        obj.scale = bone_scale_mat * obj.scale
-                    else:
-                        obj.location = bone_scale_mat @ obj.location
-                        obj.location = bone_rot @ obj.location
-                        obj.location += bone_trans
-                        obj.location = bpy.data.objects[node.blender_armature_name].matrix_world.to_quaternion() \
-                            @ obj.location
-                        obj.rotation_quaternion = obj.rotation_quaternion \
-                            @ bpy.data.objects[node.blender_armature_name].matrix_world.to_quaternion()
-                        obj.scale = bone_scale_mat @ obj.scale
-
-                    return
-                if node.blender_object:
-                    obj.parent = bpy.data.objects[node.blender_object]
-                    return
+        if parent >= len(gltf.data.nodes):
+            gltf.log.error("ERROR, parent not found")
+            return
+
+        node = gltf.data.nodes[parent]
+        if node.is_joint is True:
+            # Bones are created once the node hierarchy is built: objects are parented to them afterwards, by
+            # set_bone_parent
+            gltf.bone_parented_objects.append((obj, parent))
+            return
+        if node.blender_object:
+            obj.parent = gltf.blender_objects[node.blender_object]
+            return
 
         gltf.log.error("ERROR, parent not found")
 
+    @staticmethod
+    def set_bone_parent(gltf, obj, parent):
+        """Parent an object to the bone of a joint node, keeping its transform."""
+        node = gltf.data.nodes[parent]
+        armature = gltf.blender_objects[node.blender_armature_name]
+        pose_bone = armature.pose.bones[node.blender_bone_name]
+        armature_matrix = BlenderNode.get_world_matrix(armature)
+
+        # Relative bone parenting, like bpy.ops.object.parent_set(type='BONE_RELATIVE', keep_transform=True),
+        # but without operators and scene updates: the parent inverse cancels the parent matrix.
+        pose_bone.bone.use_relative_parent = True
+        obj.parent = armature
+        obj.parent_type = 'BONE'
+        obj.parent_bone = pose_bone.name
+        obj.matrix_parent_inverse = multiply(armature_matrix, pose_bone.matrix_basis).inverted_safe()
+
+        # From world transform to local (-armature transform -bone transform)
+        bone_matrix = BlenderNode.get_pose_bone_matrix(armature, pose_bone.name)
+        bone_trans = bone_matrix.to_translation()
+        bone_rot = bone_matrix.to_quaternion()
+        bone_scale_mat = scale_to_matrix(node.blender_bone_matrix.to_scale())
+        if bpy.app.version < (2, 80, 0):
+            obj.location = bone_scale_mat * obj.location
+            obj.location = bone_rot * obj.location
+            obj.location += bone_trans
+            obj.location = armature_matrix.to_quaternion() * obj.location
+            obj.rotation_quaternion = obj.rotation_quaternion * armature_matrix.to_quaternion()
+            obj.scale = bone_scale_mat * obj.scale
+        else:
+            obj.location = bone_scale_mat @ obj.location
+            obj.location = bone_rot @ obj.location
+            obj.location += bone_trans
+            obj.location = armature_matrix.to_quaternion() @ obj.location
+            obj.rotation_quaternion = obj.rotation_quaternion @ armature_matrix.to_quaternion()
+            obj.scale = bone_scale_mat @ obj.scale
+
+    @staticmethod
+    def get_world_matrix(obj):
+        """World matrix of an object, computed from its parents without updating the scene."""
+        if obj.parent is None:
+            return obj.matrix_basis.copy()
+
+        parent_matrix = BlenderNode.get_world_matrix(obj.parent)
+        if obj.parent_type == 'BONE' and obj.parent_bone in obj.parent.pose.bones:
+            # Objects are parented to bones with relative parenting (see set_parent)
+            parent_matrix = multiply(parent_matrix, obj.parent.pose.bones[obj.parent_bone].matrix_basis)
+        return multiply(multiply(parent_matrix, obj.matrix_parent_inverse), obj.matrix_basis)
+
+    @staticmethod
+    def get_pose_bone_matrix(armature, bone_name):
+        """Armature space matrix of a pose bone, computed from the bone channels without updating the scene."""
+        pose_bone = armature.pose.bones[bone_name]
+        bone = pose_bone.bone
+        matrix = multiply(bone.matrix_local, pose_bone.matrix_basis)
+        if bone.parent is None:
+            return matrix
+
+        parent_matrix = BlenderNode.get_pose_bone_matrix(armature, bone.parent.name)
+        return multiply(multiply(parent_matrix, bone.parent.matrix_local.inverted()), matrix)
+
     @staticmethod
     def set_transforms(gltf, node_idx, pynode, obj, parent, correction=False):
         """Set transforms."""
@@ -256,21 +278,20 @@ class BlenderNode():
                     obj.matrix_world = obj.matrix_world @ correction_rotation()
             return
 
-        for idx, node in enumerate(gltf.data.nodes):
-            if idx == parent:
-                if node.is_joint is True:
-                    obj.matrix_world = matrix_gltf_to_blender(pynode.transform)
-                    if correction is True:
-                        if bpy.app.version < (2, 80, 0):
-                            obj.matrix_world = obj.matrix_world * correction_rotation()
-                        else:
-                            obj.matrix_world = obj.matrix_world @ correction_rotation()
-                    return
+        if parent >= len(gltf.data.nodes):
+            return
+
+        if gltf.data.nodes[parent].is_joint is True:
+            obj.matrix_world = matrix_gltf_to_blender(pynode.transform)
+            if correction is True:
+                if bpy.app.version < (2, 80, 0):
+                    obj.matrix_world = obj.matrix_world * correction_rotation()
                 else:
-                    if correction is True:
-                        if bpy.app.version < (2, 80, 0):
-                            obj.matrix_world = obj.matrix_world * correction_rotation()
-                        else:
-                            obj.matrix_world = obj.matrix_world @ correction_rotation()
-                    obj.matrix_world = matrix_gltf_to_blender(pynode.transform)
-                    return
+                    obj.matrix_world = obj.matrix_world @ correction_rotation()
+        else:
+            if correction is True:
+                if bpy.app.version < (2, 80, 0):
+                    obj.matrix_world = obj.matrix_world * correction_rotation()
+                else:
+                    obj.matrix_world = obj.matrix_world @ correction_rotation()
+            obj.matrix_world = matrix_gltf_to_blender(pynode.transform)
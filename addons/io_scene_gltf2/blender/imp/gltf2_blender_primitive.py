@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import bpy
+import numpy as np
 from mathutils import Vector
 
 from .gltf2_blender_material import BlenderMaterial
@@ -36,6 +37,135 @@ class BlenderPrimitive():
             return bme_layers.new(name)
         return bme_layers[name]
 
+    @staticmethod
+    def read_primitive(gltf, pymesh, pyprimitive):
+        """Decode a primitive into arrays, for bulk mesh construction.
+
+        Attribute arrays are indexed by primitive vertex index (pidx); 'pidxs'
+        are the pidxs actually used, and 'tris' the faces, in terms of pidxs.
+        Returns None when the primitive must go through BMesh instead (lines,
+        degenerate or duplicate faces).
+        """
+        attributes = pyprimitive.attributes
+
+        if 'POSITION' not in attributes:
+            return {
+                'pidxs': np.empty(0, dtype=np.uint32),
+                'tris': np.empty((0, 3), dtype=np.uint32),
+            }
+
+        mode = 4 if pyprimitive.mode is None else pyprimitive.mode
+        if mode in [1, 2, 3]:
+            # Loose edges are left to BMesh
+            return None
+
+        positions = BinaryData.decode_accessor(gltf, attributes['POSITION'], cache=True)
+
+        if pyprimitive.indices is not None:
+            # Not using cache, this is not useful for indices
+            indices = BinaryData.decode_accessor(gltf, pyprimitive.indices)[:, 0]
+        else:
+            indices = np.arange(len(positions), dtype=np.uint32)
+
+        tris = BlenderPrimitive.triangles(mode, indices)
+
+        if len(tris) != 0:
+            # BMesh rejects degenerate and duplicate faces; let it do so
+            if np.any((tris[:, 0] == tris[:, 1]) | (tris[:, 1] == tris[:, 2]) | (tris[:, 2] == tris[:, 0])):
+                return None
+            sorted_tris = np.sort(tris, axis=1)
+            sorted_tris = sorted_tris[np.lexsort(sorted_tris.T)]
+            if np.any(np.all(sorted_tris[1:] == sorted_tris[:-1], axis=1)):
+                return None
+
+        data = {
+            'pidxs': np.unique(indices),
+            'tris': tris,
+            'positions': positions,
+            'normals': None,
+            'colors': [],
+            'uvs': [],
+            'joints': [],
+            'weights': [],
+            'morphs': [],
+        }
+
+        if 'NORMAL' in attributes:
+            data['normals'] = BinaryData.decode_accessor(gltf, attributes['NORMAL'], cache=True)
+
+        set_num = 0
+        while 'COLOR_%d' % set_num in attributes:
+            if set_num >= MAX_NUM_COLOR_SETS:
+                gltf2_io_debug.print_console("WARNING",
+                    "too many color sets; COLOR_%d will be ignored" % set_num
+                )
+                break
+            data['colors'].append(BinaryData.decode_accessor(gltf, attributes['COLOR_%d' % set_num], cache=True))
+            set_num += 1
+
+        set_num = 0
+        while 'TEXCOORD_%d' % set_num in attributes:
+            if set_num >= MAX_NUM_TEXCOORD_SETS:
+                gltf2_io_debug.print_console("WARNING",
+                    "too many UV sets; TEXCOORD_%d will be ignored" % set_num
+                )
+                break
+            data['uvs'].append(BinaryData.decode_accessor(gltf, attributes['TEXCOORD_%d' % set_num], cache=True))
+            set_num += 1
+
+        set_num = 0
+        while 'JOINTS_%d' % set_num in attributes and 'WEIGHTS_%d' % set_num in attributes:
+            data['joints'].append(BinaryData.decode_accessor(gltf, attributes['JOINTS_%d' % set_num], cache=True))
+            data['weights'].append(BinaryData.decode_accessor(gltf, attributes['WEIGHTS_%d' % set_num], cache=True))
+            set_num += 1
+
+        for sk, target in enumerate(pyprimitive.targets or []):
+            if pymesh.shapekey_names[sk] is None or 'POSITION' not in target:
+                data['morphs'].append(None)
+                continue
+            data['morphs'].append(BinaryData.decode_accessor(gltf, target['POSITION'], cache=True))
+
+        return data
+
+    @staticmethod
+    def triangles(mode, indices):
+        """Converts the indices of a triangle (or point) primitive into an
+        (n, 3) array of CCW triangles. Vectorized version of edges_and_faces.
+        """
+        indices = np.asarray(indices, dtype=np.uint32)
+
+        if mode == 0:
+            # POINTS
+            return np.empty((0, 3), dtype=np.uint32)
+
+        elif mode == 4:
+            # TRIANGLES
+            num_tris = len(indices) // 3
+            return indices[:3 * num_tris].reshape(num_tris, 3)
+
+        elif mode == 5:
+            # TRIANGLE STRIP
+            num_tris = max(len(indices) - 2, 0)
+            tris = np.empty((num_tris, 3), dtype=np.uint32)
+            tris[:, 0] = indices[:num_tris]
+            tris[:, 1] = indices[1:num_tris + 1]
+            tris[:, 2] = indices[2:num_tris + 2]
+            # Every other triangle is flipped
+            tris[1::2, 1], tris[1::2, 2] = tris[1::2, 2], tris[1::2, 1].copy()
+            return tris
+
+        elif mode == 6:
+            # TRIANGLE FAN
+            num_tris = max(len(indices) - 2, 0)
+            tris = np.empty((num_tris, 3), dtype=np.uint32)
+            tris[:, 0] = indices[0] if num_tris else 0
+            tris[:, 1] = indices[1:num_tris + 1]
+            tris[:, 2] = indices[2:num_tris + 2]
+            return tris
+
+        else:
+            raise Exception('primitive mode unimplemented: %d' % mode)
+
     @staticmethod
     def add_primitive_to_bmesh(gltf, bme, pymesh, pyprimitive, material_index):
         attributes = pyprimitive.attributes
@@ -48,8 +178,8 @@ class BlenderPrimitive():
 
         if pyprimitive.indices is not None:
             # Not using cache, this is not useful for indices
-            indices = BinaryData.get_data_from_accessor(gltf, pyprimitive.indices)
-            indices = [i[0] for i in indices]
+            indices = BinaryData.decode_accessor(gltf, pyprimitive.indices)
+            indices = indices[:, 0].tolist()
         else:
             indices = list(range(len(positions)))
 
@@ -100,6 +100,16 @@ class BlenderScene():
             for node_idx in list_nodes:
                 BlenderNode.create(gltf, node_idx, None)  # None => No parent
 
+        # Create the bones queued during node creation
+        if gltf.data.skins:
+            for skin_id in range(len(gltf.data.skins)):
+                BlenderSkin.create_bones(gltf, skin_id)
+
+        # Now that the bones exist, parent the objects whose parent node is a joint
+        for obj, parent in gltf.bone_parented_objects:
+            BlenderNode.set_bone_parent(gltf, obj, parent)
+        gltf.bone_parented_objects = []
+
         # Now that all mesh / bones are created, create vertex groups on mesh
         if gltf.data.skins:
             for skin_id, skin in enumerate(gltf.data.skins):
@@ -136,34 +146,39 @@ class BlenderScene():
                 for node_idx in list_nodes:
                     if gltf.data.nodes[node_idx].is_joint:
                         # Do not change parent if root node is already parented (can be the case for skinned mesh)
-                        if not bpy.data.objects[gltf.data.nodes[node_idx].blender_armature_name].parent:
-                            bpy.data.objects[gltf.data.nodes[node_idx].blender_armature_name].parent = obj_rotation
+                        if not gltf.blender_objects[gltf.data.nodes[node_idx].blender_armature_name].parent:
+                            gltf.blender_objects[gltf.data.nodes[node_idx].blender_armature_name].parent = obj_rotation
                         else:
                             exclude_nodes.append(node_idx)
                     else:
                         # Do not change parent if root node is already parented (can be the case for skinned mesh)
-                        if not bpy.data.objects[gltf.data.nodes[node_idx].blender_object].parent:
-                            bpy.data.objects[gltf.data.nodes[node_idx].blender_object].parent = obj_rotation
+                        if not gltf.blender_objects[gltf.data.nodes[node_idx].blender_object].parent:
+                            gltf.blender_objects[gltf.data.nodes[node_idx].blender_object].parent = obj_rotation
                         else:
                             exclude_nodes.append(node_idx)
 
                 if gltf.animation_object is False:
 
                     if bpy.app.version < (2, 80, 0):
+                        # Deselect everything once, then only the root selected by the previous iteration
+                        for obj_ in bpy.context.scene.objects:
+                            obj_.select = False
+                        selected = None
                         for node_idx in list_nodes:
-                            for obj_ in bpy.context.scene.objects:
-                                obj_.select = False
+                            if selected is not None:
+                                selected.select = False
+                                selected = None
 
                             if node_idx in exclude_nodes:
                                 continue # for root node that are parented by the process
                                 # for example skinned meshes
 
                             if gltf.data.nodes[node_idx].is_joint:
-                                bpy.data.objects[gltf.data.nodes[node_idx].blender_armature_name].select = True
-                                bpy.context.scene.objects.active = bpy.data.objects[gltf.data.nodes[node_idx].blender_armature_name]
+                                selected = gltf.blender_objects[gltf.data.nodes[node_idx].blender_armature_name]
                             else:
-                                bpy.data.objects[gltf.data.nodes[node_idx].blender_object].select = True
-                                bpy.context.scene.objects.active = bpy.data.objects[gltf.data.nodes[node_idx].blender_object]
+                                selected = gltf.blender_objects[gltf.data.nodes[node_idx].blender_object]
+                            selected.select = True
+                            bpy.context.scene.objects.active = selected
                             bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
 
                         # remove object
@@ -177,21 +192,24 @@ class BlenderScene():
                             bpy.data.collections[gltf.blender_active_collection].hide_viewport = False
                             # TODO for visibility ... but seems not exposed on bpy for now
 
+                        # Deselect everything once, then only the root selected by the previous iteration
+                        for obj_ in bpy.context.scene.objects:
+                            obj_.select_set(False)
+                        selected = None
                         for node_idx in list_nodes:
 
                             if node_idx in exclude_nodes:
                                 continue # for root node that are parented by the process
                                 # for example skinned meshes
 
-                            for obj_ in bpy.context.scene.objects:
-                                obj_.select_set(False)
+                            if selected is not None:
+                                selected.select_set(False)
                             if gltf.data.nodes[node_idx].is_joint:
-                                bpy.data.objects[gltf.data.nodes[node_idx].blender_armature_name].select_set(True)
-                                bpy.context.view_layer.objects.active = bpy.data.objects[gltf.data.nodes[node_idx].blender_armature_name]
-
+                                selected = gltf.blender_objects[gltf.data.nodes[node_idx].blender_armature_name]
                             else:
-                                bpy.data.objects[gltf.data.nodes[node_idx].blender_object].select_set(True)
-                                bpy.context.view_layer.objects.active = bpy.data.objects[gltf.data.nodes[node_idx].blender_object]
+                                selected = gltf.blender_objects[gltf.data.nodes[node_idx].blender_object]
+                            selected.select_set(True)
+                            bpy.context.view_layer.objects.active = selected
 
                             bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
 
@@ -211,9 +229,9 @@ class BlenderScene():
             else:
                 bl_name = gltf.data.nodes[list_nodes[0]].blender_armature_name
             if bpy.app.version < (2, 80, 0):
-                bpy.context.scene.objects.active = bpy.data.objects[bl_name]
+                bpy.context.scene.objects.active = gltf.blender_objects[bl_name]
             else:
-                bpy.context.view_layer.objects.active = bpy.data.objects[bl_name]
+                bpy.context.view_layer.objects.active = gltf.blender_objects[bl_name]
 
     @staticmethod
     def get_root_nodes(gltf):
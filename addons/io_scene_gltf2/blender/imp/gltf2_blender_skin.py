@@ -45,22 +45,85 @@ class BlenderSkin():
                 bpy.data.scenes[gltf.blender_scene].collection.objects.link(obj)
 
         pyskin.blender_armature_name = obj.name
+        gltf.blender_objects[obj.name] = obj
         if parent is not None:
-            obj.parent = bpy.data.objects[gltf.data.nodes[parent].blender_object]
+            obj.parent = gltf.blender_objects[gltf.data.nodes[parent].blender_object]
 
     @staticmethod
-    def set_bone_transforms(gltf, skin_id, bone, node_id, parent):
-        """Set bone transformations."""
+    def create_bone(gltf, skin_id, node_id, parent):
+        """Bone creation.
+
+        The bone is only queued here: create_bones then creates all queued bones of the armature at once.
+        """
         pyskin = gltf.data.skins[skin_id]
         pynode = gltf.data.nodes[node_id]
 
-        obj = bpy.data.objects[pyskin.blender_armature_name]
+        pynode.blender_armature_name = pyskin.blender_armature_name
+        pyskin.pending_bones.append((node_id, parent))
+
+    @staticmethod
+    def create_bones(gltf, skin_id):
+        """Create the queued bones of a skin, with a single switch to edit mode and to pose mode."""
+        pyskin = gltf.data.skins[skin_id]
+        if not pyskin.pending_bones:
+            return
+
+        pending_bones = pyskin.pending_bones
+        pyskin.pending_bones = []
+
+        scene = bpy.data.scenes[gltf.blender_scene]
+        obj = gltf.blender_objects[pyskin.blender_armature_name]
+
+        if bpy.app.version < (2, 80, 0):
+            bpy.context.screen.scene = scene
+            scene.objects.active = obj
+        else:
+            bpy.context.window.scene = scene
+            bpy.context.view_layer.objects.active = obj
+
+        # Read the bind matrices once for all bones
+        inverse_bind_matrices = None
+        if pyskin.inverse_bind_matrices is not None:
+            inverse_bind_matrices = BinaryData.get_data_from_accessor(gltf, pyskin.inverse_bind_matrices)
+
+        bpy.ops.object.mode_set(mode="EDIT")
+        for node_id, parent in pending_bones:
+            BlenderSkin.create_edit_bone(gltf, skin_id, obj, node_id, parent, inverse_bind_matrices)
+
+        # Switch to Pose mode
+        bpy.ops.object.mode_set(mode="POSE")
+        obj.data.pose_position = 'POSE'
+        for node_id, parent in pending_bones:
+            BlenderSkin.set_pose_transforms(gltf, obj, node_id, parent)
+
+        bpy.ops.object.mode_set(mode="OBJECT")
+        # Custom prop on pose bone
+        for node_id, _parent in pending_bones:
+            pynode = gltf.data.nodes[node_id]
+            if pynode.blender_bone_name in obj.pose.bones:
+                set_extras(obj.pose.bones[pynode.blender_bone_name], pynode.extras)
+
+    @staticmethod
+    def create_edit_bone(gltf, skin_id, obj, node_id, parent, inverse_bind_matrices):
+        """Create an edit bone, and set its bind pose. The armature must be in edit mode."""
+        pynode = gltf.data.nodes[node_id]
+
+        if pynode.name:
+            name = pynode.name
+        else:
+            name = "Bone_" + str(node_id)
+
+        bone = obj.data.edit_bones.new(name)
+        pynode.blender_bone_name = bone.name
+        bone.tail = Vector((0.0, 1.0 / obj.matrix_world.to_scale()[1], 0.0))  # Needed to keep bone alive
+        # Custom prop on edit bone
+        set_extras(bone, pynode.extras)
 
         # Set bone bind_pose by inverting bindpose matrix
-        if node_id in pyskin.joints:
-            index_in_skel = pyskin.joints.index(node_id)
-            if pyskin.inverse_bind_matrices is not None:
-                inverse_bind_matrices = BinaryData.get_data_from_accessor(gltf, pyskin.inverse_bind_matrices)
+        joint = gltf.joint_index.get(node_id)
+        if joint is not None and joint[0] == skin_id:
+            index_in_skel = joint[1]
+            if inverse_bind_matrices is not None:
                 # Needed to keep scale in matrix, as bone.matrix seems to drop it
                 if index_in_skel < len(inverse_bind_matrices):
                     pynode.blender_bone_matrix = matrix_gltf_to_blender(
@@ -68,7 +131,8 @@ class BlenderSkin():
                     ).inverted()
                     bone.matrix = pynode.blender_bone_matrix
                 else:
-                    gltf.log.error("Error with inverseBindMatrix for skin " + pyskin)
+                    gltf.log.error("Error with inverseBindMatrix for skin " + str(skin_id))
+                    pynode.blender_bone_matrix = Matrix()
             else:
                 pynode.blender_bone_matrix = Matrix() # 4x4 identity matrix
         else:
@@ -79,11 +143,11 @@ class BlenderSkin():
         if parent is not None and hasattr(gltf.data.nodes[parent], "blender_bone_name"):
             bone.parent = obj.data.edit_bones[gltf.data.nodes[parent].blender_bone_name]  # TODO if in another scene
 
-        # Switch to Pose mode
-        bpy.ops.object.mode_set(mode="POSE")
-        obj.data.pose_position = 'POSE'
+    @staticmethod
+    def set_pose_transforms(gltf, obj, node_id, parent):
+        """Set posebone location/rotation/scale (in armature space). The armature must be in pose mode."""
+        pynode = gltf.data.nodes[node_id]
 
-        # Set posebone location/rotation/scale (in armature space)
         # location is actual bone location minus it's original (bind) location
         bind_location = Matrix.Translation(pynode.blender_bone_matrix.to_translation())
         bind_rotation = pynode.blender_bone_matrix.to_quaternion()
@@ -128,48 +192,12 @@ class BlenderSkin():
                 obj.pose.bones[pynode.blender_bone_name].rotation_quaternion = bind_rotation.inverted() @ rotation
                 obj.pose.bones[pynode.blender_bone_name].scale = bind_scale.inverted() @ scale
 
-    @staticmethod
-    def create_bone(gltf, skin_id, node_id, parent):
-        """Bone creation."""
-        pyskin = gltf.data.skins[skin_id]
-        pynode = gltf.data.nodes[node_id]
-
-        scene = bpy.data.scenes[gltf.blender_scene]
-        obj = bpy.data.objects[pyskin.blender_armature_name]
-
-        if bpy.app.version < (2, 80, 0):
-            bpy.context.screen.scene = scene
-            scene.objects.active = obj
-        else:
-            bpy.context.window.scene = scene
-            bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode="EDIT")
-
-        if pynode.name:
-            name = pynode.name
-        else:
-            name = "Bone_" + str(node_id)
-
-        bone = obj.data.edit_bones.new(name)
-        pynode.blender_bone_name = bone.name
-        pynode.blender_armature_name = pyskin.blender_armature_name
-        bone.tail = Vector((0.0, 1.0 / obj.matrix_world.to_scale()[1], 0.0))  # Needed to keep bone alive
-        # Custom prop on edit bone
-        set_extras(bone, pynode.extras)
-
-        # set bind and pose transforms
-        BlenderSkin.set_bone_transforms(gltf, skin_id, bone, node_id, parent)
-        bpy.ops.object.mode_set(mode="OBJECT")
-        # Custom prop on pose bone
-        if pynode.blender_bone_name in obj.pose.bones:
-            set_extras(obj.pose.bones[pynode.blender_bone_name], pynode.extras)
-
     @staticmethod
     def create_vertex_groups(gltf, skin_id):
         """Vertex Group creation."""
         pyskin = gltf.data.skins[skin_id]
         for node_id in pyskin.node_ids:
-            obj = bpy.data.objects[gltf.data.nodes[node_id].blender_object]
+            obj = gltf.blender_objects[gltf.data.nodes[node_id].blender_object]
             for bone in pyskin.joints:
                 obj.vertex_groups.new(name=gltf.data.nodes[bone].blender_bone_name)
 
@@ -184,24 +212,30 @@ class BlenderSkin():
             # Not sure this is glTF compliant, will check it
             return
 
+        if bpy.app.version < (2, 80, 0):
+            for obj_sel in bpy.context.scene.objects:
+                obj_sel.select = False
+        else:
+            for obj_sel in bpy.context.scene.objects:
+                obj_sel.select_set(False)
+
+        obj = None
         for node_id in pyskin.node_ids:
             node = gltf.data.nodes[node_id]
-            obj = bpy.data.objects[node.blender_object]
+            obj = gltf.blender_objects[node.blender_object]
+
+            # bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
+            # Reparent skinned mesh to it's armature to avoid breaking
+            # skinning with interleaved transforms
+            obj.parent = gltf.blender_objects[pyskin.blender_armature_name]
+            arma = obj.modifiers.new(name="Armature", type="ARMATURE")
+            arma.object = gltf.blender_objects[pyskin.blender_armature_name]
 
+        # Leave the last skinned mesh selected and active
+        if obj is not None:
             if bpy.app.version < (2, 80, 0):
-                for obj_sel in bpy.context.scene.objects:
-                    obj_sel.select = False
                 obj.select = True
                 bpy.context.scene.objects.active = obj
             else:
-                for obj_sel in bpy.context.scene.objects:
-                    obj_sel.select_set(False)
                 obj.select_set(True)
                 bpy.context.view_layer.objects.active = obj
-
-            # bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-            # Reparent skinned mesh to it's armature to avoid breaking
-            # skinning with interleaved transforms
-            obj.parent = bpy.data.objects[pyskin.blender_armature_name]
-            arma = obj.modifiers.new(name="Armature", type="ARMATURE")
-            arma.object = bpy.data.objects[pyskin.blender_armature_name]
@@ -16,11 +16,18 @@
 # command used:
 # quicktype --src glTF.schema.json --src-lang schema -t gltf --lang python --python-version 3.5
 
-# TODO: add __slots__ to all classes by extending the generator
+# NOTE: Classes were then extended with __slots__ and a _fields table, used to convert them to JSON, and by the
+# exporter to traverse them. _fields holds the (attribute, JSON key, conversion to JSON, fast conversion from JSON) of
+# each field, in JSON order. The fast conversion checks the type of the JSON value (see fields_from_dict_fast), it is
+# None for fields taken as is.
+# __dict__ is kept in __slots__, as the importer attaches Blender data to these objects. The dict itself is only
+# allocated when such an attribute is set. Measured with tracemalloc on Python 3.11, 100000 nodes take 168 bytes each,
+# against 136 bytes without __dict__ in __slots__, and about 420 bytes each once the importer set its attributes.
 
 # TODO: REMOVE traceback import
 import sys
 import traceback
+from collections.abc import Sequence
 
 from io_scene_gltf2.io.com import gltf2_io_debug
 
@@ -106,6 +113,46 @@ def from_extension(x):
 def from_extra(x):
     return extension_to_dict(x)
 
+
+def fields_to_dict(obj):
+    """Convert a glTF property to a dict, using the field table of its class."""
+    return {key: to_json(getattr(obj, attribute)) for attribute, key, to_json, _from_json in obj._fields}
+
+
+def fast_float(x):
+    return from_float(x)
+
+
+def fast_float_list(x):
+    return from_list(from_float, x)
+
+
+def fast_dict(x):
+    assert isinstance(x, dict)
+    return x
+
+
+def fast_property_list(cls, x):
+    return from_list(lambda y: fields_from_dict_fast(cls, y), x)
+
+
+def fields_from_dict_fast(cls, obj):
+    """
+    Create a glTF property from a dict, using the field table of its class.
+
+    Unlike from_dict, values are only checked for their type, with the same assertions, and are not copied: JSON
+    values are used as is, except for nested properties and floats. Missing required fields are not reported.
+    """
+    assert isinstance(obj, dict)
+    result = cls.__new__(cls)
+    for attribute, key, _to_json, from_json in cls._fields:
+        value = obj.get(key)
+        if from_json is not None and value is not None:
+            value = from_json(value)
+        setattr(result, attribute, value)
+    return result
+
+
 class AccessorSparseIndices:
     """Index array of size `count` that points to those accessor attributes that deviate from
     their initialization value. Indices must strictly increase.
@@ -113,6 +160,16 @@ class AccessorSparseIndices:
     Indices of those attributes that deviate from their initialization value.
     """
 
+    _fields = (
+        ("buffer_view", "bufferView", from_int, from_int),
+        ("byte_offset", "byteOffset", lambda x: from_union([from_int, from_none], x), from_int),
+        ("component_type", "componentType", from_int, from_int),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, buffer_view, byte_offset, component_type, extensions, extras):
         self.buffer_view = buffer_view
         self.byte_offset = byte_offset
@@ -132,14 +189,7 @@ class AccessorSparseIndices:
         return AccessorSparseIndices(buffer_view, byte_offset, component_type, extensions, extras)
 
     def to_dict(self):
-        result = {}
-        result["bufferView"] = from_int(self.buffer_view)
-        result["byteOffset"] = from_union([from_int, from_none], self.byte_offset)
-        result["componentType"] = from_int(self.component_type)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        return result
+        return fields_to_dict(self)
 
 
 class AccessorSparseValues:
@@ -151,6 +201,15 @@ class AccessorSparseValues:
     accessor attributes pointed by `accessor.sparse.indices`.
     """
 
+    _fields = (
+        ("buffer_view", "bufferView", from_int, from_int),
+        ("byte_offset", "byteOffset", lambda x: from_union([from_int, from_none], x), from_int),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, buffer_view, byte_offset, extensions, extras):
         self.buffer_view = buffer_view
         self.byte_offset = byte_offset
@@ -168,18 +227,24 @@ class AccessorSparseValues:
         return AccessorSparseValues(buffer_view, byte_offset, extensions, extras)
 
     def to_dict(self):
-        result = {}
-        result["bufferView"] = from_int(self.buffer_view)
-        result["byteOffset"] = from_union([from_int, from_none], self.byte_offset)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        return result
+        return fields_to_dict(self)
 
 
 class AccessorSparse:
     """Sparse storage of attributes that deviate from their initialization value."""
 
+    _fields = (
+        ("count", "count", from_int, from_int),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("indices", "indices", lambda x: to_class(AccessorSparseIndices, x),
+         lambda x: fields_from_dict_fast(AccessorSparseIndices, x)),
+        ("values", "values", lambda x: to_class(AccessorSparseValues, x),
+         lambda x: fields_from_dict_fast(AccessorSparseValues, x)),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, count, extensions, extras, indices, values):
         self.count = count
         self.extensions = extensions
@@ -199,14 +264,7 @@ class AccessorSparse:
         return AccessorSparse(count, extensions, extras, indices, values)
 
     def to_dict(self):
-        result = {}
-        result["count"] = from_int(self.count)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["indices"] = to_class(AccessorSparseIndices, self.indices)
-        result["values"] = to_class(AccessorSparseValues, self.values)
-        return result
+        return fields_to_dict(self)
 
 
 class Accessor:
@@ -215,6 +273,24 @@ class Accessor:
     WebGL's `vertexAttribPointer()` defines an attribute in a buffer.
     """
 
+    _fields = (
+        ("buffer_view", "bufferView", lambda x: from_union([from_int, from_none], x), from_int),
+        ("byte_offset", "byteOffset", lambda x: from_union([from_int, from_none], x), from_int),
+        ("component_type", "componentType", from_int, from_int),
+        ("count", "count", from_int, from_int),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("max", "max", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x), fast_float_list),
+        ("min", "min", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x), fast_float_list),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("normalized", "normalized", lambda x: from_union([from_bool, from_none], x), from_bool),
+        ("sparse", "sparse", lambda x: from_union([lambda x: to_class(AccessorSparse, x), from_none], x),
+         lambda x: fields_from_dict_fast(AccessorSparse, x)),
+        ("type", "type", from_str, from_str),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, buffer_view, byte_offset, component_type, count, extensions, extras, max, min, name, normalized,
                  sparse, type):
         self.buffer_view = buffer_view
@@ -250,21 +326,7 @@ class Accessor:
                         sparse, type)
 
     def to_dict(self):
-        result = {}
-        result["bufferView"] = from_union([from_int, from_none], self.buffer_view)
-        result["byteOffset"] = from_union([from_int, from_none], self.byte_offset)
-        result["componentType"] = from_int(self.component_type)
-        result["count"] = from_int(self.count)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["max"] = from_union([lambda x: from_list(to_float, x), from_none], self.max)
-        result["min"] = from_union([lambda x: from_list(to_float, x), from_none], self.min)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["normalized"] = from_union([from_bool, from_none], self.normalized)
-        result["sparse"] = from_union([lambda x: to_class(AccessorSparse, x), from_none], self.sparse)
-        result["type"] = from_str(self.type)
-        return result
+        return fields_to_dict(self)
 
 
 class AnimationChannelTarget:
@@ -273,6 +335,15 @@ class AnimationChannelTarget:
     The index of the node and TRS property that an animation channel targets.
     """
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("node", "node", lambda x: from_union([from_int, from_none], x), from_int),
+        ("path", "path", from_str, from_str),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, node, path):
         self.extensions = extensions
         self.extras = extras
@@ -290,18 +361,22 @@ class AnimationChannelTarget:
         return AnimationChannelTarget(extensions, extras, node, path)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["node"] = from_union([from_int, from_none], self.node)
-        result["path"] = from_str(self.path)
-        return result
+        return fields_to_dict(self)
 
 
 class AnimationChannel:
     """Targets an animation's sampler at a node's property."""
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("sampler", "sampler", from_int, from_int),
+        ("target", "target", lambda x: to_class(AnimationChannelTarget, x),
+         lambda x: fields_from_dict_fast(AnimationChannelTarget, x)),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, sampler, target):
         self.extensions = extensions
         self.extras = extras
@@ -319,13 +394,7 @@ class AnimationChannel:
         return AnimationChannel(extensions, extras, sampler, target)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["sampler"] = from_int(self.sampler)
-        result["target"] = to_class(AnimationChannelTarget, self.target)
-        return result
+        return fields_to_dict(self)
 
 
 class AnimationSampler:
@@ -333,6 +402,16 @@ class AnimationSampler:
     graph (but not its target).
     """
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("input", "input", from_int, from_int),
+        ("interpolation", "interpolation", lambda x: from_union([from_str, from_none], x), from_str),
+        ("output", "output", from_int, from_int),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, input, interpolation, output):
         self.extensions = extensions
         self.extras = extras
@@ -352,19 +431,24 @@ class AnimationSampler:
         return AnimationSampler(extensions, extras, input, interpolation, output)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["input"] = from_int(self.input)
-        result["interpolation"] = from_union([from_str, from_none], self.interpolation)
-        result["output"] = from_int(self.output)
-        return result
+        return fields_to_dict(self)
 
 
 class Animation:
     """A keyframe animation."""
 
+    _fields = (
+        ("channels", "channels", lambda x: from_list(lambda x: to_class(AnimationChannel, x), x),
+         lambda x: fast_property_list(AnimationChannel, x)),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("samplers", "samplers", lambda x: from_list(lambda x: to_class(AnimationSampler, x), x),
+         lambda x: fast_property_list(AnimationSampler, x)),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, channels, extensions, extras, name, samplers):
         self.channels = channels
         self.extensions = extensions
@@ -384,19 +468,23 @@ class Animation:
         return Animation(channels, extensions, extras, name, samplers)
 
     def to_dict(self):
-        result = {}
-        result["channels"] = from_list(lambda x: to_class(AnimationChannel, x), self.channels)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["samplers"] = from_list(lambda x: to_class(AnimationSampler, x), self.samplers)
-        return result
+        return fields_to_dict(self)
 
 
 class Asset:
     """Metadata about the glTF asset."""
 
+    _fields = (
+        ("copyright", "copyright", lambda x: from_union([from_str, from_none], x), from_str),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("generator", "generator", lambda x: from_union([from_str, from_none], x), from_str),
+        ("min_version", "minVersion", lambda x: from_union([from_str, from_none], x), from_str),
+        ("version", "version", from_str, from_str),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, copyright, extensions, extras, generator, min_version, version):
         self.copyright = copyright
         self.extensions = extensions
@@ -418,20 +506,25 @@ class Asset:
         return Asset(copyright, extensions, extras, generator, min_version, version)
 
     def to_dict(self):
-        result = {}
-        result["copyright"] = from_union([from_str, from_none], self.copyright)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["generator"] = from_union([from_str, from_none], self.generator)
-        result["minVersion"] = from_union([from_str, from_none], self.min_version)
-        result["version"] = from_str(self.version)
-        return result
+        return fields_to_dict(self)
 
 
 class BufferView:
     """A view into a buffer generally representing a subset of the buffer."""
 
+    _fields = (
+        ("buffer", "buffer", from_int, from_int),
+        ("byte_length", "byteLength", from_int, from_int),
+        ("byte_offset", "byteOffset", lambda x: from_union([from_int, from_none], x), from_int),
+        ("byte_stride", "byteStride", lambda x: from_union([from_int, from_none], x), from_int),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("target", "target", lambda x: from_union([from_int, from_none], x), from_int),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, buffer, byte_length, byte_offset, byte_stride, extensions, extras, name, target):
         self.buffer = buffer
         self.byte_length = byte_length
@@ -457,22 +550,22 @@ class BufferView:
         return BufferView(buffer, byte_length, byte_offset, byte_stride, extensions, extras, name, target)
 
     def to_dict(self):
-        result = {}
-        result["buffer"] = from_int(self.buffer)
-        result["byteLength"] = from_int(self.byte_length)
-        result["byteOffset"] = from_union([from_int, from_none], self.byte_offset)
-        result["byteStride"] = from_union([from_int, from_none], self.byte_stride)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["target"] = from_union([from_int, from_none], self.target)
-        return result
+        return fields_to_dict(self)
 
 
 class Buffer:
     """A buffer points to binary geometry, animation, or skins."""
 
+    _fields = (
+        ("byte_length", "byteLength", from_int, from_int),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("uri", "uri", lambda x: from_union([from_str, from_none], x), from_str),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, byte_length, extensions, extras, name, uri):
         self.byte_length = byte_length
         self.extensions = extensions
@@ -492,19 +585,23 @@ class Buffer:
         return Buffer(byte_length, extensions, extras, name, uri)
 
     def to_dict(self):
-        result = {}
-        result["byteLength"] = from_int(self.byte_length)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["uri"] = from_union([from_str, from_none], self.uri)
-        return result
+        return fields_to_dict(self)
 
 
 class CameraOrthographic:
     """An orthographic camera containing properties to create an orthographic projection matrix."""
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("xmag", "xmag", to_float, fast_float),
+        ("ymag", "ymag", to_float, fast_float),
+        ("zfar", "zfar", to_float, fast_float),
+        ("znear", "znear", to_float, fast_float),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, xmag, ymag, zfar, znear):
         self.extensions = extensions
         self.extras = extras
@@ -526,20 +623,23 @@ class CameraOrthographic:
         return CameraOrthographic(extensions, extras, xmag, ymag, zfar, znear)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["xmag"] = to_float(self.xmag)
-        result["ymag"] = to_float(self.ymag)
-        result["zfar"] = to_float(self.zfar)
-        result["znear"] = to_float(self.znear)
-        return result
+        return fields_to_dict(self)
 
 
 class CameraPerspective:
     """A perspective camera containing properties to create a perspective projection matrix."""
 
+    _fields = (
+        ("aspect_ratio", "aspectRatio", lambda x: from_union([to_float, from_none], x), fast_float),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("yfov", "yfov", to_float, fast_float),
+        ("zfar", "zfar", lambda x: from_union([to_float, from_none], x), fast_float),
+        ("znear", "znear", to_float, fast_float),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, aspect_ratio, extensions, extras, yfov, zfar, znear):
         self.aspect_ratio = aspect_ratio
         self.extensions = extensions
@@ -561,15 +661,7 @@ class CameraPerspective:
         return CameraPerspective(aspect_ratio, extensions, extras, yfov, zfar, znear)
 
     def to_dict(self):
-        result = {}
-        result["aspectRatio"] = from_union([to_float, from_none], self.aspect_ratio)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["yfov"] = to_float(self.yfov)
-        result["zfar"] = from_union([to_float, from_none], self.zfar)
-        result["znear"] = to_float(self.znear)
-        return result
+        return fields_to_dict(self)
 
 
 class Camera:
@@ -577,6 +669,20 @@ class Camera:
     camera in the scene.
     """
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("orthographic", "orthographic",
+         lambda x: from_union([lambda x: to_class(CameraOrthographic, x), from_none], x),
+         lambda x: fields_from_dict_fast(CameraOrthographic, x)),
+        ("perspective", "perspective", lambda x: from_union([lambda x: to_class(CameraPerspective, x), from_none], x),
+         lambda x: fields_from_dict_fast(CameraPerspective, x)),
+        ("type", "type", from_str, from_str),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, name, orthographic, perspective, type):
         self.extensions = extensions
         self.extras = extras
@@ -598,15 +704,7 @@ class Camera:
         return Camera(extensions, extras, name, orthographic, perspective, type)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["orthographic"] = from_union([lambda x: to_class(CameraOrthographic, x), from_none], self.orthographic)
-        result["perspective"] = from_union([lambda x: to_class(CameraPerspective, x), from_none], self.perspective)
-        result["type"] = from_str(self.type)
-        return result
+        return fields_to_dict(self)
 
 
 class Image:
@@ -614,6 +712,17 @@ class Image:
     index. `mimeType` is required in the latter case.
     """
 
+    _fields = (
+        ("buffer_view", "bufferView", lambda x: from_union([from_int, from_none], x), from_int),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("mime_type", "mimeType", lambda x: from_union([from_str, from_none], x), from_str),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("uri", "uri", lambda x: from_union([from_str, from_none], x), from_str),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, buffer_view, extensions, extras, mime_type, name, uri):
         self.buffer_view = buffer_view
         self.extensions = extensions
@@ -635,15 +744,7 @@ class Image:
         return Image(buffer_view, extensions, extras, mime_type, name, uri)
 
     def to_dict(self):
-        result = {}
-        result["bufferView"] = from_union([from_int, from_none], self.buffer_view)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["mimeType"] = from_union([from_str, from_none], self.mime_type)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["uri"] = from_union([from_str, from_none], self.uri)
-        return result
+        return fields_to_dict(self)
 
 
 class TextureInfo:
@@ -656,6 +757,15 @@ class TextureInfo:
     Reference to a texture.
     """
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("index", "index", from_int, from_int),
+        ("tex_coord", "texCoord", lambda x: from_union([from_int, from_none], x), from_int),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, index, tex_coord):
         self.extensions = extensions
         self.extras = extras
@@ -673,13 +783,7 @@ class TextureInfo:
         return TextureInfo(extensions, extras, index, tex_coord)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["index"] = from_int(self.index)
-        result["texCoord"] = from_union([from_int, from_none], self.tex_coord)
-        return result
+        return fields_to_dict(self)
 
 
 class MaterialNormalTextureInfoClass:
@@ -688,6 +792,16 @@ class MaterialNormalTextureInfoClass:
     Reference to a texture.
     """
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("index", "index", from_int, from_int),
+        ("scale", "scale", lambda x: from_union([to_float, from_none], x), fast_float),
+        ("tex_coord", "texCoord", lambda x: from_union([from_int, from_none], x), from_int),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, index, scale, tex_coord):
         self.extensions = extensions
         self.extras = extras
@@ -707,14 +821,7 @@ class MaterialNormalTextureInfoClass:
         return MaterialNormalTextureInfoClass(extensions, extras, index, scale, tex_coord)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["index"] = from_int(self.index)
-        result["scale"] = from_union([to_float, from_none], self.scale)
-        result["texCoord"] = from_union([from_int, from_none], self.tex_coord)
-        return result
+        return fields_to_dict(self)
 
 
 class MaterialOcclusionTextureInfoClass:
@@ -723,6 +830,16 @@ class MaterialOcclusionTextureInfoClass:
     Reference to a texture.
     """
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("index", "index", from_int, from_int),
+        ("strength", "strength", lambda x: from_union([to_float, from_none], x), fast_float),
+        ("tex_coord", "texCoord", lambda x: from_union([from_int, from_none], x), from_int),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, index, strength, tex_coord):
         self.extensions = extensions
         self.extras = extras
@@ -742,14 +859,7 @@ class MaterialOcclusionTextureInfoClass:
         return MaterialOcclusionTextureInfoClass(extensions, extras, index, strength, tex_coord)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["index"] = from_int(self.index)
-        result["strength"] = from_union([to_float, from_none], self.strength)
-        result["texCoord"] = from_union([from_int, from_none], self.tex_coord)
-        return result
+        return fields_to_dict(self)
 
 
 class MaterialPBRMetallicRoughness:
@@ -761,6 +871,23 @@ class MaterialPBRMetallicRoughness:
     from Physically-Based Rendering (PBR) methodology.
     """
 
+    _fields = (
+        ("base_color_factor", "baseColorFactor",
+         lambda x: from_union([lambda x: from_list(to_float, x), from_none], x), fast_float_list),
+        ("base_color_texture", "baseColorTexture",
+         lambda x: from_union([lambda x: to_class(TextureInfo, x), from_none], x),
+         lambda x: fields_from_dict_fast(TextureInfo, x)),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("metallic_factor", "metallicFactor", lambda x: from_union([to_float, from_none], x), fast_float),
+        ("metallic_roughness_texture", "metallicRoughnessTexture",
+         lambda x: from_union([lambda x: to_class(TextureInfo, x), from_none], x),
+         lambda x: fields_from_dict_fast(TextureInfo, x)),
+        ("roughness_factor", "roughnessFactor", lambda x: from_union([to_float, from_none], x), fast_float),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, base_color_factor, base_color_texture, extensions, extras, metallic_factor,
                  metallic_roughness_texture, roughness_factor):
         self.base_color_factor = base_color_factor
@@ -786,23 +913,37 @@ class MaterialPBRMetallicRoughness:
                                             metallic_roughness_texture, roughness_factor)
 
     def to_dict(self):
-        result = {}
-        result["baseColorFactor"] = from_union([lambda x: from_list(to_float, x), from_none], self.base_color_factor)
-        result["baseColorTexture"] = from_union([lambda x: to_class(TextureInfo, x), from_none],
-                                                self.base_color_texture)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["metallicFactor"] = from_union([to_float, from_none], self.metallic_factor)
-        result["metallicRoughnessTexture"] = from_union([lambda x: to_class(TextureInfo, x), from_none],
-                                                        self.metallic_roughness_texture)
-        result["roughnessFactor"] = from_union([to_float, from_none], self.roughness_factor)
-        return result
+        return fields_to_dict(self)
 
 
 class Material:
     """The material appearance of a primitive."""
 
+    _fields = (
+        ("alpha_cutoff", "alphaCutoff", lambda x: from_union([to_float, from_none], x), fast_float),
+        ("alpha_mode", "alphaMode", lambda x: from_union([from_str, from_none], x), from_str),
+        ("double_sided", "doubleSided", lambda x: from_union([from_bool, from_none], x), from_bool),
+        ("emissive_factor", "emissiveFactor", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x),
+         fast_float_list),
+        ("emissive_texture", "emissiveTexture",
+         lambda x: from_union([lambda x: to_class(TextureInfo, x), from_none], x),
+         lambda x: fields_from_dict_fast(TextureInfo, x)),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("normal_texture", "normalTexture",
+         lambda x: from_union([lambda x: to_class(MaterialNormalTextureInfoClass, x), from_none], x),
+         lambda x: fields_from_dict_fast(MaterialNormalTextureInfoClass, x)),
+        ("occlusion_texture", "occlusionTexture",
+         lambda x: from_union([lambda x: to_class(MaterialOcclusionTextureInfoClass, x), from_none], x),
+         lambda x: fields_from_dict_fast(MaterialOcclusionTextureInfoClass, x)),
+        ("pbr_metallic_roughness", "pbrMetallicRoughness",
+         lambda x: from_union([lambda x: to_class(MaterialPBRMetallicRoughness, x), from_none], x),
+         lambda x: fields_from_dict_fast(MaterialPBRMetallicRoughness, x)),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, alpha_cutoff, alpha_mode, double_sided, emissive_factor, emissive_texture, extensions, extras,
                  name, normal_texture, occlusion_texture, pbr_metallic_roughness):
         self.alpha_cutoff = alpha_cutoff
@@ -838,28 +979,26 @@ class Material:
                         name, normal_texture, occlusion_texture, pbr_metallic_roughness)
 
     def to_dict(self):
-        result = {}
-        result["alphaCutoff"] = from_union([to_float, from_none], self.alpha_cutoff)
-        result["alphaMode"] = from_union([from_str, from_none], self.alpha_mode)
-        result["doubleSided"] = from_union([from_bool, from_none], self.double_sided)
-        result["emissiveFactor"] = from_union([lambda x: from_list(to_float, x), from_none], self.emissive_factor)
-        result["emissiveTexture"] = from_union([lambda x: to_class(TextureInfo, x), from_none], self.emissive_texture)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["normalTexture"] = from_union([lambda x: to_class(MaterialNormalTextureInfoClass, x), from_none],
-                                             self.normal_texture)
-        result["occlusionTexture"] = from_union([lambda x: to_class(MaterialOcclusionTextureInfoClass, x), from_none],
-                                                self.occlusion_texture)
-        result["pbrMetallicRoughness"] = from_union([lambda x: to_class(MaterialPBRMetallicRoughness, x), from_none],
-                                                    self.pbr_metallic_roughness)
-        return result
+        return fields_to_dict(self)
 
 
 class MeshPrimitive:
     """Geometry to be rendered with the given material."""
 
+    _fields = (
+        ("attributes", "attributes", lambda x: from_dict(from_int, x), lambda x: from_dict(from_int, x)),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("indices", "indices", lambda x: from_union([from_int, from_none], x), from_int),
+        ("material", "material", lambda x: from_union([from_int, from_none], x), from_int),
+        ("mode", "mode", lambda x: from_union([from_int, from_none], x), from_int),
+        ("targets", "targets",
+         lambda x: from_union([lambda x: from_list(lambda x: from_dict(from_int, x), x), from_none], x),
+         lambda x: from_list(lambda x: from_dict(from_int, x), x)),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, attributes, extensions, extras, indices, material, mode, targets):
         self.attributes = attributes
         self.extensions = extensions
@@ -883,17 +1022,7 @@ class MeshPrimitive:
         return MeshPrimitive(attributes, extensions, extras, indices, material, mode, targets)
 
     def to_dict(self):
-        result = {}
-        result["attributes"] = from_dict(from_int, self.attributes)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["indices"] = from_union([from_int, from_none], self.indices)
-        result["material"] = from_union([from_int, from_none], self.material)
-        result["mode"] = from_union([from_int, from_none], self.mode)
-        result["targets"] = from_union([lambda x: from_list(lambda x: from_dict(from_int, x), x), from_none],
-                                       self.targets)
-        return result
+        return fields_to_dict(self)
 
 
 class Mesh:
@@ -901,6 +1030,17 @@ class Mesh:
     places the mesh in the scene.
     """
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("primitives", "primitives", lambda x: from_list(lambda x: to_class(MeshPrimitive, x), x),
+         lambda x: fast_property_list(MeshPrimitive, x)),
+        ("weights", "weights", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x), fast_float_list),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, name, primitives, weights):
         self.extensions = extensions
         self.extras = extras
@@ -920,14 +1060,7 @@ class Mesh:
         return Mesh(extensions, extras, name, primitives, weights)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["primitives"] = from_list(lambda x: to_class(MeshPrimitive, x), self.primitives)
-        result["weights"] = from_union([lambda x: from_list(to_float, x), from_none], self.weights)
-        return result
+        return fields_to_dict(self)
 
 
 class Node:
@@ -941,6 +1074,26 @@ class Node:
     may be present; `matrix` will not be present.
     """
 
+    _fields = (
+        ("camera", "camera", lambda x: from_union([from_int, from_none], x), from_int),
+        ("children", "children", lambda x: from_union([lambda x: from_list(from_int, x), from_none], x),
+         lambda x: from_list(from_int, x)),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("matrix", "matrix", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x), fast_float_list),
+        ("mesh", "mesh", lambda x: from_union([from_int, from_none], x), from_int),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("rotation", "rotation", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x),
+         fast_float_list),
+        ("scale", "scale", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x), fast_float_list),
+        ("skin", "skin", lambda x: from_union([from_int, from_none], x), from_int),
+        ("translation", "translation", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x),
+         fast_float_list),
+        ("weights", "weights", lambda x: from_union([lambda x: from_list(to_float, x), from_none], x), fast_float_list),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, camera, children, extensions, extras, matrix, mesh, name, rotation, scale, skin, translation,
                  weights):
         self.camera = camera
@@ -976,26 +1129,24 @@ class Node:
                     weights)
 
     def to_dict(self):
-        result = {}
-        result["camera"] = from_union([from_int, from_none], self.camera)
-        result["children"] = from_union([lambda x: from_list(from_int, x), from_none], self.children)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["matrix"] = from_union([lambda x: from_list(to_float, x), from_none], self.matrix)
-        result["mesh"] = from_union([from_int, from_none], self.mesh)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["rotation"] = from_union([lambda x: from_list(to_float, x), from_none], self.rotation)
-        result["scale"] = from_union([lambda x: from_list(to_float, x), from_none], self.scale)
-        result["skin"] = from_union([from_int, from_none], self.skin)
-        result["translation"] = from_union([lambda x: from_list(to_float, x), from_none], self.translation)
-        result["weights"] = from_union([lambda x: from_list(to_float, x), from_none], self.weights)
-        return result
+        return fields_to_dict(self)
 
 
 class Sampler:
     """Texture sampler properties for filtering and wrapping modes."""
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("mag_filter", "magFilter", lambda x: from_union([from_int, from_none], x), from_int),
+        ("min_filter", "minFilter", lambda x: from_union([from_int, from_none], x), from_int),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("wrap_s", "wrapS", lambda x: from_union([from_int, from_none], x), from_int),
+        ("wrap_t", "wrapT", lambda x: from_union([from_int, from_none], x), from_int),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, mag_filter, min_filter, name, wrap_s, wrap_t):
         self.extensions = extensions
         self.extras = extras
@@ -1019,21 +1170,22 @@ class Sampler:
         return Sampler(extensions, extras, mag_filter, min_filter, name, wrap_s, wrap_t)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["magFilter"] = from_union([from_int, from_none], self.mag_filter)
-        result["minFilter"] = from_union([from_int, from_none], self.min_filter)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["wrapS"] = from_union([from_int, from_none], self.wrap_s)
-        result["wrapT"] = from_union([from_int, from_none], self.wrap_t)
-        return result
+        return fields_to_dict(self)
 
 
 class Scene:
     """The root nodes of a scene."""
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("nodes", "nodes", lambda x: from_union([lambda x: from_list(from_int, x), from_none], x),
+         lambda x: from_list(from_int, x)),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, name, nodes):
         self.extensions = extensions
         self.extras = extras
@@ -1051,18 +1203,23 @@ class Scene:
         return Scene(extensions, extras, name, nodes)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["nodes"] = from_union([lambda x: from_list(from_int, x), from_none], self.nodes)
-        return result
+        return fields_to_dict(self)
 
 
 class Skin:
     """Joints and matrices defining a skin."""
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("inverse_bind_matrices", "inverseBindMatrices", lambda x: from_union([from_int, from_none], x), from_int),
+        ("joints", "joints", lambda x: from_list(from_int, x), lambda x: from_list(from_int, x)),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("skeleton", "skeleton", lambda x: from_union([from_int, from_none], x), from_int),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, inverse_bind_matrices, joints, name, skeleton):
         self.extensions = extensions
         self.extras = extras
@@ -1084,20 +1241,23 @@ class Skin:
         return Skin(extensions, extras, inverse_bind_matrices, joints, name, skeleton)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["inverseBindMatrices"] = from_union([from_int, from_none], self.inverse_bind_matrices)
-        result["joints"] = from_list(from_int, self.joints)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["skeleton"] = from_union([from_int, from_none], self.skeleton)
-        return result
+        return fields_to_dict(self)
 
 
 class Texture:
     """A texture and its sampler."""
 
+    _fields = (
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extras", "extras", from_extra, None),
+        ("name", "name", lambda x: from_union([from_str, from_none], x), from_str),
+        ("sampler", "sampler", lambda x: from_union([from_int, from_none], x), from_int),
+        # most viewers can't handle missing sources
+        ("source", "source", from_int, from_int),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, extensions, extras, name, sampler, source):
         self.extensions = extensions
         self.extras = extras
@@ -1117,19 +1277,62 @@ class Texture:
         return Texture(extensions, extras, name, sampler, source)
 
     def to_dict(self):
-        result = {}
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extras"] = from_extra(self.extras)
-        result["name"] = from_union([from_str, from_none], self.name)
-        result["sampler"] = from_union([from_int, from_none], self.sampler)
-        result["source"] = from_int(self.source)  # most viewers can't handle missing sources
-        return result
+        return fields_to_dict(self)
 
 
 class Gltf:
     """The root object for a glTF asset."""
 
+    _fields = (
+        ("accessors", "accessors",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Accessor, x), x), from_none], x),
+         lambda x: fast_property_list(Accessor, x)),
+        ("animations", "animations",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Animation, x), x), from_none], x),
+         lambda x: fast_property_list(Animation, x)),
+        ("asset", "asset", lambda x: to_class(Asset, x), lambda x: fields_from_dict_fast(Asset, x)),
+        ("buffers", "buffers",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Buffer, x), x), from_none], x),
+         lambda x: fast_property_list(Buffer, x)),
+        ("buffer_views", "bufferViews",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(BufferView, x), x), from_none], x),
+         lambda x: fast_property_list(BufferView, x)),
+        ("cameras", "cameras",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Camera, x), x), from_none], x),
+         lambda x: fast_property_list(Camera, x)),
+        ("extensions", "extensions", lambda x: from_union([lambda x: from_dict(from_extension, x), from_none], x),
+         fast_dict),
+        ("extensions_required", "extensionsRequired",
+         lambda x: from_union([lambda x: from_list(from_str, x), from_none], x),
+         lambda x: from_list(from_str, x)),
+        ("extensions_used", "extensionsUsed", lambda x: from_union([lambda x: from_list(from_str, x), from_none], x),
+         lambda x: from_list(from_str, x)),
+        ("extras", "extras", from_extra, None),
+        ("images", "images",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Image, x), x), from_none], x),
+         lambda x: fast_property_list(Image, x)),
+        ("materials", "materials",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Material, x), x), from_none], x),
+         lambda x: fast_property_list(Material, x)),
+        ("meshes", "meshes", lambda x: from_union([lambda x: from_list(lambda x: to_class(Mesh, x), x), from_none], x),
+         lambda x: fast_property_list(Mesh, x)),
+        ("nodes", "nodes", lambda x: from_union([lambda x: from_list(lambda x: to_class(Node, x), x), from_none], x),
+         lambda x: fast_property_list(Node, x)),
+        ("samplers", "samplers",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Sampler, x), x), from_none], x),
+         lambda x: fast_property_list(Sampler, x)),
+        ("scene", "scene", lambda x: from_union([from_int, from_none], x), from_int),
+        ("scenes", "scenes",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Scene, x), x), from_none], x),
+         lambda x: fast_property_list(Scene, x)),
+        ("skins", "skins", lambda x: from_union([lambda x: from_list(lambda x: to_class(Skin, x), x), from_none], x),
+         lambda x: fast_property_list(Skin, x)),
+        ("textures", "textures",
+         lambda x: from_union([lambda x: from_list(lambda x: to_class(Texture, x), x), from_none], x),
+         lambda x: fast_property_list(Texture, x)),
+    )
+    __slots__ = tuple(field[0] for field in _fields) + ('__dict__',)
+
     def __init__(self, accessors, animations, asset, buffers, buffer_views, cameras, extensions, extensions_required,
                  extensions_used, extras, images, materials, meshes, nodes, samplers, scene, scenes, skins, textures):
         self.accessors = accessors
@@ -1179,39 +1382,98 @@ class Gltf:
                     extensions_used, extras, images, materials, meshes, nodes, samplers, scene, scenes, skins, textures)
 
     def to_dict(self):
-        result = {}
-        result["accessors"] = from_union([lambda x: from_list(lambda x: to_class(Accessor, x), x), from_none],
-                                         self.accessors)
-        result["animations"] = from_union([lambda x: from_list(lambda x: to_class(Animation, x), x), from_none],
-                                          self.animations)
-        result["asset"] = to_class(Asset, self.asset)
-        result["buffers"] = from_union([lambda x: from_list(lambda x: to_class(Buffer, x), x), from_none], self.buffers)
-        result["bufferViews"] = from_union([lambda x: from_list(lambda x: to_class(BufferView, x), x), from_none],
-                                           self.buffer_views)
-        result["cameras"] = from_union([lambda x: from_list(lambda x: to_class(Camera, x), x), from_none], self.cameras)
-        result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
-                                          self.extensions)
-        result["extensionsRequired"] = from_union([lambda x: from_list(from_str, x), from_none],
-                                                  self.extensions_required)
-        result["extensionsUsed"] = from_union([lambda x: from_list(from_str, x), from_none], self.extensions_used)
-        result["extras"] = from_extra(self.extras)
-        result["images"] = from_union([lambda x: from_list(lambda x: to_class(Image, x), x), from_none], self.images)
-        result["materials"] = from_union([lambda x: from_list(lambda x: to_class(Material, x), x), from_none],
-                                         self.materials)
-        result["meshes"] = from_union([lambda x: from_list(lambda x: to_class(Mesh, x), x), from_none], self.meshes)
-        result["nodes"] = from_union([lambda x: from_list(lambda x: to_class(Node, x), x), from_none], self.nodes)
-        result["samplers"] = from_union([lambda x: from_list(lambda x: to_class(Sampler, x), x), from_none],
-                                        self.samplers)
-        result["scene"] = from_union([from_int, from_none], self.scene)
-        result["scenes"] = from_union([lambda x: from_list(lambda x: to_class(Scene, x), x), from_none], self.scenes)
-        result["skins"] = from_union([lambda x: from_list(lambda x: to_class(Skin, x), x), from_none], self.skins)
-        result["textures"] = from_union([lambda x: from_list(lambda x: to_class(Texture, x), x), from_none],
-                                        self.textures)
-        return result
-
-
-def gltf_from_dict(s):
-    return Gltf.from_dict(s)
+        return fields_to_dict(self)
+
+
+class LazyPropertyList(Sequence):
+    """
+    Read-only list of glTF properties, each created from its JSON dict on first access.
+
+    Initializers added with add_initializer are called once on each property, when it is created (or at once on
+    properties that already exist).
+    """
+
+    def __init__(self, cls, values, strict=False):
+        self.__cls = cls
+        self.__values = values
+        self.__properties = [None] * len(values)
+        self.__strict = strict
+        self.__initializers = []
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        property_ = self.__properties[index]
+        if property_ is None:
+            if self.__strict:
+                property_ = self.__cls.from_dict(self.__values[index])
+            else:
+                property_ = fields_from_dict_fast(self.__cls, self.__values[index])
+            self.__properties[index] = property_
+            for initializer in self.__initializers:
+                initializer(property_)
+        return property_
+
+    def __iter__(self):
+        for index in range(len(self.__values)):
+            yield self[index]
+
+    def add_initializer(self, initializer):
+        self.__initializers.append(initializer)
+        for property_ in self.__properties:
+            if property_ is not None:
+                initializer(property_)
+
+    def created_count(self):
+        """Number of properties created so far."""
+        return sum(1 for property_ in self.__properties if property_ is not None)
+
+
+# (attribute, JSON key, class) of the root arrays which are created lazily
+LAZY_ROOT_ARRAYS = (
+    ("accessors", "accessors", Accessor),
+    ("animations", "animations", Animation),
+    ("buffers", "buffers", Buffer),
+    ("buffer_views", "bufferViews", BufferView),
+    ("cameras", "cameras", Camera),
+    ("images", "images", Image),
+    ("materials", "materials", Material),
+    ("meshes", "meshes", Mesh),
+    ("nodes", "nodes", Node),
+    ("samplers", "samplers", Sampler),
+    ("scenes", "scenes", Scene),
+    ("skins", "skins", Skin),
+    ("textures", "textures", Texture),
+)
+
+
+def gltf_from_dict(s, strict=False, lazy=False):
+    """
+    Create a glTF from its JSON dict.
+
+    By default, the fast parser is used, which only checks the types of the fields. With strict, every field is
+    validated.
+    With lazy, the root arrays are LazyPropertyList, whose properties are only created when accessed. Note that the
+    Blender importer accesses all nodes, skins and animations before creating the scenes.
+    """
+    if not lazy:
+        if strict:
+            return Gltf.from_dict(s)
+        return fields_from_dict_fast(Gltf, s)
+
+    lazy_keys = [key for _attribute, key, _cls in LAZY_ROOT_ARRAYS]
+    root = {key: value for key, value in s.items() if key not in lazy_keys}
+    gltf = Gltf.from_dict(root) if strict else fields_from_dict_fast(Gltf, root)
+    for attribute, key, cls in LAZY_ROOT_ARRAYS:
+        values = s.get(key)
+        if values is not None:
+            assert isinstance(values, list)
+            setattr(gltf, attribute, LazyPropertyList(cls, values, strict))
+    return gltf
 
 
 def gltf_to_dict(x):
@@ -34,3 +34,31 @@ def color_linear_to_srgb(c):
         return 0.0 if c < 0.0 else c * 12.92
     else:
         return 1.055 * pow(c, 1.0 / 2.4) - 0.055
+
+def colors_srgb_to_scene_linear(colors):
+    """
+    Convert an array of colors from sRGB to scene linear color space.
+
+    Vectorized version of color_srgb_to_scene_linear.
+    """
+    import numpy as np
+    colors = np.asarray(colors, dtype=np.float32)
+    return np.where(
+        colors < 0.04045,
+        np.where(colors < 0.0, 0.0, colors * (1.0 / 12.92)),
+        np.power((np.maximum(colors, 0.04045) + 0.055) * (1.0 / 1.055), 2.4),
+    ).astype(np.float32)
+
+def colors_linear_to_srgb(colors):
+    """
+    Convert an array of colors from linear to sRGB color space.
+
+    Vectorized version of color_linear_to_srgb.
+    """
+    import numpy as np
+    colors = np.asarray(colors, dtype=np.float32)
+    return np.where(
+        colors < 0.0031308,
+        np.where(colors < 0.0, 0.0, colors * 12.92),
+        1.055 * np.power(np.maximum(colors, 0.0031308), 1.0 / 2.4) - 0.055,
+    ).astype(np.float32)
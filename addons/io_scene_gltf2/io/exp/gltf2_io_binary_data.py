@@ -33,6 +33,11 @@ class BinaryData:
 
     @classmethod
     def from_list(cls, lst: typing.List[typing.Any], gltf_component_type: gltf2_io_constants.ComponentType):
+        if hasattr(lst, 'dtype'):
+            # numpy array: convert in bulk, to little endian as required by glTF
+            import numpy as np
+            dtype = np.dtype(gltf2_io_constants.ComponentType.to_numpy_dtype(gltf_component_type))
+            return BinaryData(lst.astype(dtype.newbyteorder('<'), copy=False).tobytes())
         format_char = gltf2_io_constants.ComponentType.to_type_code(gltf_component_type)
         return BinaryData(array.array(format_char, lst).tobytes())
 
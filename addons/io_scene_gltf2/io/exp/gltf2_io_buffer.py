@@ -19,20 +19,29 @@ from io_scene_gltf2.io.exp import gltf2_io_binary_data
 
 
 class Buffer:
-    """Class representing binary data for use in a glTF file as 'buffer' property."""
+    """Class representing binary data for use in a glTF file as 'buffer' property.
+
+    Data is appended as a list of chunks, and only joined when exported, so that adding views stays linear in the
+    total size.
+    """
 
     def __init__(self, buffer_index=0):
-        self.__data = b""
+        self.__chunks = []
+        self.__byte_length = 0
+        self.__view_count = 0
         self.__buffer_index = buffer_index
 
     def add_and_get_view(self, binary_data: gltf2_io_binary_data.BinaryData) -> gltf2_io.BufferView:
         """Add binary data to the buffer. Return a glTF BufferView."""
-        offset = len(self.__data)
-        self.__data += binary_data.data
+        offset = self.__byte_length
+        self.__append(binary_data.data)
 
         # offsets should be a multiple of 4 --> therefore add padding if necessary
         padding = (4 - (binary_data.byte_length % 4)) % 4
-        self.__data += b"\x00" * padding
+        if padding > 0:
+            self.__append(b"\x00" * padding)
+
+        self.__view_count += 1
 
         buffer_view = gltf2_io.BufferView(
             buffer=self.__buffer_index,
@@ -46,15 +55,35 @@ class Buffer:
         )
         return buffer_view
 
+    def __append(self, data):
+        self.__chunks.append(data)
+        self.__byte_length += len(data)
+
     @property
     def byte_length(self):
-        return len(self.__data)
+        return self.__byte_length
+
+    @property
+    def view_count(self):
+        return self.__view_count
+
+    def chunks(self):
+        """Return the chunks of data, in order, without joining them."""
+        return list(self.__chunks)
 
     def to_bytes(self):
-        return self.__data
+        if len(self.__chunks) > 1:
+            # Keep the joined data, so that further calls do not join again
+            self.__chunks = [b"".join(self.__chunks)]
+        return self.__chunks[0] if self.__chunks else b""
+
+    def to_memoryview(self):
+        return memoryview(self.to_bytes())
 
     def to_embed_string(self):
-        return 'data:application/octet-stream;base64,' + base64.b64encode(self.__data).decode('ascii')
+        return 'data:application/octet-stream;base64,' + base64.b64encode(self.to_bytes()).decode('ascii')
 
     def clear(self):
-        self.__data = b""
+        self.__chunks = []
+        self.__byte_length = 0
+        self.__view_count = 0
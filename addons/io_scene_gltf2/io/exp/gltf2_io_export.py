@@ -16,9 +16,10 @@
 # Imports
 #
 
-import json
 import struct
 
+from io_scene_gltf2.io.exp.gltf2_io_json_writer import JSONWriter
+
 #
 # Globals
 #
@@ -26,10 +27,14 @@ import struct
 #
 # Functions
 #
-from collections import OrderedDict
 
 
 def save_gltf(gltf, export_settings, encoder, glb_buffer):
+    """
+    Write the glTF (a gltf2_io.Gltf, or a dict) and its buffer to the output file(s).
+
+    The JSON is streamed to the file as it is encoded.
+    """
     indent = None
     separators = (',', ':')
 
@@ -38,37 +43,22 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
         # The comma is typically followed by a newline, so no trailing whitespace is needed on it.
         separators = (',', ' : ')
 
-    sort_order = [
-        "asset",
-        "extensionsUsed",
-        "extensionsRequired",
-        "extensions",
-        "extras",
-        "scene",
-        "scenes",
-        "nodes",
-        "cameras",
-        "animations",
-        "materials",
-        "meshes",
-        "textures",
-        "images",
-        "skins",
-        "accessors",
-        "bufferViews",
-        "samplers",
-        "buffers"
-    ]
-    gltf_ordered = OrderedDict(sorted(gltf.items(), key=lambda item: sort_order.index(item[0])))
-    gltf_encoded = json.dumps(gltf_ordered, indent=indent, separators=separators, cls=encoder, allow_nan=False)
+    def write_json(write):
+        writer = JSONWriter(
+            write,
+            indent=indent,
+            separators=separators,
+            float_precision=export_settings['gltf_float_precision'],
+            default=encoder().default
+        )
+        writer.write_gltf(gltf)
 
     #
 
     if export_settings['gltf_format'] != 'GLB':
-        file = open(export_settings['gltf_filepath'], "w", encoding="utf8", newline="\n")
-        file.write(gltf_encoded)
-        file.write("\n")
-        file.close()
+        with open(export_settings['gltf_filepath'], "w", encoding="utf8", newline="\n") as file:
+            write_json(file.write)
+            file.write("\n")
 
         binary = export_settings['gltf_binary']
         if len(binary) > 0 and not export_settings['gltf_embed_buffers']:
@@ -77,43 +67,66 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
             file.close()
 
     else:
-        file = open(export_settings['gltf_filepath'], "wb")
+        with open(export_settings['gltf_filepath'], "wb") as file:
+            write_glb(file, write_json, glb_buffer)
 
-        gltf_data = gltf_encoded.encode()
-        binary = glb_buffer
+    return True
 
-        length_gltf = len(gltf_data)
-        spaces_gltf = (4 - (length_gltf & 3)) & 3
-        length_gltf += spaces_gltf
 
-        length_bin = len(binary)
-        zeros_bin = (4 - (length_bin & 3)) & 3
-        length_bin += zeros_bin
-
-        length = 12 + 8 + length_gltf
-        if length_bin > 0:
-            length += 8 + length_bin
-
-        # Header (Version 2)
-        file.write('glTF'.encode())
-        file.write(struct.pack("I", 2))
-        file.write(struct.pack("I", length))
-
-        # Chunk 0 (JSON)
-        file.write(struct.pack("I", length_gltf))
-        file.write('JSON'.encode())
-        file.write(gltf_data)
-        for i in range(0, spaces_gltf):
-            file.write(' '.encode())
-
-        # Chunk 1 (BIN)
-        if length_bin > 0:
-            file.write(struct.pack("I", length_bin))
-            file.write('BIN\0'.encode())
-            file.write(binary)
-            for i in range(0, zeros_bin):
-                file.write('\0'.encode())
+def write_glb(file, write_json, binary):
+    """
+    Write a GLB file to a seekable binary file.
 
-        file.close()
+    write_json is called with a function writing a piece of JSON text. binary is either bytes, or a Buffer whose
+    chunks are written one after the other. Both are streamed to the file: the lengths in the header are only
+    filled in at the end, so neither the JSON nor the binary data is ever held in memory as a whole.
+    """
+    if hasattr(binary, 'chunks'):
+        binary_chunks = binary.chunks()
+        length_bin = binary.byte_length
+    else:
+        binary_chunks = [binary]
+        length_bin = len(binary)
 
-    return True
+    # Header (Version 2) and chunk 0 header, written once the JSON length is known
+    start = file.tell()
+    file.write(b'\0' * 20)
+
+    # Chunk 0 (JSON)
+    length_gltf = 0
+
+    def write(text):
+        nonlocal length_gltf
+        data = text.encode()
+        length_gltf += len(data)
+        file.write(data)
+
+    write_json(write)
+
+    spaces_gltf = (4 - (length_gltf & 3)) & 3
+    length_gltf += spaces_gltf
+    file.write(b' ' * spaces_gltf)
+
+    # Chunk 1 (BIN)
+    zeros_bin = (4 - (length_bin & 3)) & 3
+    length_bin += zeros_bin
+
+    if length_bin > 0:
+        file.write(struct.pack("<I", length_bin))
+        file.write('BIN\0'.encode())
+        for chunk in binary_chunks:
+            file.write(chunk)
+        file.write(b'\0' * zeros_bin)
+
+    length = 12 + 8 + length_gltf
+    if length_bin > 0:
+        length += 8 + length_bin
+
+    end = file.tell()
+    file.seek(start)
+    file.write('glTF'.encode())
+    file.write(struct.pack("<I", 2))
+    file.write(struct.pack("<I", length))
+    file.write(struct.pack("<I", length_gltf))
+    file.write('JSON'.encode())
+    file.seek(end)
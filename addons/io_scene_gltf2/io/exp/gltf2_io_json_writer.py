@@ -0,0 +1,184 @@
+# Copyright 2018-2019 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import math
+
+# Order of the keys of the glTF root object
+ROOT_KEY_ORDER = [
+    "asset",
+    "extensionsUsed",
+    "extensionsRequired",
+    "extensions",
+    "extras",
+    "scene",
+    "scenes",
+    "nodes",
+    "cameras",
+    "animations",
+    "materials",
+    "meshes",
+    "textures",
+    "images",
+    "skins",
+    "accessors",
+    "bufferViews",
+    "samplers",
+    "buffers"
+]
+
+# Keys whose value is written even when it is an empty collection
+ALLOWED_EMPTY_COLLECTIONS = ["KHR_materials_unlit"]
+
+
+class JSONWriter:
+    """
+    Write a glTF as JSON, walking the gltf2_io objects directly.
+
+    None values and empty collections are skipped, and integral floats are written as integers, so that no
+    intermediate dict tree is needed. Output is passed to write in pieces, as it is produced.
+    """
+
+    FLUSH_PIECES = 4096
+
+    def __init__(self, write, indent=None, separators=(',', ':'), float_precision=None, default=None):
+        """
+        :param write: function called with each piece of JSON text
+        :param indent: number of spaces per indentation level, or None for compact output
+        :param separators: (item separator, key separator), like for json.dumps
+        :param float_precision: number of significant digits of floats, or None for the shortest exact form
+        :param default: function converting values which are not otherwise serializable, like JSONEncoder.default
+        """
+        self.__write = write
+        self.__indent = indent
+        self.__item_separator, self.__key_separator = separators
+        self.__float_precision = float_precision
+        self.__default = default
+        self.__pieces = []
+
+    def write_gltf(self, gltf):
+        """Write the glTF root object (a gltf2_io.Gltf or a dict), with its keys in glTF order."""
+        if hasattr(gltf, '_fields'):
+            items = JSONWriter.__property_items(gltf)
+        else:
+            items = list(gltf.items())
+        items.sort(key=lambda item: ROOT_KEY_ORDER.index(item[0]))
+        self.__write_items(items, 0)
+        self.flush()
+
+    def write_value(self, value):
+        self.__write_value(value, 0)
+        self.flush()
+
+    def flush(self):
+        if self.__pieces:
+            self.__write(''.join(self.__pieces))
+            self.__pieces = []
+
+    def __put(self, piece):
+        self.__pieces.append(piece)
+        if len(self.__pieces) >= JSONWriter.FLUSH_PIECES:
+            self.flush()
+
+    def __write_value(self, value, level):
+        if value is None:
+            self.__put('null')
+        elif isinstance(value, str):
+            self.__put(json.dumps(value))
+        elif isinstance(value, bool):
+            self.__put('true' if value else 'false')
+        elif isinstance(value, int):
+            self.__put(int.__repr__(value))
+        elif isinstance(value, float):
+            self.__put(self.__format_float(value))
+        elif isinstance(value, (list, tuple)):
+            self.__write_list(value, level)
+        elif isinstance(value, dict):
+            self.__write_items(value.items(), level)
+        elif hasattr(value, '_fields'):
+            self.__write_items(JSONWriter.__property_items(value), level)
+        elif hasattr(value, 'to_list'):
+            self.__write_value(value.to_list(), level)
+        elif hasattr(value, 'to_dict'):
+            self.__write_value(value.to_dict(), level)
+        elif self.__default is not None:
+            self.__write_value(self.__default(value), level)
+        else:
+            raise TypeError("Object of type {} is not JSON serializable".format(type(value).__name__))
+
+    def __format_float(self, value):
+        if not math.isfinite(value):
+            raise ValueError("Out of range float values are not JSON compliant: " + repr(value))
+        # Integral floats are written as integers (prevent INTEGER_WRITTEN_AS_FLOAT validator warnings)
+        if int(value) == value:
+            return int.__repr__(int(value))
+        if self.__float_precision is not None:
+            return format(value, '.{}g'.format(self.__float_precision))
+        return float.__repr__(value)
+
+    def __write_list(self, values, level):
+        if len(values) == 0:
+            self.__put('[]')
+            return
+
+        self.__put('[')
+        separator = self.__open(level + 1)
+        for i, value in enumerate(values):
+            if i > 0:
+                self.__put(separator)
+            self.__write_value(value, level + 1)
+        self.__close(level)
+        self.__put(']')
+
+    def __write_items(self, items, level):
+        items = [(key, value) for key, value in items if JSONWriter.__should_include(key, value)]
+        if len(items) == 0:
+            self.__put('{}')
+            return
+
+        self.__put('{')
+        separator = self.__open(level + 1)
+        for i, (key, value) in enumerate(items):
+            if i > 0:
+                self.__put(separator)
+            self.__put(json.dumps(str(key)))
+            self.__put(self.__key_separator)
+            self.__write_value(value, level + 1)
+        self.__close(level)
+        self.__put('}')
+
+    def __open(self, level):
+        """Start the content of a collection, and return the separator of its items."""
+        if self.__indent is None:
+            return self.__item_separator
+        newline_indent = '\n' + ' ' * (self.__indent * level)
+        self.__put(newline_indent)
+        return self.__item_separator + newline_indent
+
+    def __close(self, level):
+        if self.__indent is not None:
+            self.__put('\n' + ' ' * (self.__indent * level))
+
+    @staticmethod
+    def __property_items(value):
+        """(JSON key, value) of the fields of a gltf2_io property."""
+        return [(key, getattr(value, attribute)) for attribute, key, _to_json, _from_json in value._fields]
+
+    @staticmethod
+    def __should_include(key, value):
+        if value is None:
+            return False
+        if isinstance(value, (dict, list)) and len(value) == 0 and key not in ALLOWED_EMPTY_COLLECTIONS:
+            return False
+        return True
@@ -0,0 +1,97 @@
+# Copyright 2018-2019 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from collections import OrderedDict
+
+
+class AccessorCache():
+    """Cache of decoded accessor data, shared by the whole import.
+
+    Entries are evicted in least recently used order once the bytes held go
+    over max_bytes.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (data, nbytes)
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Get cached data, or None if not cached."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, data, nbytes=None):
+        """Add data to the cache, evicting old entries if needed."""
+        if nbytes is None:
+            nbytes = AccessorCache.get_size(data)
+
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[1]
+
+        if nbytes > self.max_bytes:
+            # Would evict everything else, and still not fit
+            return
+
+        self.entries[key] = (data, nbytes)
+        self.nbytes += nbytes
+
+        while self.nbytes > self.max_bytes:
+            _key, (_data, evicted_nbytes) = self.entries.popitem(last=False)
+            self.nbytes -= evicted_nbytes
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        return "%d hits, %d misses, %d evictions, %d entries, %.1f MiB held" % (
+            self.hits,
+            self.misses,
+            self.evictions,
+            len(self.entries),
+            self.nbytes / (1024 * 1024),
+        )
+
+    @staticmethod
+    def get_size(data):
+        """Estimate the memory used by decoded data (numpy array or list of tuples)."""
+        if hasattr(data, 'nbytes'):
+            return data.nbytes
+
+        if not data:
+            return sys.getsizeof(data)
+
+        # All tuples have the same length: measure the first one
+        elem = data[0]
+        elem_size = sys.getsizeof(elem) + sum(sys.getsizeof(component) for component in elem)
+        return sys.getsizeof(data) + len(data) * elem_size
@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import struct
-import base64
+import numpy as np
 
 from ..com.gltf2_io import Accessor
+from ..com.gltf2_io_constants import ComponentType, DataType
 
 
 class BinaryData():
@@ -60,61 +60,130 @@ class BinaryData():
 
     @staticmethod
     def get_data_from_accessor(gltf, accessor_idx, cache=False):
-        """Get data from accessor."""
-        if accessor_idx in gltf.accessor_cache:
-            return gltf.accessor_cache[accessor_idx]
+        """Get data from accessor, as a list of tuples.
+
+        Compatibility wrapper around decode_accessor; new code should use the
+        numpy arrays directly.
+        """
+        key = ('list', accessor_idx)
+        if cache:
+            # Only cached accessors are looked up, so that the cache statistics count their reuse
+            data = gltf.accessor_cache.get(key)
+            if data is not None:
+                return data
 
         accessor = gltf.data.accessors[accessor_idx]
         data = BinaryData.get_data_from_accessor_obj(gltf, accessor)
 
         if cache:
-            gltf.accessor_cache[accessor_idx] = data
+            gltf.accessor_cache.put(key, data)
 
         return data
 
     @staticmethod
     def get_data_from_accessor_obj(gltf, accessor):
-        if accessor.buffer_view is not None:
-            bufferView = gltf.data.buffer_views[accessor.buffer_view]
+        """Get data from accessor object, as a list of tuples."""
+        array = BinaryData.decode_accessor_obj(gltf, accessor)
+        return [tuple(elem) for elem in array.tolist()]
+
+    @staticmethod
+    def decode_accessor(gltf, accessor_idx, cache=False):
+        """Decode accessor to a 2D numpy array (count x number of components)."""
+        key = ('array', accessor_idx)
+        if cache:
+            # Only cached accessors are looked up, so that the cache statistics count their reuse
+            array = gltf.accessor_cache.get(key)
+            if array is not None:
+                return array
+
+        accessor = gltf.data.accessors[accessor_idx]
+        array = BinaryData.decode_accessor_obj(gltf, accessor)
+
+        if cache:
+            # Cached arrays are shared between callers: prevent accidental modifications
+            array.flags.writeable = False
+            gltf.accessor_cache.put(key, array)
+
+        return array
+
+    @staticmethod
+    def get_element_layout(accessor_type, component_size):
+        """Get the byte offset of each component inside one element, and the
+        default stride of the elements.
+        """
+        # Special layouts for certain formats; see the section about
+        # data alignment in the glTF 2.0 spec: each matrix column starts
+        # on a 4-byte boundary.
+        if accessor_type == 'MAT2' and component_size == 1:
+            nb_columns, column_stride = 2, 4
+        elif accessor_type == 'MAT3' and component_size == 1:
+            nb_columns, column_stride = 3, 4
+        elif accessor_type == 'MAT3' and component_size == 2:
+            nb_columns, column_stride = 3, 8
+        else:
+            component_nb = DataType.num_elements(accessor_type)
+            offsets = [i * component_size for i in range(component_nb)]
+            return offsets, component_nb * component_size
+
+        offsets = [
+            column * column_stride + row * component_size
+            for column in range(nb_columns)
+            for row in range(nb_columns)
+        ]
+        return offsets, nb_columns * column_stride
+
+    @staticmethod
+    def decode_accessor_obj(gltf, accessor):
+        """Decode accessor object to a 2D numpy array (count x number of components).
+
+        Integer components keep their glTF type, unless the accessor is normalized,
+        in which case they are converted to float32. Arrays read straight from a
+        buffer view are read-only views on the buffer.
+        """
+        dtype = np.dtype(ComponentType.to_numpy_dtype(accessor.component_type)).newbyteorder('<')
+        component_nb = DataType.num_elements(accessor.type)
+
+        if accessor.buffer_view is not None and accessor.count > 0:
+            buffer_view = gltf.data.buffer_views[accessor.buffer_view]
             buffer_data = BinaryData.get_buffer_view(gltf, accessor.buffer_view)
 
             accessor_offset = accessor.byte_offset or 0
             buffer_data = buffer_data[accessor_offset:]
 
-            fmt_char = gltf.fmt_char_dict[accessor.component_type]
-            component_nb = gltf.component_nb_dict[accessor.type]
-            fmt = '<' + (fmt_char * component_nb)
-            default_stride = struct.calcsize(fmt)
-
-            # Special layouts for certain formats; see the section about
-            # data alignment in the glTF 2.0 spec.
-            component_size = struct.calcsize('<' + fmt_char)
-            if accessor.type == 'MAT2' and component_size == 1:
-                fmt = '<FFxxFF'.replace('F', fmt_char)
-                default_stride = 8
-            elif accessor.type == 'MAT3' and component_size == 1:
-                fmt = '<FFFxFFFxFFF'.replace('F', fmt_char)
-                default_stride = 12
-            elif accessor.type == 'MAT3' and component_size == 2:
-                fmt = '<FFFxxFFFxxFFF'.replace('F', fmt_char)
-                default_stride = 24
-
-            stride = bufferView.byte_stride or default_stride
-
-            # Decode
-            unpack_from = struct.Struct(fmt).unpack_from
-            data = [
-                unpack_from(buffer_data, offset)
-                for offset in range(0, accessor.count*stride, stride)
-            ]
+            component_size = dtype.itemsize
+            offsets, default_stride = BinaryData.get_element_layout(accessor.type, component_size)
+            stride = buffer_view.byte_stride or default_stride
+            is_packed = offsets[-1] == (component_nb - 1) * component_size
+
+            if stride == default_stride and is_packed:
+                # Tightly packed: the whole accessor is one contiguous block
+                array = np.frombuffer(buffer_data, dtype=dtype, count=accessor.count * component_nb)
+                array = array.reshape(accessor.count, component_nb)
+
+            else:
+                # The data looks like
+                #   XXXppXXXppXXXppXXX
+                # where X are the components (possibly with padding between
+                # matrix columns) and p is the padding up to the stride.
+                if stride % component_size != 0:
+                    raise ValueError("Bad glTF: byteStride must be a multiple of the component size")
+                elems_per_stride = stride // component_size
+                elems_per_span = offsets[-1] // component_size + 1
+                nb_elems = (accessor.count - 1) * elems_per_stride + elems_per_span
+
+                array = np.frombuffer(buffer_data, dtype=dtype, count=nb_elems)
+                array = np.lib.stride_tricks.as_strided(
+                    array,
+                    shape=(accessor.count, elems_per_span),
+                    strides=(stride, component_size),
+                )
+                if not is_packed:
+                    # Drop matrix column padding (copies)
+                    array = array[:, [offset // component_size for offset in offsets]]
 
         else:
             # No buffer view; initialize to zeros
-            component_nb = gltf.component_nb_dict[accessor.type]
-            data = [
-                (0,) * component_nb
-                for i in range(accessor.count)
-            ]
+            array = np.zeros((accessor.count, component_nb), dtype=dtype)
 
         if accessor.sparse:
             sparse_indices_obj = Accessor.from_dict({
@@ -131,31 +200,28 @@ class BinaryData():
                 'componentType': accessor.component_type,
                 'type': accessor.type,
             })
-            sparse_indices = BinaryData.get_data_from_accessor_obj(gltf, sparse_indices_obj)
-            sparse_values = BinaryData.get_data_from_accessor_obj(gltf, sparse_values_obj)
+            sparse_indices = BinaryData.decode_accessor_obj(gltf, sparse_indices_obj)
+            sparse_values = BinaryData.decode_accessor_obj(gltf, sparse_values_obj)
 
-            # Apply sparse
-            for i in range(accessor.sparse.count):
-                data[sparse_indices[i][0]] = sparse_values[i]
+            # Apply sparse, never writing into the glTF buffers
+            if not array.flags.owndata:
+                array = array.copy()
+            array[sparse_indices[:, 0]] = sparse_values
 
         # Normalization
         if accessor.normalized:
-            for idx, tuple in enumerate(data):
-                new_tuple = ()
-                for i in tuple:
-                    if accessor.component_type == 5120:
-                        new_tuple += (max(float(i / 127.0 ), -1.0),)
-                    elif accessor.component_type == 5121:
-                        new_tuple += (float(i / 255.0),)
-                    elif accessor.component_type == 5122:
-                        new_tuple += (max(float(i / 32767.0), -1.0),)
-                    elif accessor.component_type == 5123:
-                        new_tuple += (i / 65535.0,)
-                    else:
-                        new_tuple += (float(i),)
-                data[idx] = new_tuple
-
-        return data
+            if accessor.component_type == ComponentType.Byte:
+                array = np.maximum(array / 127.0, -1.0)
+            elif accessor.component_type == ComponentType.UnsignedByte:
+                array = array / 255.0
+            elif accessor.component_type == ComponentType.Short:
+                array = np.maximum(array / 32767.0, -1.0)
+            elif accessor.component_type == ComponentType.UnsignedShort:
+                array = array / 65535.0
+
+            array = array.astype(np.float32, copy=False)
+
+        return array
 
     @staticmethod
     def get_image_data(gltf, img_idx):
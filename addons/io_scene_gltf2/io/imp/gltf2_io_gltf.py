@@ -14,10 +14,13 @@
 
 from ..com.gltf2_io import gltf_from_dict
 from ..com.gltf2_io_debug import Log
+from .gltf2_io_accessor_cache import AccessorCache
 import logging
 import json
+import mmap
 import struct
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from os.path import dirname, join, isfile, basename
 from urllib.parse import unquote
 
@@ -31,11 +34,34 @@ class glTFImporter():
         self.import_settings = import_settings
         self.glb_buffer = None
         self.buffers = {}
-        self.accessor_cache = {}
+        self.mappings = []
+        self.joint_index = None  # node index -> (skin index, index in skin joints)
+        self.prefetched_uris = {}  # uri -> (data, file name), read ahead by prefetch
 
         if 'loglevel' not in self.import_settings.keys():
             self.import_settings['loglevel'] = logging.ERROR
 
+        if 'import_mmap' not in self.import_settings.keys():
+            self.import_settings['import_mmap'] = False
+
+        # Validate the types of all glTF properties while parsing (slower)
+        if 'import_strict_parsing' not in self.import_settings.keys():
+            self.import_settings['import_strict_parsing'] = False
+
+        # Create the glTF properties of root arrays only when they are first used
+        if 'import_lazy_document' not in self.import_settings.keys():
+            self.import_settings['import_lazy_document'] = False
+
+        # Number of threads reading buffers and images ahead of their use (0 to disable)
+        if 'import_prefetch_threads' not in self.import_settings.keys():
+            self.import_settings['import_prefetch_threads'] = 4
+
+        # Memory budget (in MiB) of decoded accessors kept for reuse
+        if 'import_accessor_cache_size' not in self.import_settings.keys():
+            self.import_settings['import_accessor_cache_size'] = 512
+
+        self.accessor_cache = AccessorCache(self.import_settings['import_accessor_cache_size'] * 1024 * 1024)
+
         log = Log(import_settings['loglevel'])
         self.log = log.logger
         self.log_handler = log.hdlr
@@ -122,7 +148,7 @@ class glTFImporter():
         try:
             json_str = str(json_bytes, encoding='utf-8')
             json_ = json.loads(json_str, parse_constant=glTFImporter.bad_json_value)
-            self.data = gltf_from_dict(json_)
+            self.data = self.parse_json(json_)
         except ValueError as e:
             return False, e.args[0]
 
@@ -136,6 +162,14 @@ class glTFImporter():
 
         return True, None
 
+    def parse_json(self, json_):
+        """Create the glTF properties from the JSON dict, as set by the import settings."""
+        return gltf_from_dict(
+            json_,
+            strict=self.import_settings['import_strict_parsing'],
+            lazy=self.import_settings['import_lazy_document'],
+        )
+
     def load_chunk(self, offset):
         """Load chunk."""
         chunk_header = struct.unpack_from('<I4s', self.content, offset)
@@ -152,8 +186,7 @@ class glTFImporter():
             return False, "Please select a file"
 
         # Check if file is gltf or glb
-        with open(self.filename, 'rb') as f:
-            self.content = memoryview(f.read())
+        self.content = self.read_file(self.filename)
 
         self.is_glb_format = self.content[:4] == b'glTF'
 
@@ -162,7 +195,8 @@ class glTFImporter():
             content = str(self.content, encoding='utf-8')
             self.content = None
             try:
-                self.data = gltf_from_dict(json.loads(content, parse_constant=glTFImporter.bad_json_value))
+                json_ = json.loads(content, parse_constant=glTFImporter.bad_json_value)
+                self.data = self.parse_json(json_)
                 return True, None
             except ValueError as e:
                 return False, e.args[0]
@@ -174,16 +208,67 @@ class glTFImporter():
             self.content = None
             return success, txt
 
-    def is_node_joint(self, node_idx):
-        """Check if node is a joint."""
+    def read_file(self, path):
+        """Read a whole file, as a memoryview.
+        When import_mmap is set, the file is memory-mapped instead, so that
+        slices of it (chunks, buffer views, accessors) are zero-copy and only the
+        pages actually used are read from disk.
+        """
+        with open(path, 'rb') as f:
+            if self.import_settings['import_mmap']:
+                try:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty file, or file system without mmap support
+                    mapping = None
+
+                if mapping is not None:
+                    self.mappings.append(mapping)
+                    return memoryview(mapping)
+
+            return memoryview(f.read())
+
+    def close(self):
+        """Release buffers, caches and file mappings once import is done."""
+        self.content = None
+        self.glb_buffer = None
+        self.buffers = {}
+        self.prefetched_uris = {}
+        self.log.info("Accessor cache: " + self.accessor_cache.stats())
+        self.accessor_cache.clear()
+
+        for mapping in self.mappings:
+            try:
+                mapping.close()
+            except BufferError:
+                # Still referenced somewhere (eg. by a numpy array): it will be
+                # unmapped when garbage collected.
+                pass
+        self.mappings = []
+
+    def compute_joint_index(self):
+        """
+        Map each joint node to (skin index, index in the joints of this skin).
+
+        When a node is a joint of several skins, the first skin is used.
+        """
+        self.joint_index = {}
         if not self.data.skins:  # if no skin in gltf file
-            return False, None
+            return
 
         for skin_idx, skin in enumerate(self.data.skins):
-            if node_idx in skin.joints:
-                return True, skin_idx
+            for joint_idx, node_idx in enumerate(skin.joints):
+                self.joint_index.setdefault(node_idx, (skin_idx, joint_idx))
+
+    def is_node_joint(self, node_idx):
+        """Check if node is a joint."""
+        if self.joint_index is None:
+            self.compute_joint_index()
 
-        return False, None
+        if node_idx not in self.joint_index:
+            return False, None
+
+        return True, self.joint_index[node_idx][0]
 
     def load_buffer(self, buffer_idx):
         """Load buffer."""
@@ -199,10 +284,53 @@ class glTFImporter():
             if buffer_idx == 0 and self.glb_buffer is not None:
                 self.buffers[buffer_idx] = self.glb_buffer
 
+    def prefetch(self):
+        """Read all buffers and images referenced by URI, on a pool of threads.
+
+        Files are read (or mapped) and data URIs are decoded ahead of their use,
+        so that load_uri then finds them already in memory. Image files are only
+        read when images are packed: otherwise Blender loads them itself.
+        """
+        threads = self.import_settings['import_prefetch_threads']
+        if threads <= 0:
+            return
+
+        uris = []
+        for buffer in self.data.buffers or []:
+            if buffer.uri:
+                uris.append(buffer.uri)
+        for image in self.data.images or []:
+            if not image.uri:
+                continue
+            if image.uri.startswith('data:') or self.import_settings.get('import_pack_images', True):
+                uris.append(image.uri)
+
+        uris = list(dict.fromkeys(uris))  # unique, in order
+        if not uris:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(threads, len(uris))) as executor:
+            results = list(executor.map(self.read_uri, uris))
+
+        for uri, result in zip(uris, results):
+            if result[0] is not None:
+                self.prefetched_uris[uri] = result
+
+        self.log.info("Prefetched " + str(len(self.prefetched_uris)) + " of " + str(len(uris)) + " URIs")
+
     def load_uri(self, uri):
         """Loads a URI.
         Returns the data and the filename of the resource, if there is one.
         """
+        # Data read by prefetch is only used once: buffers are then kept in self.buffers
+        prefetched = self.prefetched_uris.pop(uri, None)
+        if prefetched is not None:
+            return prefetched
+
+        return self.read_uri(uri)
+
+    def read_uri(self, uri):
+        """Read the data of a URI (file or data URI), and the filename of the resource, if there is one."""
         sep = ';base64,'
         if uri.startswith('data:'):
             idx = uri.find(sep)
@@ -212,8 +340,7 @@ class glTFImporter():
 
         path = join(dirname(self.filename), unquote(uri))
         try:
-            with open(path, 'rb') as f_:
-                return memoryview(f_.read()), basename(path)
+            return self.read_file(path), basename(path)
         except Exception:
             self.log.error("Couldn't read file: " + path)
             return None, None
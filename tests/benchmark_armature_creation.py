@@ -0,0 +1,123 @@
+# Copyright 2018-2019 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Time the import of glTF rigs of increasing bone count, with the bones of each skin created in a single edit mode
+# session by BlenderSkin.create_bones, and with mode switches for each bone, as the importer used to do.
+#
+# Usage: blender -b --addons io_scene_gltf2 --python benchmark_armature_creation.py -- [bone count]...
+
+import base64
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+
+import bpy
+
+from io_scene_gltf2.blender.imp.gltf2_blender_skin import BlenderSkin
+
+BRANCHES = 3  # children of each bone
+
+queue_bone = BlenderSkin.create_bone  # current path: queue the bone, create_bones creates it later
+
+
+def make_document(bone_count):
+    """Build a glTF with a single skin, whose joints form a tree of bone_count nodes."""
+    depths = []
+    nodes = []
+    for node_idx in range(bone_count):
+        parent = (node_idx - 1) // BRANCHES if node_idx > 0 else None
+        depths.append(depths[parent] + 1 if parent is not None else 0)
+        nodes.append({'name': 'Bone %d' % node_idx, 'translation': [0.0, 1.0 if parent is not None else 0.0, 0.0]})
+        if parent is not None:
+            nodes[parent].setdefault('children', []).append(node_idx)
+
+    # Column major inverse bind matrices: each joint is translated by its depth along Y
+    data = b''.join(
+        struct.pack('<16f', 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -depth, 0.0, 1.0)
+        for depth in depths
+    )
+
+    return {
+        'asset': {'version': '2.0', 'generator': 'benchmark_armature_creation'},
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': nodes,
+        'skins': [{'joints': list(range(bone_count)), 'inverseBindMatrices': 0}],
+        'accessors': [{'bufferView': 0, 'componentType': 5126, 'count': bone_count, 'type': 'MAT4'}],
+        'bufferViews': [{'buffer': 0, 'byteLength': len(data)}],
+        'buffers': [{
+            'byteLength': len(data),
+            'uri': 'data:application/octet-stream;base64,' + base64.b64encode(data).decode('ascii'),
+        }],
+    }
+
+
+def create_bone_immediately(gltf, skin_id, node_id, parent):
+    """Old path: create each bone as soon as its node is reached, switching modes for every bone."""
+    queue_bone(gltf, skin_id, node_id, parent)
+    BlenderSkin.create_bones(gltf, skin_id)
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for armature in list(bpy.data.armatures):
+        bpy.data.armatures.remove(armature)
+
+
+def timed_import(path, bone_count, create_bone):
+    clear_scene()
+    BlenderSkin.create_bone = staticmethod(create_bone)
+    try:
+        start = time.perf_counter()
+        bpy.ops.import_scene.gltf(filepath=path)
+        elapsed = time.perf_counter() - start
+    finally:
+        BlenderSkin.create_bone = staticmethod(queue_bone)
+
+    if len(bpy.data.armatures) != 1 or len(bpy.data.armatures[0].bones) != bone_count:
+        raise RuntimeError("Expected an armature of %d bones after import" % bone_count)
+    return elapsed
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    counts = [int(arg) for arg in argv] or [50, 100, 200, 400, 800]
+
+    directory = tempfile.mkdtemp()
+    try:
+        print("bones  per-bone switches  single session")
+        for count in counts:
+            path = os.path.join(directory, 'rig_%d.gltf' % count)
+            with open(path, 'w') as f:
+                json.dump(make_document(count), f)
+
+            per_bone_time = timed_import(path, count, create_bone_immediately)
+            single_time = timed_import(path, count, queue_bone)
+            print("%5d  %15.3f s  %12.3f s (%.1fx)" % (count, per_bone_time, single_time, per_bone_time / single_time))
+    finally:
+        shutil.rmtree(directory)
+        clear_scene()
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,108 @@
+# Copyright 2018-2019 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compare the strict and the fast parsing of glTF JSON on a large synthetic document.
+#
+# Usage: blender -b --addons io_scene_gltf2 --python benchmark_gltf_parsing.py -- [node count] [repeat count]
+
+import json
+import sys
+import time
+
+from io_scene_gltf2.io.com.gltf2_io import gltf_from_dict
+
+
+def make_document(count):
+    """Build a glTF with count nodes, each with its own mesh, material and accessors."""
+    document = {
+        'asset': {'version': '2.0', 'generator': 'benchmark_gltf_parsing'},
+        'scene': 0,
+        'scenes': [{'nodes': list(range(count))}],
+        'nodes': [],
+        'meshes': [],
+        'materials': [],
+        'accessors': [],
+        'bufferViews': [{'buffer': 0, 'byteLength': 24 * 36 + 2 * 36}],
+        'buffers': [{'byteLength': 24 * 36 + 2 * 36}],
+    }
+    for i in range(count):
+        document['nodes'].append({
+            'name': 'Node %d' % i,
+            'mesh': i,
+            'translation': [float(i), 0.5, -1.25],
+            'rotation': [0.0, 0.0, 0.0, 1.0],
+            'scale': [1.0, 1.0, 1.0],
+            'extras': {'index': i},
+        })
+        document['materials'].append({
+            'name': 'Material %d' % i,
+            'pbrMetallicRoughness': {
+                'baseColorFactor': [0.8, 0.2, 0.1, 1.0],
+                'metallicFactor': 0.25,
+                'roughnessFactor': 0.75,
+            },
+            'emissiveFactor': [0.0, 0.0, 0.0],
+            'doubleSided': True,
+        })
+        first = len(document['accessors'])
+        document['accessors'].extend([
+            {'bufferView': 0, 'componentType': 5126, 'count': 36, 'type': 'VEC3',
+             'min': [-1.0, -1.0, -1.0], 'max': [1.0, 1.0, 1.0]},
+            {'bufferView': 0, 'byteOffset': 432, 'componentType': 5126, 'count': 36, 'type': 'VEC3'},
+            {'bufferView': 0, 'byteOffset': 864, 'componentType': 5123, 'count': 36, 'type': 'SCALAR'},
+        ])
+        document['meshes'].append({
+            'name': 'Mesh %d' % i,
+            'primitives': [{
+                'attributes': {'POSITION': first, 'NORMAL': first + 1},
+                'indices': first + 2,
+                'material': i,
+                'mode': 4,
+            }],
+        })
+    return document
+
+
+def benchmark(document, strict, repeat):
+    best = None
+    for _ in range(repeat):
+        # Fresh dicts each time, like an import gets from json.loads
+        json_ = json.loads(json.dumps(document))
+        start = time.perf_counter()
+        gltf_from_dict(json_, strict=strict)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    count = int(argv[0]) if len(argv) > 0 else 20000
+    repeat = int(argv[1]) if len(argv) > 1 else 3
+
+    document = make_document(count)
+    strict_time = benchmark(document, True, repeat)
+    fast_time = benchmark(document, False, repeat)
+
+    print("%d nodes, %d accessors, best of %d" % (count, len(document['accessors']), repeat))
+    print("strict parsing: %.3f s" % strict_time)
+    print("fast parsing:   %.3f s (%.1fx)" % (fast_time, strict_time / fast_time))
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,93 @@
+# Copyright 2018-2019 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compare the joint lookup of the importer with a scan of all skins, on a synthetic scene with many skins.
+#
+# Usage: blender -b --addons io_scene_gltf2 --python benchmark_skin_index.py -- [skin count] [joints per skin]
+
+import sys
+import time
+
+from io_scene_gltf2.io.com.gltf2_io import gltf_from_dict
+from io_scene_gltf2.io.imp.gltf2_io_gltf import glTFImporter
+
+
+def make_document(skin_count, joint_count):
+    """Build a glTF with skin_count characters, each made of a skinned mesh node and a chain of joint_count joints."""
+    document = {
+        'asset': {'version': '2.0', 'generator': 'benchmark_skin_index'},
+        'nodes': [],
+        'skins': [],
+    }
+    nodes = document['nodes']
+    for skin_idx in range(skin_count):
+        nodes.append({'name': 'Character %d' % skin_idx, 'mesh': 0, 'skin': skin_idx})
+        first = len(nodes)
+        for joint_idx in range(joint_count):
+            joint = {'name': 'Joint %d.%d' % (skin_idx, joint_idx), 'translation': [0.0, 1.0, 0.0]}
+            if joint_idx + 1 < joint_count:
+                joint['children'] = [first + joint_idx + 1]
+            nodes.append(joint)
+        document['skins'].append({'joints': list(range(first, first + joint_count))})
+    return document
+
+
+def scan_skins(gltf, node_idx):
+    """Joint lookup by scanning the joints of every skin."""
+    for skin_idx, skin in enumerate(gltf.data.skins):
+        if node_idx in skin.joints:
+            return True, skin_idx, skin.joints.index(node_idx)
+    return False, None, None
+
+
+def use_index(gltf, node_idx):
+    """Joint lookup through the joint index of the importer."""
+    joint = gltf.joint_index.get(node_idx)
+    if joint is None:
+        return False, None, None
+    return True, joint[0], joint[1]
+
+
+try:
+    argv = sys.argv
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]  # get all args after "--"
+    else:
+        argv = []
+
+    skin_count = int(argv[0]) if len(argv) > 0 else 100
+    joint_count = int(argv[1]) if len(argv) > 1 else 100
+
+    gltf = glTFImporter('', {})
+    gltf.data = gltf_from_dict(make_document(skin_count, joint_count))
+    node_count = len(gltf.data.nodes)
+
+    start = time.perf_counter()
+    scanned = [scan_skins(gltf, node_idx) for node_idx in range(node_count)]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gltf.compute_joint_index()
+    indexed = [use_index(gltf, node_idx) for node_idx in range(node_count)]
+    index_time = time.perf_counter() - start
+
+    if scanned != indexed:
+        raise RuntimeError("Joint index does not match the scan of skins")
+
+    print("%d nodes, %d skins of %d joints" % (node_count, skin_count, joint_count))
+    print("scan of skins: %.3f s" % scan_time)
+    print("joint index:   %.3f s (%.1fx)" % (index_time, scan_time / index_time))
+except Exception as err:
+    print(err, file=sys.stderr)
+    sys.exit(1)